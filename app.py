@@ -7,6 +7,20 @@ from datetime import datetime
 from pathlib import Path
 import yfinance as yf
 
+import buzz_build
+import circuit_breaker
+import downsample
+import fetch_pool
+import history_matrix
+import history_store
+import holdings_table
+import price_cache
+import rate_limiter
+import single_flight
+import timeframes
+import tv_chart
+import yahoo_client
+
 # Helper setters (no rerun inside callbacks)
 def set_ticker_state(ticker_symbol: str):
     st.session_state.selected_ticker = ticker_symbol
@@ -520,59 +534,6 @@ st.markdown(
         text-align: right;
     }
 
-    /* Holdings Table - Header */
-    .holdings-header {
-        font-size: 0.75rem;
-        font-weight: 600;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        padding: 8px 0;
-    }
-    .holdings-header.text-right {
-        text-align: right;
-    }
-
-    /* Holdings Table - Header Divider */
-    .holdings-divider {
-        border: none;
-        border-top: 1px solid #2d3748;
-        margin: 0 0 8px 0;
-    }
-
-    /* Holdings Table - Row Divider */
-    .holdings-row-divider {
-        border: none;
-        border-top: 1px solid #1e293b;
-        margin: 0;
-    }
-
-    /* Just Visited Label */
-    .just-visited {
-        font-size: 0.65rem;
-        color: #10b981;
-        background: rgba(16, 185, 129, 0.1);
-        padding: 2px 6px;
-        border-radius: 4px;
-        margin-left: 8px;
-        font-weight: 500;
-    }
-
-    /* Holdings Table - Data Cell */
-    .holdings-cell {
-        font-size: 0.85rem;
-        color: #e2e8f0;
-        padding: 10px 0;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-    .holdings-cell.text-right {
-        text-align: right;
-        font-family: 'SF Mono', 'Consolas', 'Monaco', monospace;
-        font-variant-numeric: tabular-nums;
-    }
-
     /* Footer caption - Dark Theme */
     .dark-card .stCaption {
         color: #64748b !important;
@@ -1753,6 +1714,40 @@ def _get_file_mtime(path: Path) -> float:
     except:
         return 0.0
 
+
+def _get_history_path() -> Path:
+    """Path to BuzzIndex_historical.csv in the data directory"""
+    return _get_data_dir() / history_store.HISTORY_FILENAME
+
+
+def load_history_frame() -> pd.DataFrame:
+    """Normalized BUZZ Index history from the shared history store (parsed once per file change)."""
+    return history_store.load_history(_get_history_path())
+
+
+def load_build_artifact(name: str) -> pd.DataFrame | None:
+    """Finished artifact from buzz_build.py, or None if missing/stale (callers then compute in-process)."""
+    return buzz_build.load_artifact(_get_data_dir(), name)
+
+
+def load_ticker_summary(ticker: str) -> dict | None:
+    """Precomputed first/last appearance, tenure and weight range for a ticker (dict lookup)."""
+    summaries = buzz_build.load_ticker_summaries(_get_data_dir())
+    if summaries is not None:
+        return summaries.get(ticker)
+    return history_store.get_ticker_summary(_get_history_path(), ticker)
+
+
+def load_ticker_rows(ticker: str) -> pd.DataFrame:
+    """History rows for a ticker, sorted by date, sliced from the per-ticker index."""
+    return history_store.get_ticker_rows(_get_history_path(), ticker)
+
+
+def load_history_matrix() -> history_matrix.HistoryMatrix:
+    """Dense date x ticker weight/score/rank planes built from the history store."""
+    return history_matrix.load_history_matrix(_get_history_path())
+
+
 @st.cache_data
 def load_buzz_data(csv_path: str | None = None, _file_mtime: float = 0.0) -> pd.DataFrame:
     # Pick file: explicit override or current_holdings.csv from data/
@@ -1848,21 +1843,13 @@ def load_latest_holdings_from_historical():
     TOTAL_FUND_VALUE = 100_000_000  # $100M default
 
     try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        hist_df = pd.read_csv(csv_path)
-
-        # Normalize ticker names (FB -> META)
-        hist_df['Ticker'] = hist_df['Ticker'].replace({'FB': 'META'})
-
-        # Parse dates (DD/MM/YYYY format)
-        hist_df['Rebalance_date'] = pd.to_datetime(hist_df['Rebalance_date'], format='%d/%m/%Y')
+        hist_df = load_history_frame()
 
         # Get most recent rebalance date
         latest_date = hist_df['Rebalance_date'].max()
         latest_df = hist_df[hist_df['Rebalance_date'] == latest_date].copy()
+        latest_df['Ticker'] = latest_df['Ticker'].astype(str)
 
-        # Parse Weight as float
-        latest_df['Weight'] = pd.to_numeric(latest_df['Weight'], errors='coerce')
         latest_df = latest_df[latest_df['Weight'].notna() & (latest_df['Weight'] > 0)]
 
         # Calculate Market Value
@@ -1959,12 +1946,25 @@ SECTOR_MAP = {
 }
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes for fresher data
 def get_daily_changes_batch(tickers: tuple[str, ...]) -> dict[str, float]:
-    """Fetch daily % change for multiple tickers using batch download."""
-    changes = {t: 0.0 for t in tickers}  # Default all to 0
+    """
+    Daily % change for multiple tickers. Cached stale-while-revalidate (5 minutes while
+    the market is open): after the first load an expired result is shown immediately and
+    refreshed in the background, so no rerun waits on the batch download.
+    """
     try:
-        # Use 1-minute interval for last 2 days to get current price vs previous close
+        return price_cache.get_or_refresh("daily_changes", tuple(tickers), lambda: _download_daily_changes(tickers))
+    except Exception:
+        # Rate limited or other error - return zeros (the next rerun tries again)
+        st.warning("Price data temporarily unavailable. Showing cached or default values.")
+        return {t: 0.0 for t in tickers}
+
+
+def _download_daily_changes(tickers: tuple[str, ...]) -> dict[str, float]:
+    """Fetch daily % change for multiple tickers using batch download. Raises if the download fails."""
+    changes = {t: 0.0 for t in tickers}  # Default all to 0
+    # Use 1-minute interval for last 2 days to get current price vs previous close
+    def download():
         data = yf.download(
             list(tickers),
             period="2d",
@@ -1974,55 +1974,96 @@ def get_daily_changes_batch(tickers: tuple[str, ...]) -> dict[str, float]:
             group_by="ticker",
             prepost=False
         )
+        # yf.download reports failures as an empty frame; raise inside the breaker so they count
+        if data is None or data.empty:
+            raise ValueError("No price data returned")
+        return data
 
-        for ticker in tickers:
-            try:
-                if len(tickers) == 1:
-                    hist = data["Close"]
+    data = circuit_breaker.call("yahoo:v8", download)
+
+    for ticker in tickers:
+        try:
+            if len(tickers) == 1:
+                hist = data["Close"]
+            else:
+                hist = data[ticker]["Close"]
+
+            hist = hist.dropna()
+            if len(hist) >= 2:
+                # Get current price (last data point)
+                curr = hist.iloc[-1]
+                # Get previous day's close (first data point of today or last of yesterday)
+                # Find where today starts
+                today = hist.index[-1].date()
+                yesterday_data = hist[hist.index.date < today]
+                if len(yesterday_data) > 0:
+                    prev = yesterday_data.iloc[-1]  # Previous day's close
                 else:
-                    hist = data[ticker]["Close"]
-
-                hist = hist.dropna()
-                if len(hist) >= 2:
-                    # Get current price (last data point)
-                    curr = hist.iloc[-1]
-                    # Get previous day's close (first data point of today or last of yesterday)
-                    # Find where today starts
-                    today = hist.index[-1].date()
-                    yesterday_data = hist[hist.index.date < today]
-                    if len(yesterday_data) > 0:
-                        prev = yesterday_data.iloc[-1]  # Previous day's close
-                    else:
-                        prev = hist.iloc[0]  # Fallback to earliest available
-                    changes[ticker] = ((curr - prev) / prev * 100) if prev else 0
-            except Exception:
-                pass  # Keep default 0
-    except Exception:
-        # Rate limited or other error - return zeros (cached data will be used next time)
-        st.warning("Price data temporarily unavailable. Showing cached or default values.")
+                    prev = hist.iloc[0]  # Fallback to earliest available
+                changes[ticker] = ((curr - prev) / prev * 100) if prev else 0
+        except Exception:
+            pass  # Keep default 0
     return changes
 
 
 def _get_yahoo_headers(ticker: str) -> dict:
-    """Common headers for Yahoo Finance API calls."""
+    """Per-request headers for Yahoo Finance API calls (UA/Accept/compression come from yahoo_client's session)."""
     return {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
         'Referer': f'https://finance.yahoo.com/quote/{ticker}',
     }
 
 
+# Live fields and key metrics are read from yahoo_client's batched v7 quotes first
+# (kept current by yahoo_client.refresh_quotes on every rerun), so per-ticker requests are fallbacks only.
+MARKET_QUOTE_SYMBOLS = ("BUZZ", "^GSPC", "^NDX")
+
+
+def _live_data_from_quote(q: dict) -> dict:
+    """Live fields from a v7 quote result."""
+    info = {
+        "marketCap": q.get("marketCap"),
+        "regularMarketPrice": q.get("regularMarketPrice"),
+        "shortName": q.get("shortName"),
+        "longName": q.get("longName"),
+        "fiftyTwoWeekLow": q.get("fiftyTwoWeekLow"),
+        "fiftyTwoWeekHigh": q.get("fiftyTwoWeekHigh"),
+        "volume": q.get("regularMarketVolume"),
+        "averageVolume": q.get("averageDailyVolume3Month"),
+        # Daily OHLC for Today stats
+        "regularMarketOpen": q.get("regularMarketOpen"),
+        "regularMarketDayHigh": q.get("regularMarketDayHigh"),
+        "regularMarketDayLow": q.get("regularMarketDayLow"),
+        "regularMarketPreviousClose": q.get("regularMarketPreviousClose"),
+    }
+    return {k: v for k, v in info.items() if v is not None}
+
+
+def _key_metrics_from_quote(q: dict) -> dict:
+    """Key metrics available in a v7 quote result (no P/S; beta only when Yahoo includes it)."""
+    info = {
+        "beta": q.get("beta"),
+        "trailingPE": q.get("trailingPE"),
+        "forwardPE": q.get("forwardPE"),
+        "priceToBook": q.get("priceToBook"),
+        "trailingEps": q.get("epsTrailingTwelveMonths"),
+        "dividendYield": q.get("dividendYield"),
+    }
+    return {k: v for k, v in info.items() if v is not None}
+
+
 @st.cache_data(ttl=21600)  # Cache for 6 hours - slow-changing fundamental metrics
+@single_flight.coalesced
 def get_ticker_key_metrics_cached(ticker: str) -> dict:
-    """Fetch slow-changing key metrics (Beta, P/E, P/S, P/B, EPS, Div Yield)."""
-    import requests
+    """
+    Fetch slow-changing key metrics (Beta, P/E, P/S, P/B, EPS, Div Yield) per ticker.
+    Only reached for symbols without a batched quote (see get_ticker_key_metrics).
+    """
     headers = _get_yahoo_headers(ticker)
 
     # Try v10 API first for detailed fundamental data
     try:
         url_v10 = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{ticker}?modules=defaultKeyStatistics,summaryDetail"
-        resp = requests.get(url_v10, headers=headers, timeout=10)
+        resp = yahoo_client.get(url_v10, headers=headers)
         if resp.status_code == 200:
             data = resp.json()
             result = data.get("quoteSummary", {}).get("result", [])
@@ -2048,30 +2089,20 @@ def get_ticker_key_metrics_cached(ticker: str) -> dict:
     # Fallback to v7 API
     try:
         url_v7 = f"https://query2.finance.yahoo.com/v7/finance/quote?symbols={ticker}"
-        resp = requests.get(url_v7, headers=headers, timeout=10)
+        resp = yahoo_client.get(url_v7, headers=headers)
         if resp.status_code == 200:
-            data = resp.json()
-            quotes = data.get("quoteResponse", {}).get("result", [])
+            quotes = resp.json().get("quoteResponse", {}).get("result", [])
             if quotes:
-                q = quotes[0]
-                info = {
-                    "beta": q.get("beta"),
-                    "trailingPE": q.get("trailingPE"),
-                    "forwardPE": q.get("forwardPE"),
-                    "priceToBook": q.get("priceToBook"),
-                    "trailingEps": q.get("epsTrailingTwelveMonths"),
-                    "dividendYield": q.get("dividendYield"),
-                }
-                info = {k: v for k, v in info.items() if v is not None}
+                info = _key_metrics_from_quote(quotes[0])
                 if info:
                     return info
     except Exception:
         pass
 
-    # Fallback to yfinance
+    # Fallback to yfinance (.info is served by quoteSummary, so it shares the v10 breaker)
     try:
         ticker_obj = yf.Ticker(ticker)
-        yf_info = ticker_obj.info
+        yf_info = circuit_breaker.call("yahoo:v10", lambda: ticker_obj.info)
         if yf_info:
             info = {
                 "beta": yf_info.get("beta"),
@@ -2088,49 +2119,55 @@ def get_ticker_key_metrics_cached(ticker: str) -> dict:
     except Exception:
         pass
 
-    return {}
+    # Raise so an empty result isn't cached for 6 hours (get_ticker_key_metrics negative-caches it briefly)
+    raise ValueError("No key metrics available")
+
+
+def _read_fast_info(ticker_obj) -> dict:
+    """Live fields from yfinance fast_info. fast_info is lazy: the reads below are what hit the network."""
+    fast = ticker_obj.fast_info
+    info = {
+        "marketCap": getattr(fast, 'market_cap', None),
+        "regularMarketPrice": getattr(fast, 'last_price', None),
+        "fiftyTwoWeekLow": getattr(fast, 'year_low', None),
+        "fiftyTwoWeekHigh": getattr(fast, 'year_high', None),
+        "volume": getattr(fast, 'last_volume', None),
+        "averageVolume": getattr(fast, 'three_month_average_volume', None),
+        # Daily OHLC for Today stats
+        "regularMarketOpen": getattr(fast, 'open', None),
+        "regularMarketDayHigh": getattr(fast, 'day_high', None),
+        "regularMarketDayLow": getattr(fast, 'day_low', None),
+        "regularMarketPreviousClose": getattr(fast, 'previous_close', None),
+    }
+    return {k: v for k, v in info.items() if v is not None}
 
 
 @st.cache_data(ttl=600)  # Cache for 10 minutes - live/frequently changing data
+@single_flight.coalesced
 def get_ticker_live_data_cached(ticker: str) -> dict:
     """Fetch live data (Market Cap, Price, Volume, Avg Volume, 52-week range, name)."""
-    import requests
     headers = _get_yahoo_headers(ticker)
 
-    # Try v7 API first for live quote data
+    # Try v7 API first for live quote data (batched quote if prefetched)
     try:
-        url_v7 = f"https://query2.finance.yahoo.com/v7/finance/quote?symbols={ticker}"
-        resp = requests.get(url_v7, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            quotes = data.get("quoteResponse", {}).get("result", [])
-            if quotes:
-                q = quotes[0]
-                info = {
-                    "marketCap": q.get("marketCap"),
-                    "regularMarketPrice": q.get("regularMarketPrice"),
-                    "shortName": q.get("shortName"),
-                    "longName": q.get("longName"),
-                    "fiftyTwoWeekLow": q.get("fiftyTwoWeekLow"),
-                    "fiftyTwoWeekHigh": q.get("fiftyTwoWeekHigh"),
-                    "volume": q.get("regularMarketVolume"),
-                    "averageVolume": q.get("averageDailyVolume3Month"),
-                    # Daily OHLC for Today stats
-                    "regularMarketOpen": q.get("regularMarketOpen"),
-                    "regularMarketDayHigh": q.get("regularMarketDayHigh"),
-                    "regularMarketDayLow": q.get("regularMarketDayLow"),
-                    "regularMarketPreviousClose": q.get("regularMarketPreviousClose"),
-                }
-                info = {k: v for k, v in info.items() if v is not None}
-                if info and ("regularMarketPrice" in info or "marketCap" in info):
-                    return info
+        q = yahoo_client.get_batched_quote(ticker)
+        if q is None:
+            url_v7 = f"https://query2.finance.yahoo.com/v7/finance/quote?symbols={ticker}"
+            resp = yahoo_client.get(url_v7, headers=headers)
+            if resp.status_code == 200:
+                quotes = resp.json().get("quoteResponse", {}).get("result", [])
+                q = quotes[0] if quotes else None
+        if q:
+            info = _live_data_from_quote(q)
+            if info and ("regularMarketPrice" in info or "marketCap" in info):
+                return info
     except Exception:
         pass
 
     # Fallback to v10 API
     try:
         url_v10 = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{ticker}?modules=price,summaryDetail"
-        resp = requests.get(url_v10, headers=headers, timeout=10)
+        resp = yahoo_client.get(url_v10, headers=headers)
         if resp.status_code == 200:
             data = resp.json()
             result = data.get("quoteSummary", {}).get("result", [])
@@ -2161,33 +2198,16 @@ def get_ticker_live_data_cached(ticker: str) -> dict:
 
     # Fallback to yfinance fast_info
     try:
-        ticker_obj = yf.Ticker(ticker)
-        if hasattr(ticker_obj, 'fast_info'):
-            fast = ticker_obj.fast_info
-            if fast:
-                info = {
-                    "marketCap": getattr(fast, 'market_cap', None),
-                    "regularMarketPrice": getattr(fast, 'last_price', None),
-                    "fiftyTwoWeekLow": getattr(fast, 'year_low', None),
-                    "fiftyTwoWeekHigh": getattr(fast, 'year_high', None),
-                    "volume": getattr(fast, 'last_volume', None),
-                    "averageVolume": getattr(fast, 'three_month_average_volume', None),
-                    # Daily OHLC for Today stats
-                    "regularMarketOpen": getattr(fast, 'open', None),
-                    "regularMarketDayHigh": getattr(fast, 'day_high', None),
-                    "regularMarketDayLow": getattr(fast, 'day_low', None),
-                    "regularMarketPreviousClose": getattr(fast, 'previous_close', None),
-                }
-                info = {k: v for k, v in info.items() if v is not None}
-                if info:
-                    return info
+        info = circuit_breaker.call_for_symbol("yahoo:v8", ticker, _read_fast_info, yf.Ticker(ticker))
+        if info:
+            return info
     except Exception:
         pass
 
     # Fallback to yfinance .info for daily OHLC
     try:
         ticker_obj = yf.Ticker(ticker)
-        yf_info = ticker_obj.info
+        yf_info = circuit_breaker.call("yahoo:v10", lambda: ticker_obj.info)
         if yf_info:
             info = {
                 "marketCap": yf_info.get("marketCap"),
@@ -2213,7 +2233,7 @@ def get_ticker_live_data_cached(ticker: str) -> dict:
     # Fallback to yfinance history
     try:
         ticker_obj = yf.Ticker(ticker)
-        hist = ticker_obj.history(period="1y", interval="1d")
+        hist = circuit_breaker.call_for_symbol("yahoo:v8", ticker, ticker_obj.history, period="1y", interval="1d")
         if not hist.empty:
             info = {}
             if "Volume" in hist.columns:
@@ -2231,7 +2251,53 @@ def get_ticker_live_data_cached(ticker: str) -> dict:
     except Exception:
         pass
 
-    return {}
+    # Raise so an empty result isn't cached (get_ticker_live_data negative-caches it briefly)
+    raise ValueError("No live data available")
+
+
+def _negative_cached(kind: str, ticker: str, fetch, default):
+    """
+    fetch(ticker), or `default` if it raised. A failed fetch is negative-cached for
+    circuit_breaker.NEGATIVE_TTL seconds so reruns don't walk the fallback chain again.
+    """
+    key = (kind, ticker)
+    if circuit_breaker.recently_empty(key):
+        return default
+    try:
+        return fetch(ticker)
+    except Exception:
+        circuit_breaker.remember_empty(key)
+        return default
+
+
+def get_ticker_key_metrics(ticker: str) -> dict:
+    """
+    Key metrics from the batched quote, plus P/S once yahoo_client has fetched it in
+    the background; falls back to the per-ticker chain (6hr cache), or {} if
+    unavailable (negative-cached briefly).
+    """
+    q = yahoo_client.get_batched_quote(ticker)
+    if q:
+        info = _key_metrics_from_quote(q)
+        if info:
+            price_to_sales = yahoo_client.get_price_to_sales(ticker)
+            if price_to_sales is not None:
+                info["priceToSalesTrailing12Months"] = price_to_sales
+            return info
+    return _negative_cached("key_metrics", ticker, get_ticker_key_metrics_cached, {})
+
+
+def get_ticker_live_data(ticker: str) -> dict:
+    """
+    Live fields from the batched quote (served stale-while-revalidate, never blocks on
+    an expired quote), falling back to the per-ticker chain (10min cache).
+    """
+    q = yahoo_client.get_batched_quote(ticker)
+    if q:
+        info = _live_data_from_quote(q)
+        if info and ("regularMarketPrice" in info or "marketCap" in info):
+            return info
+    return _negative_cached("live_data", ticker, get_ticker_live_data_cached, {})
 
 
 def get_ticker_info(ticker: str) -> dict:
@@ -2240,14 +2306,14 @@ def get_ticker_info(ticker: str) -> dict:
 
     # Get slow-changing key metrics (6 hour cache)
     try:
-        key_metrics = get_ticker_key_metrics_cached(ticker)
+        key_metrics = get_ticker_key_metrics(ticker)
         info.update(key_metrics)
     except Exception:
         pass
 
-    # Get live data (10 minute cache)
+    # Get live data (batched quote, else 10 minute cache)
     try:
-        live_data = get_ticker_live_data_cached(ticker)
+        live_data = get_ticker_live_data(ticker)
         info.update(live_data)
     except Exception:
         pass
@@ -2255,26 +2321,60 @@ def get_ticker_info(ticker: str) -> dict:
     return info
 
 
+def render_fetch_diagnostics():
+    """Sidebar expander with the fetch layer's counters since process start."""
+    with st.sidebar.expander("Data Diagnostics", expanded=False):
+        limiter = rate_limiter.stats()
+        waiting = limiter.pop("waiting", {})
+        st.caption("Rate limiter · waiting now: " + ", ".join(f"{prio} {n}" for prio, n in waiting.items()))
+        rows = [
+            {"endpoint": endpoint, "priority": prio, **counters}
+            for endpoint, by_prio in limiter.items() for prio, counters in by_prio.items()
+        ]
+        if rows:
+            st.dataframe(pd.DataFrame(rows).round({"wait_seconds": 2}), hide_index=True, use_container_width=True)
+
+        breakers = circuit_breaker.stats()
+        negative = breakers.pop("negative_cache", {}).get("size", 0)
+        st.caption(f"Circuit breakers · negative-cached keys: {negative}")
+        if breakers:
+            st.dataframe(pd.DataFrame.from_dict(breakers, orient="index"), use_container_width=True)
+
+        flights = single_flight.stats()
+        st.caption("Coalesced fetches · " + ", ".join(f"{name} {n}" for name, n in flights.items()))
+
+        cache = price_cache.stats()
+        st.caption("Price cache")
+        if cache:
+            st.dataframe(pd.DataFrame.from_dict(cache, orient="index"), use_container_width=True)
+
+
 @st.cache_data(ttl=600)  # Cache for 10 minutes
+@single_flight.coalesced
 def get_ticker_calendar_cached(ticker: str) -> dict:
     """Fetch ticker calendar. Raises exception on failure (won't be cached)."""
     ticker_obj = yf.Ticker(ticker)
-    calendar = ticker_obj.calendar
+    calendar = circuit_breaker.call("yahoo:v10", lambda: ticker_obj.calendar)
     if calendar is None:
         raise ValueError("No calendar data")
     return calendar
 
 
 def get_ticker_calendar(ticker: str) -> dict | None:
-    """Wrapper that handles errors gracefully."""
-    try:
-        return get_ticker_calendar_cached(ticker)
-    except Exception:
-        return None
+    """Wrapper that handles errors gracefully (failures are negative-cached briefly)."""
+    return _negative_cached("calendar", ticker, get_ticker_calendar_cached, None)
 
 
-@st.cache_data(ttl=600)  # Cache for 10 minutes
 def get_ticker_price_data_cached(ticker: str) -> dict:
+    """
+    Live price and day change from price_cache (stale-while-revalidate): once loaded,
+    an expired value is returned immediately and refreshed in the background, so the
+    Snapshot and BUZZ hero prices never wait on Yahoo after the first load.
+    """
+    return price_cache.get_or_refresh("price_data", ticker, lambda: _fetch_ticker_price_data(ticker))
+
+
+def _fetch_ticker_price_data(ticker: str) -> dict:
     """Fetch ticker price using intraday data for live prices."""
     import time
 
@@ -2283,11 +2383,15 @@ def get_ticker_price_data_cached(ticker: str) -> dict:
             ticker_obj = yf.Ticker(ticker)
 
             # Try intraday data first
-            hist = ticker_obj.history(period="2d", interval="1m", prepost=False)
+            try:
+                hist = circuit_breaker.call_for_symbol("yahoo:v8", ticker, ticker_obj.history,
+                                                       period="2d", interval="1m", prepost=False)
+            except circuit_breaker.EmptyResultError:
+                hist = pd.DataFrame()
 
             if hist.empty or "Close" not in hist.columns:
                 # Fallback to daily data
-                hist = ticker_obj.history(period="5d", interval="1d")
+                hist = circuit_breaker.call_for_symbol("yahoo:v8", ticker, ticker_obj.history, period="5d", interval="1d")
 
             if hist.empty or "Close" not in hist.columns:
                 if attempt < 2:
@@ -2317,6 +2421,8 @@ def get_ticker_price_data_cached(ticker: str) -> dict:
             pct_change = ((live_price - prev_close) / prev_close * 100) if prev_close else 0
             return {"price": live_price, "pct_change": pct_change, "valid": True}
 
+        except circuit_breaker.CircuitOpenError:
+            raise  # Known-failing endpoint: don't sleep and retry
         except Exception:
             if attempt < 2:
                 time.sleep(0.5 * (attempt + 1))
@@ -2325,48 +2431,49 @@ def get_ticker_price_data_cached(ticker: str) -> dict:
 
 
 def get_ticker_price_data(ticker: str) -> dict:
-    """Wrapper that handles errors gracefully."""
-    try:
-        return get_ticker_price_data_cached(ticker)
-    except Exception:
-        return {"price": None, "pct_change": 0.0, "valid": False}
+    """Wrapper that handles errors gracefully (failures are negative-cached briefly)."""
+    return _negative_cached("price_data", ticker, get_ticker_price_data_cached,
+                            {"price": None, "pct_change": 0.0, "valid": False})
 
 
 @st.cache_data(ttl=600)  # Cache for 10 minutes
+@single_flight.coalesced
 def _get_ticker_news_cached(ticker: str) -> list:
     """Fetch ticker news from yfinance. Raises on failure so empty results aren't cached."""
     t = yf.Ticker(ticker)
-    news = t.news
+    news = circuit_breaker.call("yahoo:news", lambda: t.news)
+    # Older yfinance versions return a dict
+    if isinstance(news, dict):
+        news = news.get('news', []) if 'news' in news else list(news.values())
+    if not news and hasattr(t, 'get_news'):
+        news = circuit_breaker.call("yahoo:news", t.get_news)
     if news and isinstance(news, list) and len(news) > 0:
         return news
     raise ValueError("No news available")
 
 
 def get_ticker_news(ticker: str) -> list:
-    """Wrapper that handles errors gracefully."""
-    try:
-        return _get_ticker_news_cached(ticker)
-    except Exception:
-        return []
+    """Wrapper that handles errors gracefully (failures are negative-cached briefly)."""
+    return _negative_cached("news", ticker, _get_ticker_news_cached, [])
 
 
 @st.cache_data
-def load_dominance_history() -> pd.DataFrame:
+def load_dominance_history(file_mtime: float = 0.0) -> pd.DataFrame:
     """
     Load historical data and extract the #1 holding (highest Score) for each rebalance date.
     Returns DataFrame with columns: date, leader
+    Pass file_mtime=history_store.history_mtime(path) so the cache is rebuilt when the history file changes.
     """
     try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        hist_df = pd.read_csv(csv_path)
+        leaders = load_build_artifact("dominance")
+        if leaders is not None:
+            return leaders.reset_index(drop=True)
 
-        # Parse dates (format: DD/MM/YYYY)
-        hist_df["Rebalance_date"] = pd.to_datetime(hist_df["Rebalance_date"], format="%d/%m/%Y", errors="coerce")
+        matrix = load_history_matrix()
 
-        # For each rebalance date, get the ticker with highest Score (that's the #1 holding)
-        leaders = hist_df.loc[hist_df.groupby("Rebalance_date")["Score"].idxmax()][["Rebalance_date", "Ticker"]].copy()
-        leaders.columns = ["date", "leader"]
-        leaders = leaders.sort_values("date").reset_index(drop=True)
+        # For each rebalance date, the rank-1 ticker (highest Score) is the #1 holding
+        leaders = pd.DataFrame({"date": matrix.dates, "leader": matrix.leaders()})
+        leaders = leaders.dropna(subset=["leader"]).reset_index(drop=True)
 
         return leaders
     except Exception as e:
@@ -2374,50 +2481,49 @@ def load_dominance_history() -> pd.DataFrame:
         return pd.DataFrame(columns=["date", "leader"])
 
 
-def get_cumulative_dominance(leaders_df: pd.DataFrame, selected_date: pd.Timestamp, top_n: int = 15) -> pd.DataFrame:
+@st.cache_data
+def load_dominance_index(file_mtime: float = 0.0) -> history_matrix.DominanceIndex:
     """
-    Calculate cumulative "months at #1" up to the selected date.
-    Returns top N tickers sorted by count descending.
+    Cumulative leader-count matrix (rebalance dates x tickers) built from load_dominance_history().
+    Pass file_mtime=history_store.history_mtime(path) so the cache is rebuilt when the history file changes.
     """
-    # Filter to dates <= selected_date
-    filtered = leaders_df[leaders_df["date"] <= selected_date]
-
-    # Count occurrences per ticker
-    counts = filtered["leader"].value_counts().reset_index()
-    counts.columns = ["ticker", "months_at_top"]
-
-    # Take top N
-    top = counts.head(top_n).copy()
+    return history_matrix.build_dominance_index(load_dominance_history(file_mtime=file_mtime))
 
-    # Add rank for coloring
-    top["rank"] = range(1, len(top) + 1)
 
-    return top
+def get_cumulative_dominance(dominance_index: history_matrix.DominanceIndex, selected_date: pd.Timestamp,
+                             top_n: int = 15) -> pd.DataFrame:
+    """
+    Calculate cumulative "months at #1" up to the selected date.
+    Returns top N tickers sorted by count descending (columns: ticker, months_at_top, rank).
+    One binary search on the prefix-count matrix plus a top-N partial sort, so scrubbing
+    across dates never recounts the leaders.
+    """
+    return dominance_index.top(selected_date, top_n)
 
 
-def load_ranking_history(top_n: int = 10) -> pd.DataFrame:
+@st.cache_data
+def load_ranking_history(top_n: int = 10, file_mtime: float = 0.0) -> pd.DataFrame:
     """
     Load historical ranking data in long format for bump chart visualization.
     Returns DataFrame with columns: Date, Ticker, Rank, Score
     Only includes tickers that have been in the top N at some point.
+    Pass file_mtime=history_store.history_mtime(path) so the cache is rebuilt when the history file changes.
     """
     try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        hist_df = pd.read_csv(csv_path)
-
-        # Parse dates
-        hist_df["Rebalance_date"] = pd.to_datetime(hist_df["Rebalance_date"], format="%d/%m/%Y", errors="coerce")
-
-        # Normalize ticker names
-        hist_df['Ticker'] = hist_df['Ticker'].replace({'FB': 'META'})
-
-        # For each date, calculate rank based on Score (higher score = better rank)
-        hist_df = hist_df.dropna(subset=["Rebalance_date", "Score"])
-        hist_df["Rank"] = hist_df.groupby("Rebalance_date")["Score"].rank(ascending=False, method="first").astype(int)
-
-        # Filter to only top N rankings
-        ranking_df = hist_df[hist_df["Rank"] <= top_n][["Rebalance_date", "Ticker", "Rank", "Score"]].copy()
-        ranking_df.columns = ["Date", "Ticker", "Rank", "Score"]
+        ranking_df = load_build_artifact("rank_history")
+        if ranking_df is not None:
+            return ranking_df[ranking_df["Rank"] <= top_n].reset_index(drop=True)
+
+        matrix = load_history_matrix()
+
+        # Rank plane is already ranked by Score per date (higher score = better rank); keep top N
+        date_idx, ticker_idx = np.nonzero((matrix.rank > 0) & (matrix.rank <= top_n))
+        ranking_df = pd.DataFrame({
+            "Date": matrix.dates[date_idx],
+            "Ticker": matrix.tickers[ticker_idx],
+            "Rank": matrix.rank[date_idx, ticker_idx].astype(int),
+            "Score": matrix.score[date_idx, ticker_idx],
+        })
         ranking_df = ranking_df.sort_values(["Date", "Rank"]).reset_index(drop=True)
 
         return ranking_df
@@ -2643,42 +2749,39 @@ def render_rank_matrix(df: pd.DataFrame, max_rank: int = 10, height: int = 500):
 # -----------------------------
 # Conviction Ranking Data & Helpers
 # -----------------------------
-def load_conviction_data() -> dict:
+@st.cache_data
+def load_conviction_data(file_mtime: float = 0.0) -> dict:
     """
     Load comprehensive conviction data for the ranking page.
     Returns dict with:
       - current_df: Current holdings with Score, Weight, Rank
-      - historical_df: Full historical data for sparklines
       - metrics: Aggregate KPI metrics
+    Per-ticker history (sparklines, score charts) comes from load_ticker_rows.
+    Cached across sessions; pass file_mtime=history_store.history_mtime(path) so the cache
+    is rebuilt when the history file changes.
     """
     try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        hist_df = pd.read_csv(csv_path)
-
-        # Parse dates
-        hist_df["Rebalance_date"] = pd.to_datetime(hist_df["Rebalance_date"], format="%d/%m/%Y", errors="coerce")
-        hist_df['Ticker'] = hist_df['Ticker'].replace({'FB': 'META'})
+        hist_df = load_history_frame()
         hist_df = hist_df.dropna(subset=["Rebalance_date", "Score"])
 
         # Get unique dates sorted
         unique_dates = sorted(hist_df["Rebalance_date"].unique())
         if len(unique_dates) < 1:
-            return {"current_df": pd.DataFrame(), "historical_df": pd.DataFrame(), "metrics": {}}
+            return {"current_df": pd.DataFrame(), "metrics": {}}
 
         latest_date = unique_dates[-1]
         prev_date = unique_dates[-2] if len(unique_dates) > 1 else latest_date
 
         # Current holdings
         current_df = hist_df[hist_df["Rebalance_date"] == latest_date].copy()
-        current_df["Weight"] = pd.to_numeric(current_df["Weight"], errors="coerce")
-        current_df["Score"] = pd.to_numeric(current_df["Score"], errors="coerce")
-        current_df = current_df.dropna(subset=["Score"])
+        current_df["Ticker"] = current_df["Ticker"].astype(str)
         current_df["Rank"] = current_df["Score"].rank(ascending=False, method="first").astype(int)
         current_df = current_df.sort_values("Rank")
 
         # Previous month scores for change calculation
         prev_df = hist_df[hist_df["Rebalance_date"] == prev_date][["Ticker", "Score"]].copy()
         prev_df.columns = ["Ticker", "Prev_Score"]
+        prev_df["Ticker"] = prev_df["Ticker"].astype(str)
 
         # Merge to get changes
         current_df = current_df.merge(prev_df, on="Ticker", how="left")
@@ -2725,18 +2828,17 @@ def load_conviction_data() -> dict:
 
         return {
             "current_df": current_df,
-            "historical_df": hist_df,
             "metrics": metrics,
         }
     except Exception as e:
         st.error(f"Error loading conviction data: {e}")
-        return {"current_df": pd.DataFrame(), "historical_df": pd.DataFrame(), "metrics": {}}
+        return {"current_df": pd.DataFrame(), "metrics": {}}
 
 
-def get_sparkline_data(hist_df: pd.DataFrame, ticker: str, n_periods: int = 12) -> list:
-    """Get last N periods of scores for a ticker for sparkline rendering."""
-    ticker_data = hist_df[hist_df["Ticker"] == ticker].sort_values("Rebalance_date").tail(n_periods)
-    return ticker_data["Score"].tolist()
+def get_sparkline_data(ticker: str, n_periods: int = 12) -> list:
+    """Get last N periods of scores for a ticker for sparkline rendering (per-ticker index slice)."""
+    ticker_data = load_ticker_rows(ticker)
+    return ticker_data["Score"].dropna().tail(n_periods).tolist()
 
 
 def render_sparkline_svg(values: list, width: int = 80, height: int = 24, color: str = "#7AA2FF") -> str:
@@ -2833,7 +2935,46 @@ def render_chart_with_measurement(fig, chart_id: str = "", height: int = 480):
     st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False, "scrollZoom": False})
 
 
-def render_tradingview_chart(hist: pd.DataFrame, chart_type: str = "Candlestick", chart_id: str = "tv_chart", height: int = 540, compare_series: dict = None, show_tooltip: bool = True):
+def _chart_series_columns(hist: pd.DataFrame, use_indexed: bool) -> tuple[dict[str, np.ndarray], bool]:
+    """
+    (columns, daily): column-wise chart data for `hist` (Close required;
+    Open/High/Low default to Close, Volume to 0). "time" is Unix seconds; for
+    daily bars (all at midnight) it is the wall-clock midnight, which the chart
+    turns back into a date. Prices are indexed to 100 at the first close when
+    `use_indexed`. barPctChange is the change from the previous bar and
+    periodPctChange the change from the first bar, both rounded to 2 places.
+    """
+    index = hist.index
+    daily = not ((index.hour != 0).any() or (index.minute != 0).any())
+    if daily and index.tz is not None:
+        index = index.tz_localize(None)
+
+    close = hist["Close"].to_numpy(dtype=float)
+    prices = {
+        col.lower(): (hist[col].to_numpy(dtype=float) if col in hist.columns else close)
+        for col in ("Open", "High", "Low")
+    }
+    prices["close"] = close
+    if use_indexed:
+        prices = {name: values / close[0] * 100 for name, values in prices.items()}
+    close = prices["close"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prev = np.concatenate(([0.0], close[:-1]))
+        bar_pct = np.where(prev != 0, (close - prev) / prev * 100, 0.0)
+        first = close[0]
+        period_pct = (close - first) / first * 100 if first != 0 else np.zeros_like(close)
+
+    return {
+        "time": index.as_unit("s").asi8.astype(float),
+        **prices,
+        "volume": hist["Volume"].to_numpy(dtype=float) if "Volume" in hist.columns else np.zeros_like(close),
+        "barPctChange": np.round(bar_pct, 2),
+        "periodPctChange": np.round(period_pct, 2),
+    }, daily
+
+
+def render_tradingview_chart(hist: pd.DataFrame, chart_type: str = "Candlestick", chart_id: str = "tv_chart", height: int = 540, compare_series: dict = None, show_tooltip: bool = True, width_px: int = downsample.CHART_WIDTH_PX):
     """
     Render a TradingView Lightweight Charts with drag-to-measure functionality.
 
@@ -2851,6 +2992,10 @@ def render_tradingview_chart(hist: pd.DataFrame, chart_type: str = "Candlestick"
         chart_id: Unique identifier for the chart
         height: Chart height in pixels
         compare_series: Optional dict with 'data' (DataFrame with Close column), 'name', 'color'
+        width_px: Width the point budget is sized for; longer series are downsampled
+
+    Returns:
+        The last drag-to-measure range ({"from", "to", "fromPrice", "toPrice", "pctChange"}) or None
     """
     if hist.empty or "Close" not in hist.columns:
         st.warning("No data available for chart")
@@ -2862,491 +3007,50 @@ def render_tradingview_chart(hist: pd.DataFrame, chart_type: str = "Candlestick"
     # Calculate period average (only for non-comparison mode)
     period_avg = float(hist["Close"].mean()) if not use_indexed else None
 
-    # Get first close for indexing
-    first_close = float(hist["Close"].iloc[0]) if not hist.empty else 1
-
-    # Prepare data for Lightweight Charts
-    ohlc_data = []
-    line_data = []
-    prev_close = None
-    period_open_close = None  # First close price for period % change (line chart)
-
-    for idx, row in hist.iterrows():
-        # Format time based on whether it's intraday or daily
-        if hasattr(idx, 'hour') and (idx.hour != 0 or idx.minute != 0):
-            # Intraday: use Unix timestamp
-            time_val = int(idx.timestamp())
-        else:
-            # Daily: use date string
-            time_val = idx.strftime('%Y-%m-%d')
-
-        o = float(row.get('Open', row['Close']))
-        h = float(row.get('High', row['Close']))
-        l = float(row.get('Low', row['Close']))
-        c = float(row['Close'])
-        v = float(row.get('Volume', 0)) if 'Volume' in row else 0
-
-        # For indexed mode, normalize to 100
-        if use_indexed:
-            c_display = (c / first_close) * 100
-            o_display = (o / first_close) * 100
-            h_display = (h / first_close) * 100
-            l_display = (l / first_close) * 100
-        else:
-            c_display = c
-            o_display = o
-            h_display = h
-            l_display = l
-
-        # Track first close for period change calculation
-        if period_open_close is None:
-            period_open_close = c_display
-
-        # Candlestick: % change from previous bar
-        bar_pct_change = ((c_display - prev_close) / prev_close * 100) if prev_close else 0
-
-        # Line: % change from period open (first bar)
-        period_pct_change = ((c_display - period_open_close) / period_open_close * 100) if period_open_close else 0
-
-        # OHLC data for candlestick (bar-to-bar change)
-        ohlc_data.append({
-            'time': time_val,
-            'open': o_display,
-            'high': h_display,
-            'low': l_display,
-            'close': c_display,
-            'volume': v,
-            'pctChange': round(bar_pct_change, 2)
-        })
-
-        # Line data (change from period open)
-        line_data.append({
-            'time': time_val,
-            'value': c_display,
-            'pctChange': round(period_pct_change, 2)
-        })
+    # Ship no more points than the chart width can show (LTTB for lines, OHLC buckets for candles)
+    is_candlestick = chart_type == "Candlestick" and not use_indexed  # Force line for comparison
+    hist = downsample.for_chart(hist, candles=is_candlestick, width_px=width_px)
 
-        prev_close = c_display
+    # Columnar payloads: one array per field, zipped back into bar objects in JS
+    series_data, daily = _chart_series_columns(hist, use_indexed)
 
     # Prepare comparison series data if provided
-    compare_data = []
+    compare_columns, compare_daily = None, False
     if compare_series and 'data' in compare_series:
         comp_df = compare_series['data']
         if not comp_df.empty and 'Close' in comp_df.columns:
-            comp_first_close = float(comp_df['Close'].iloc[0])
-            for idx, row in comp_df.iterrows():
-                if hasattr(idx, 'hour') and (idx.hour != 0 or idx.minute != 0):
-                    time_val = int(idx.timestamp())
-                else:
-                    time_val = idx.strftime('%Y-%m-%d')
-                c = float(row['Close'])
-                c_indexed = (c / comp_first_close) * 100 if use_indexed else c
-                compare_data.append({
-                    'time': time_val,
-                    'value': c_indexed
-                })
-
-    import json
-    is_candlestick = chart_type == "Candlestick" and not use_indexed  # Force line for comparison
-    data_json = json.dumps(ohlc_data if is_candlestick else line_data)
-    chart_type_js = "true" if is_candlestick else "false"
-    period_avg_js = round(period_avg, 2) if period_avg else "null"
-    compare_data_json = json.dumps(compare_data) if compare_data else "null"
-    compare_name = compare_series.get('name', 'Compare') if compare_series else ""
-    compare_color = compare_series.get('color', '#a78bfa') if compare_series else "#a78bfa"
-    tooltip_display = "none !important" if not show_tooltip else "none"
-
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <script src="https://unpkg.com/lightweight-charts@4.1.0/dist/lightweight-charts.standalone.production.js"></script>
-        <style>
-            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-            body {{ background: transparent; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }}
-            #chart-container {{ width: 100%; height: {height}px; position: relative; }}
-
-            /* Floating Tooltip */
-            #ohlc-tooltip {{
-                position: absolute;
-                top: 12px;
-                left: 12px;
-                background: rgba(15, 22, 35, 0.95);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 10px 14px;
-                color: #e8edf5;
-                font-size: 12px;
-                pointer-events: none;
-                z-index: 100;
-                display: {tooltip_display};
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-            }}
-            #ohlc-tooltip .row {{ display: flex; gap: 12px; margin: 2px 0; }}
-            #ohlc-tooltip .header {{ display: flex; gap: 12px; margin-bottom: 4px; padding-bottom: 4px; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-            #ohlc-tooltip .header span {{ color: #6b7a8a; font-size: 10px; text-transform: uppercase; }}
-            #ohlc-tooltip .col-name {{ width: 60px; }}
-            #ohlc-tooltip .col-value {{ width: 45px; text-align: right; }}
-            #ohlc-tooltip .col-chg {{ width: 65px; text-align: right; }}
-            #ohlc-tooltip .label {{ color: #9fb2cc; }}
-            #ohlc-tooltip .value {{ font-weight: 500; }}
-            #ohlc-tooltip .pct-positive {{ color: #22c55e; }}
-            #ohlc-tooltip .pct-negative {{ color: #ef4444; }}
-
-            /* Drag-to-measure tooltip */
-            #measure-tooltip {{
-                position: absolute;
-                background: rgba(122, 162, 255, 0.95);
-                border-radius: 6px;
-                padding: 8px 12px;
-                color: #fff;
-                font-size: 12px;
-                font-weight: 600;
-                pointer-events: none;
-                z-index: 200;
-                display: none;
-                box-shadow: 0 4px 12px rgba(0,0,0,0.4);
-                white-space: nowrap;
-            }}
-            #measure-tooltip .big {{ font-size: 16px; }}
-            #measure-tooltip .duration {{ font-size: 11px; opacity: 0.9; margin-top: 2px; }}
-
-            /* Measure line overlay */
-            #measure-line {{
-                position: absolute;
-                pointer-events: none;
-                z-index: 150;
-                display: none;
-            }}
-            #measure-line svg {{ width: 100%; height: 100%; }}
-        </style>
-    </head>
-    <body>
-        <div id="chart-container">
-            <div id="ohlc-tooltip"></div>
-            <div id="measure-tooltip"></div>
-            <div id="measure-line"><svg></svg></div>
-        </div>
-
-        <script>
-            const data = {data_json};
-            const isCandlestick = {chart_type_js};
-            const periodAvg = {period_avg_js};
-            const compareData = {compare_data_json};
-            const compareName = "{compare_name}";
-            const compareColor = "{compare_color}";
-            const container = document.getElementById('chart-container');
-            const ohlcTooltip = document.getElementById('ohlc-tooltip');
-            const measureTooltip = document.getElementById('measure-tooltip');
-            const measureLine = document.getElementById('measure-line');
-
-            // Create chart with dark theme
-            const chart = LightweightCharts.createChart(container, {{
-                width: container.clientWidth,
-                height: {height},
-                layout: {{
-                    background: {{ type: 'solid', color: 'transparent' }},
-                    textColor: '#9fb2cc',
-                    fontSize: 11,
-                }},
-                grid: {{
-                    vertLines: {{ color: 'rgba(255, 255, 255, 0.03)' }},
-                    horzLines: {{ color: 'rgba(255, 255, 255, 0.03)' }},
-                }},
-                crosshair: {{
-                    mode: LightweightCharts.CrosshairMode.Magnet,
-                    vertLine: {{
-                        color: 'rgba(122, 162, 255, 0.5)',
-                        width: 1,
-                        style: LightweightCharts.LineStyle.Dashed,
-                        labelBackgroundColor: '#7AA2FF',
-                    }},
-                    horzLine: {{
-                        color: 'rgba(122, 162, 255, 0.5)',
-                        width: 1,
-                        style: LightweightCharts.LineStyle.Dashed,
-                        labelBackgroundColor: '#7AA2FF',
-                    }},
-                }},
-                timeScale: {{
-                    borderColor: 'rgba(255, 255, 255, 0.1)',
-                    rightOffset: -1,
-                    minBarSpacing: 0.5,
-                    fixLeftEdge: true,
-                    fixRightEdge: true,
-                    lockVisibleTimeRangeOnResize: true,
-                    visible: true,
-                    timeVisible: true,
-                    secondsVisible: false,
-                }},
-                rightPriceScale: {{
-                    borderColor: 'rgba(255, 255, 255, 0.1)',
-                    scaleMargins: {{
-                        top: 0.1,
-                        bottom: 0.1,
-                    }},
-                }},
-                handleScroll: false,
-                handleScale: false,
-            }});
-
-            // Add series based on chart type
-            let series;
-            if (isCandlestick) {{
-                series = chart.addCandlestickSeries({{
-                    upColor: '#22c55e',
-                    downColor: '#ef4444',
-                    borderVisible: false,
-                    wickUpColor: '#22c55e',
-                    wickDownColor: '#ef4444',
-                    lastValueVisible: false,
-                    priceLineVisible: false,
-                }});
-            }} else {{
-                series = chart.addAreaSeries({{
-                    lineColor: '#60a5fa',
-                    lineWidth: 2,
-                    topColor: 'rgba(96, 165, 250, 0.3)',
-                    bottomColor: 'rgba(96, 165, 250, 0.02)',
-                    crosshairMarkerVisible: true,
-                    crosshairMarkerRadius: 4,
-                    crosshairMarkerBorderColor: '#60a5fa',
-                    crosshairMarkerBackgroundColor: '#fff',
-                    lastValueVisible: false,
-                    priceLineVisible: false,
-                }});
-            }}
-
-            series.setData(data);
-
-            // Add comparison series if provided (area chart with fill)
-            let compareSeries = null;
-            if (compareData && compareData.length > 0) {{
-                compareSeries = chart.addAreaSeries({{
-                    lineColor: compareColor,
-                    lineWidth: 2,
-                    topColor: 'rgba(167, 139, 250, 0.3)',
-                    bottomColor: 'rgba(167, 139, 250, 0.02)',
-                    crosshairMarkerVisible: true,
-                    crosshairMarkerRadius: 4,
-                    crosshairMarkerBorderColor: compareColor,
-                    crosshairMarkerBackgroundColor: '#fff',
-                    lastValueVisible: false,
-                    priceLineVisible: false,
-                }});
-                compareSeries.setData(compareData);
-            }}
-
-            // Add period average line (only when not comparing)
-            if (periodAvg !== null && !compareData) {{
-                series.createPriceLine({{
-                    price: periodAvg,
-                    color: '#f59e0b',
-                    lineWidth: 1,
-                    lineStyle: LightweightCharts.LineStyle.Dashed,
-                    axisLabelVisible: true,
-                    title: 'Avg',
-                }});
-            }}
-
-            // Force data to fill entire chart width with no empty space
-            // Use logical range (bar indices) for precise control
-            if (data.length > 0) {{
-                chart.timeScale().setVisibleLogicalRange({{
-                    from: 0,
-                    to: data.length - 1
-                }});
-            }}
-
-            // Tooltip on crosshair move
-            chart.subscribeCrosshairMove((param) => {{
-                if (!param.time || !param.point) {{
-                    ohlcTooltip.style.display = 'none';
-                    return;
-                }}
-
-                const dataPoint = param.seriesData.get(series);
-                if (!dataPoint) {{
-                    ohlcTooltip.style.display = 'none';
-                    return;
-                }}
-
-                // Find matching data with pctChange
-                const matchingData = data.find(d => d.time === param.time);
-                const pctChange = matchingData ? matchingData.pctChange : 0;
-                const pctClass = pctChange >= 0 ? 'pct-positive' : 'pct-negative';
-                const pctSign = pctChange >= 0 ? '+' : '';
-
-                // Check for comparison data
-                let comparePoint = null;
-                if (compareSeries) {{
-                    comparePoint = param.seriesData.get(compareSeries);
-                }}
-
-                if (isCandlestick) {{
-                    ohlcTooltip.innerHTML = `
-                        <div class="row"><span class="label">O</span><span class="value">${{dataPoint.open.toFixed(2)}}</span></div>
-                        <div class="row"><span class="label">H</span><span class="value">${{dataPoint.high.toFixed(2)}}</span></div>
-                        <div class="row"><span class="label">L</span><span class="value">${{dataPoint.low.toFixed(2)}}</span></div>
-                        <div class="row"><span class="label">C</span><span class="value">${{dataPoint.close.toFixed(2)}}</span></div>
-                        <div class="row"><span class="label">Chg</span><span class="value ${{pctClass}}">${{pctSign}}${{pctChange.toFixed(2)}}%</span></div>
-                    `;
-                }} else if (comparePoint) {{
-                    // Comparison mode - show both values with individual % changes
-                    // Values are indexed to 100, so % change = value - 100
-                    const mainPct = dataPoint.value - 100;
-                    const mainPctClass = mainPct >= 0 ? 'pct-positive' : 'pct-negative';
-                    const mainPctSign = mainPct >= 0 ? '+' : '';
-
-                    const compPct = comparePoint.value - 100;
-                    const compPctClass = compPct >= 0 ? 'pct-positive' : 'pct-negative';
-                    const compPctSign = compPct >= 0 ? '+' : '';
-
-                    ohlcTooltip.innerHTML = `
-                        <div class="header"><span class="col-name"></span><span class="col-value">Price</span><span class="col-chg">Chg</span></div>
-                        <div class="row"><span class="col-name label" style="color:#60a5fa">BUZZ</span><span class="col-value value">${{dataPoint.value.toFixed(1)}}</span><span class="col-chg value ${{mainPctClass}}">${{mainPctSign}}${{mainPct.toFixed(2)}}%</span></div>
-                        <div class="row"><span class="col-name label" style="color:${{compareColor}}">${{compareName}}</span><span class="col-value value">${{comparePoint.value.toFixed(1)}}</span><span class="col-chg value ${{compPctClass}}">${{compPctSign}}${{compPct.toFixed(2)}}%</span></div>
-                    `;
-                }} else {{
-                    ohlcTooltip.innerHTML = `
-                        <div class="row"><span class="label">Price</span><span class="value">${{dataPoint.value.toFixed(2)}}</span></div>
-                        <div class="row"><span class="label">Chg</span><span class="value ${{pctClass}}">${{pctSign}}${{pctChange.toFixed(2)}}%</span></div>
-                    `;
-                }}
-                ohlcTooltip.style.display = 'block';
-            }});
-
-            // Drag-to-measure functionality
-            let isDragging = false;
-            let dragStart = null;
-            let dragStartPrice = null;
-            let dragStartTime = null;
-
-            container.addEventListener('mousedown', (e) => {{
-                const rect = container.getBoundingClientRect();
-                const x = e.clientX - rect.left;
-                const y = e.clientY - rect.top;
-
-                isDragging = true;
-                dragStart = {{ x, y, clientX: e.clientX, clientY: e.clientY }};
-
-                // Get price and time at start point
-                const timeCoord = chart.timeScale().coordinateToTime(x);
-                const priceCoord = series.coordinateToPrice(y);
-                dragStartPrice = priceCoord;
-                dragStartTime = timeCoord;
-
-                measureLine.style.display = 'block';
-                measureLine.style.left = '0';
-                measureLine.style.top = '0';
-                measureLine.style.width = '100%';
-                measureLine.style.height = '100%';
-            }});
-
-            container.addEventListener('mousemove', (e) => {{
-                if (!isDragging || !dragStart) return;
-
-                const rect = container.getBoundingClientRect();
-                const x = e.clientX - rect.left;
-                const y = e.clientY - rect.top;
-
-                // Get current price
-                const currentPrice = series.coordinateToPrice(y);
-                const currentTime = chart.timeScale().coordinateToTime(x);
-
-                if (dragStartPrice !== null && currentPrice !== null) {{
-                    const priceDiff = currentPrice - dragStartPrice;
-                    const pctChange = (priceDiff / dragStartPrice) * 100;
-                    const pctSign = pctChange >= 0 ? '+' : '';
-
-                    // Calculate time duration
-                    let duration = '';
-                    if (dragStartTime && currentTime) {{
-                        let startTs, endTs;
-                        if (typeof dragStartTime === 'string') {{
-                            startTs = new Date(dragStartTime).getTime() / 1000;
-                            endTs = new Date(currentTime).getTime() / 1000;
-                        }} else {{
-                            startTs = dragStartTime;
-                            endTs = currentTime;
-                        }}
-                        const diffSecs = Math.abs(endTs - startTs);
-                        const days = Math.floor(diffSecs / 86400);
-                        const hours = Math.floor((diffSecs % 86400) / 3600);
-                        const mins = Math.floor((diffSecs % 3600) / 60);
-
-                        if (days > 0) duration = `${{days}}d ${{hours}}h`;
-                        else if (hours > 0) duration = `${{hours}}h ${{mins}}m`;
-                        else duration = `${{mins}}m`;
-                    }}
-
-                    // Draw line
-                    const svg = measureLine.querySelector('svg');
-                    const color = pctChange >= 0 ? '#22c55e' : '#ef4444';
-                    svg.innerHTML = `
-                        <line x1="${{dragStart.x}}" y1="${{dragStart.y}}" x2="${{x}}" y2="${{y}}"
-                              stroke="${{color}}" stroke-width="2" stroke-dasharray="5,3"/>
-                        <circle cx="${{dragStart.x}}" cy="${{dragStart.y}}" r="4" fill="${{color}}"/>
-                        <circle cx="${{x}}" cy="${{y}}" r="4" fill="${{color}}"/>
-                    `;
-
-                    // Position tooltip
-                    measureTooltip.innerHTML = `
-                        <div class="big">${{pctSign}}${{pctChange.toFixed(2)}}%</div>
-                        <div>$${{Math.abs(priceDiff).toFixed(2)}}</div>
-                        ${{duration ? `<div class="duration">${{duration}}</div>` : ''}}
-                    `;
-                    measureTooltip.style.display = 'block';
-                    // Position tooltip to the left of the line/point
-                    const tooltipWidth = measureTooltip.offsetWidth || 100;
-                    measureTooltip.style.left = (x - tooltipWidth - 15) + 'px';
-                    measureTooltip.style.top = (y - 30) + 'px';
-                    measureTooltip.style.background = pctChange >= 0 ? 'rgba(34, 197, 94, 0.95)' : 'rgba(239, 68, 68, 0.95)';
-                }}
-            }});
-
-            const endDrag = () => {{
-                isDragging = false;
-                dragStart = null;
-                dragStartPrice = null;
-                dragStartTime = null;
-                measureTooltip.style.display = 'none';
-                measureLine.style.display = 'none';
-                measureLine.querySelector('svg').innerHTML = '';
-            }};
-
-            container.addEventListener('mouseup', endDrag);
-            container.addEventListener('mouseleave', endDrag);
-
-            // Responsive resize with debounce
-            let resizeTimeout;
-            const resizeObserver = new ResizeObserver(entries => {{
-                clearTimeout(resizeTimeout);
-                resizeTimeout = setTimeout(() => {{
-                    for (let entry of entries) {{
-                        chart.applyOptions({{ width: entry.contentRect.width }});
-                        if (data.length > 0) {{
-                            chart.timeScale().setVisibleLogicalRange({{
-                                from: 0,
-                                to: data.length - 1
-                            }});
-                        }}
-                    }}
-                }}, 100);
-            }});
-            resizeObserver.observe(container);
-        </script>
-    </body>
-    </html>
-    """
-
-    components.html(html_content, height=height + 20, scrolling=False)
+            comp_df = downsample.for_chart(comp_df[["Close"]], candles=False, width_px=width_px)
+            comp_data, compare_daily = _chart_series_columns(comp_df, use_indexed)
+            compare_columns = {"time": comp_data["time"], "value": comp_data["close"]}
+
+    if is_candlestick:
+        columns = {
+            **{k: series_data[k] for k in ("time", "open", "high", "low", "close", "volume")},
+            "pctChange": series_data["barPctChange"],
+        }
+    else:
+        columns = {"time": series_data["time"], "value": series_data["close"], "pctChange": series_data["periodPctChange"]}
+
+    # The component keeps its chart across reruns and only receives bars it doesn't have yet
+    return tv_chart.render(
+        columns,
+        daily,
+        key=chart_id,
+        candlestick=is_candlestick,
+        compare_columns=compare_columns,
+        compare_daily=compare_daily,
+        period_avg=round(period_avg, 2) if period_avg else None,
+        compare_name=compare_series.get('name', 'Compare') if compare_series else "",
+        compare_color=compare_series.get('color', '#a78bfa') if compare_series else "#a78bfa",
+        show_tooltip=show_tooltip,
+        height=height,
+    )
 
 
 # Alias for backwards compatibility
 def render_tradingview_candlestick(hist: pd.DataFrame, chart_id: str = "tv_chart", height: int = 540):
     """Backwards compatible wrapper - renders candlestick chart."""
-    render_tradingview_chart(hist, chart_type="Candlestick", chart_id=chart_id, height=height)
+    return render_tradingview_chart(hist, chart_type="Candlestick", chart_id=chart_id, height=height)
 
 
 # -----------------------------
@@ -3381,6 +3085,19 @@ if "pending_ticker_selection" in st.session_state:
         st.session_state.view_mode_widget = "Snapshot"
         st.session_state.ticker_search = ""  # Clear search after navigation
 
+# Process a ticker clicked in the All Holdings table BEFORE rendering selectbox
+if "pending_holdings_click" in st.session_state:
+    pending = st.session_state.pending_holdings_click
+    del st.session_state.pending_holdings_click
+    if pending in all_tickers:
+        st.session_state.selected_ticker = pending
+        st.session_state.ticker_selectbox_widget = pending
+        st.session_state.view_mode_state = "Snapshot"
+        st.session_state.view_mode_widget = "Snapshot"
+        st.session_state.came_from_holdings = True
+        st.session_state.last_clicked_ticker = pending  # Store for scroll restoration
+        st.session_state.visited_ticker = ""  # Clear previous visited label
+
 # Handle navigation from weight changes click (via query param)
 query_params = st.query_params
 if "wc_ticker" in query_params:
@@ -3443,6 +3160,9 @@ selected_ticker = st.sidebar.selectbox(
 # Use session state as the source of truth
 selected_ticker = st.session_state.selected_ticker
 
+# Warm live quotes for every holding + market symbols in a few batched requests
+yahoo_client.refresh_quotes([*all_tickers, *MARKET_QUOTE_SYMBOLS])
+
 # Views section
 st.sidebar.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
 st.sidebar.markdown('<div class="sidebar-section-header">Views</div>', unsafe_allow_html=True)
@@ -3458,6 +3178,7 @@ view_mode = st.sidebar.radio(
     on_change=update_view_mode_callback,
 )
 st.session_state.view_mode_state = view_mode
+render_fetch_diagnostics()
 
 # Dynamic title based on view/ticker (Snapshot, BUZZ Performance, and Conviction Ranking have hero headers)
 if st.session_state.view_mode_state == "All Holdings":
@@ -3470,51 +3191,12 @@ elif st.session_state.view_mode_state == "BUZZ Heatmap":
 # If user wants the All Holdings page, render that and exit early
 if st.session_state.view_mode_state == "All Holdings":
 
-    # Scroll position tracking and restoration
-    should_restore = st.session_state.get("restore_scroll", False)
-    last_ticker = st.session_state.get("last_clicked_ticker", "")
-
-    # Scroll restoration script - scrolls to the last clicked ticker button
-    if should_restore and last_ticker:
-        st.components.v1.html(f"""
-            <script>
-                (function() {{
-                    const targetTicker = "{last_ticker}";
-
-                    function scrollToTicker() {{
-                        // Find all buttons in the parent document
-                        const buttons = window.parent.document.querySelectorAll('button');
-
-                        for (const btn of buttons) {{
-                            // Check if button text matches the ticker
-                            if (btn.textContent.trim() === targetTicker) {{
-                                // Scroll the button into view with some offset from top
-                                btn.scrollIntoView({{ behavior: 'instant', block: 'center' }});
-                                return true;
-                            }}
-                        }}
-                        return false;
-                    }}
-
-                    // Try multiple times with increasing delays to handle Streamlit rendering
-                    function attemptScroll() {{
-                        if (!scrollToTicker()) {{
-                            // Keep trying if not found yet
-                            setTimeout(scrollToTicker, 100);
-                            setTimeout(scrollToTicker, 250);
-                            setTimeout(scrollToTicker, 500);
-                            setTimeout(scrollToTicker, 1000);
-                        }}
-                    }}
-
-                    // Start attempting immediately and after delays
-                    attemptScroll();
-                    setTimeout(attemptScroll, 50);
-                }})();
-            </script>
-        """, height=0)
+    # Returning from a Snapshot opened here: label that holding and scroll it into view
+    scroll_to = ""
+    if st.session_state.get("restore_scroll", False):
+        scroll_to = st.session_state.get("last_clicked_ticker", "")
         st.session_state.restore_scroll = False
-        st.session_state.visited_ticker = last_ticker  # Keep for "just visited" label
+        st.session_state.visited_ticker = scroll_to  # Keep for "just visited" label
         st.session_state.last_clicked_ticker = ""  # Clear after use
 
     # Use the already-loaded df from current_holdings.csv
@@ -3533,102 +3215,36 @@ if st.session_state.view_mode_state == "All Holdings":
     elif "PercentNetAssets" in holdings_df.columns:
         holdings_df = holdings_df.sort_values("PercentNetAssets", ascending=False)
 
-    # Create callback factory for ticker selection
-    def make_ticker_callback(ticker_value):
-        """Creates a callback function that selects a specific ticker"""
-        def callback():
-            st.session_state.selected_ticker = ticker_value
-            st.session_state.ticker_selectbox_widget = ticker_value
-            st.session_state.view_mode_state = "Snapshot"
-            st.session_state.view_mode_widget = "Snapshot"
-            st.session_state.came_from_holdings = True
-            st.session_state.last_clicked_ticker = ticker_value  # Store for scroll restoration
-            st.session_state.visited_ticker = ""  # Clear previous visited label
-        return callback
-
-    # Card header with title and search
-    col_title, col_search = st.columns([2, 1])
-    with col_title:
-        date_str = file_date.strftime("%b %d, %Y") if file_date else "N/A"
-        st.markdown(f'<p class="dark-card-title">Portfolio Holdings</p>', unsafe_allow_html=True)
-        st.markdown(f'<p class="dark-card-subtitle">As of {date_str}</p>', unsafe_allow_html=True)
-    with col_search:
-        search_query = st.text_input(
-            "Search",
-            placeholder="Search ticker or company...",
-            label_visibility="collapsed",
-            key="holdings_search_input"
-        )
-
-    # Filter by search (search both ticker and holding name/company)
-    filtered_df = holdings_df.copy()
-    if search_query:
-        ticker_mask = filtered_df['Ticker'].str.contains(search_query, case=False, na=False)
-        # Support both old "Holding Name" and new "Company" column names
-        company_col = 'Company' if 'Company' in filtered_df.columns else 'Holding Name'
-        name_mask = filtered_df[company_col].str.contains(search_query, case=False, na=False) if company_col in filtered_df.columns else pd.Series([False] * len(filtered_df))
-        filtered_df = filtered_df[ticker_mask | name_mask]
-
-    # Table header using st.columns (same widths as data rows for alignment)
-    h1, h2, h3, h4 = st.columns([1.2, 2.5, 1, 1.5])
-    with h1:
-        st.markdown('<div class="holdings-header">Ticker</div>', unsafe_allow_html=True)
-    with h2:
-        st.markdown('<div class="holdings-header">Company</div>', unsafe_allow_html=True)
-    with h3:
-        st.markdown('<div class="holdings-header text-right">Weight</div>', unsafe_allow_html=True)
-    with h4:
-        st.markdown('<div class="holdings-header text-right">Market Value</div>', unsafe_allow_html=True)
-
-    # Divider line
-    st.markdown('<hr class="holdings-divider">', unsafe_allow_html=True)
-
-    # Data rows
-    for row_num, (idx, row) in enumerate(filtered_df.iterrows()):
-        ticker = str(row["Ticker"])
-        # Support both old "Holding Name" and new "Company" column names
-        company_name = str(row.get("Company", row.get("Holding Name", ""))) if pd.notna(row.get("Company", row.get("Holding Name"))) else ""
-
-        # Support both old "PercentNetAssets" (percentage) and new "Weight" (decimal) formats
-        if "Weight" in row and pd.notna(row.get("Weight")):
-            weight_pct = row["Weight"] * 100  # Convert decimal to percentage
-        elif "PercentNetAssets" in row and pd.notna(row.get("PercentNetAssets")):
-            weight_pct = row["PercentNetAssets"]  # Already a percentage
-        else:
-            weight_pct = 0
-
-        market_val = row.get("MarketValueUSD", 0) if pd.notna(row.get("MarketValueUSD")) else 0
-
-        # Format values
-        weight_str = f"{weight_pct:.2f}%"
-        mv_str = f"${market_val:,.0f}"
+    date_str = file_date.strftime("%b %d, %Y") if file_date else "N/A"
+    st.markdown(f'<p class="dark-card-title">Portfolio Holdings</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="dark-card-subtitle">As of {date_str}</p>', unsafe_allow_html=True)
 
-        # Check if this is the ticker we just visited
-        visited_ticker = st.session_state.get("visited_ticker", "")
-        is_visited = (ticker == visited_ticker)
-
-        c1, c2, c3, c4 = st.columns([1.2, 2.5, 1, 1.5])
-        with c1:
-            st.button(
-                ticker,
-                key=f"ticker_btn_{row_num}",
-                on_click=make_ticker_callback(ticker),
-                help=f"View {ticker} snapshot"
-            )
-        with c2:
-            visited_label = '<span class="just-visited">just visited</span>' if is_visited else ''
-            st.markdown(f'<div class="holdings-cell">{company_name} {visited_label}</div>', unsafe_allow_html=True)
-        with c3:
-            st.markdown(f'<div class="holdings-cell text-right">{weight_str}</div>', unsafe_allow_html=True)
-        with c4:
-            st.markdown(f'<div class="holdings-cell text-right">{mv_str}</div>', unsafe_allow_html=True)
-
-        # Row divider line
-        st.markdown('<hr class="holdings-row-divider">', unsafe_allow_html=True)
-
-    # Footer with count
-    total_value = filtered_df["MarketValueUSD"].sum() if "MarketValueUSD" in filtered_df.columns else 0
-    st.caption(f"Showing {len(filtered_df)} holdings · Total: ${total_value:,.0f}")
+    # Support both old "Holding Name" and new "Company" column names
+    company_col = 'Company' if 'Company' in holdings_df.columns else 'Holding Name'
+    companies = holdings_df[company_col].fillna("").astype(str) if company_col in holdings_df.columns else pd.Series("", index=holdings_df.index)
+    # Support both old "PercentNetAssets" (percentage) and new "Weight" (decimal) formats
+    if "Weight" in holdings_df.columns:
+        weights = holdings_df["Weight"] * 100  # Convert decimal to percentage
+    elif "PercentNetAssets" in holdings_df.columns:
+        weights = holdings_df["PercentNetAssets"]  # Already a percentage
+    else:
+        weights = pd.Series(0.0, index=holdings_df.index)
+    market_values = holdings_df["MarketValueUSD"] if "MarketValueUSD" in holdings_df.columns else pd.Series(0.0, index=holdings_df.index)
+
+    # One component renders the table; search, sorting and scrolling stay in the browser
+    clicked = holdings_table.render(
+        holdings_df["Ticker"].astype(str).tolist(),
+        companies.tolist(),
+        weights.fillna(0).astype(float).tolist(),
+        market_values.fillna(0).astype(float).tolist(),
+        visited=st.session_state.get("visited_ticker", ""),
+        scroll_to=scroll_to,
+        height=620,
+    )
+    if clicked:
+        # Applied before the sidebar widgets exist on the next run (see pending_holdings_click)
+        st.session_state.pending_holdings_click = clicked
+        st.rerun()
 
     st.stop()
 
@@ -3648,10 +3264,7 @@ if st.session_state.view_mode_state == "BUZZ Performance":
     daily_change_abs = current_price - prev_close if current_price and prev_close else 0
 
     # ===== TIMEFRAME CONFIG (needed before hero to calculate period return) =====
-    tf_map = {
-        "1D": ("1d", "5m"), "5D": ("5d", "30m"), "1M": ("1mo", "1h"),
-        "6M": ("6mo", "1d"), "YTD": ("ytd", "1d"), "1Y": ("1y", "1d"), "ALL": ("max", "1d"),
-    }
+    tf_map = timeframes.TIMEFRAMES
     tf_opts = list(tf_map.keys())
 
     tf_key = "buzz_tf"
@@ -3662,42 +3275,31 @@ if st.session_state.view_mode_state == "BUZZ Performance":
     selected_tf = st.session_state.get("buzz_tf_radio", st.session_state[tf_key])
 
     # ===== FETCH CHART DATA (needed before hero to calculate period return) =====
-    @st.cache_data(ttl=300)
-    def fetch_buzz_chart(period, interval, benchmark=None):
-        t_buzz = yf.Ticker("BUZZ")
-        hist = t_buzz.history(period=period, interval=interval)
+    def fetch_buzz_chart(timeframe, benchmark=None):
+        # Derived from the cached intraday/daily series, so timeframe switches cost no network
+        hist = timeframes.chart_history("BUZZ", timeframe)
         if benchmark == "S&P 500":
-            t_sp = yf.Ticker("^GSPC")
-            sp_hist = t_sp.history(period=period, interval=interval)
+            sp_hist = timeframes.chart_history("^GSPC", timeframe)
             hist["Benchmark"] = sp_hist["Close"]
             hist["BenchmarkName"] = "S&P 500"
         elif benchmark == "NASDAQ 100":
-            t_ndx = yf.Ticker("^NDX")
-            ndx_hist = t_ndx.history(period=period, interval=interval)
+            ndx_hist = timeframes.chart_history("^NDX", timeframe)
             hist["Benchmark"] = ndx_hist["Close"]
             hist["BenchmarkName"] = "NASDAQ 100"
         return hist
 
     selected_benchmark = st.session_state.get('buzz_benchmark', None)
-    period, interval = tf_map[selected_tf]
     try:
-        hist = fetch_buzz_chart(period, interval, selected_benchmark)
+        hist = fetch_buzz_chart(selected_tf, selected_benchmark)
     except:
         hist = pd.DataFrame()
 
     # Calculate period metrics for hero display
-    # Fetch daily data for accurate return calculation (matches Yahoo Finance methodology)
+    # First vs last daily close of the period (matches Yahoo Finance methodology), from the daily series
     period_pct = 0
     period_change_abs = 0
     try:
-        # Get daily closing prices for accurate period return
-        # Use one extra day of data to get the close BEFORE the period starts
-        daily_hist = yf.Ticker("BUZZ").history(period=period, interval="1d")
-        if not daily_hist.empty and "Close" in daily_hist.columns and len(daily_hist) >= 2:
-            start_price = daily_hist["Close"].iloc[0]  # First day's close in period
-            end_price = daily_hist["Close"].iloc[-1]  # Last day's close (most recent)
-            period_change_abs = end_price - start_price
-            period_pct = (period_change_abs / start_price * 100) if start_price else 0
+        period_change_abs, period_pct = timeframes.period_return("BUZZ", selected_tf)
     except:
         pass
 
@@ -3812,11 +3414,10 @@ if st.session_state.view_mode_state == "BUZZ Performance":
     with toolbar_col4:
         st.checkbox("vs NDX 100", key="buzz_ndx_check", on_change=on_ndx_change)
 
-    # Re-fetch if timeframe changed (radio selection updates session state)
-    period, interval = tf_map[selected_tf]
+    # Re-derive if timeframe changed (radio selection updates session state)
     selected_benchmark = st.session_state.get('buzz_benchmark', None)
     try:
-        hist = fetch_buzz_chart(period, interval, selected_benchmark)
+        hist = fetch_buzz_chart(selected_tf, selected_benchmark)
     except:
         hist = pd.DataFrame()
 
@@ -3896,17 +3497,7 @@ if st.session_state.view_mode_state == "BUZZ Performance":
         st.caption("Chart data unavailable")
 
     # ===== NEWS SECTION (matching Stock Detail style) =====
-    news_data = []
-    try:
-        t = yf.Ticker("BUZZ")
-        if hasattr(t, 'news'):
-            raw_news = t.news
-            if isinstance(raw_news, list):
-                news_data = raw_news
-            elif isinstance(raw_news, dict) and 'news' in raw_news:
-                news_data = raw_news.get('news', [])
-    except:
-        news_data = []
+    news_data = get_ticker_news("BUZZ")
 
     news_items_html = ""
     if news_data and len(news_data) > 0:
@@ -4151,9 +3742,8 @@ if st.session_state.view_mode_state == "Conviction Ranking":
 
     try:
         # Load conviction data
-        conv_data = load_conviction_data()
+        conv_data = load_conviction_data(file_mtime=history_store.history_mtime(_get_history_path()))
         current_df = conv_data["current_df"]
-        historical_df = conv_data["historical_df"]
         metrics = conv_data["metrics"]
 
         if not current_df.empty:
@@ -4263,7 +3853,7 @@ if st.session_state.view_mode_state == "Conviction Ranking":
                 st.markdown(f'<div class="detail-card"><div class="detail-header"><div><span class="detail-ticker">{selected_ticker}</span> <span class="detail-rank">Rank #{int(detail_row["Rank"])} · {detail_row["Tier"]}</span></div></div><div class="detail-stats"><div><div class="detail-stat-label">Current Score</div><div class="detail-stat-value">{detail_row["Score"]:,.0f}</div></div><div><div class="detail-stat-label">Previous Score</div><div class="detail-stat-value">{prev_score_str}</div></div><div><div class="detail-stat-label">Score Change</div><div class="detail-stat-value {change_class}">{change_sign}{detail_row["Score_Change"]:,.0f}</div></div></div></div>', unsafe_allow_html=True)
 
                 # Historical score chart (TradingView style - same as Snapshot page)
-                ticker_hist = historical_df[historical_df["Ticker"] == selected_ticker].sort_values("Rebalance_date")
+                ticker_hist = load_ticker_rows(selected_ticker).dropna(subset=["Score"])
                 if not ticker_hist.empty:
                     # Prepare data for TradingView chart (needs Close column and DatetimeIndex)
                     chart_df = ticker_hist[["Rebalance_date", "Score"]].copy()
@@ -4294,7 +3884,7 @@ if st.session_state.view_mode_state == "Conviction Ranking":
                         change_sign = "+" if change > 0 else ""
 
                         # Get trend indicator
-                        spark_values = get_sparkline_data(historical_df, ticker, n_periods=12)
+                        spark_values = get_sparkline_data(ticker, n_periods=12)
                         trend = render_trend_indicator(spark_values)
 
                         # Build single-line row
@@ -4418,12 +4008,13 @@ if st.session_state.view_mode_state == "Monthly Turnover":
             import plotly.graph_objects as go
 
             fig = go.Figure()
+            chart_df = downsample.lttb(turnover_df, downsample.line_budget(), column='Monthly_Turnover_Rate_Percent')
 
             # Add main turnover line - BLUE to match Snapshot
             fig.add_trace(
                 go.Scatter(
-                    x=turnover_df['Rebalance_date'],
-                    y=turnover_df['Monthly_Turnover_Rate_Percent'],
+                    x=chart_df['Rebalance_date'],
+                    y=chart_df['Monthly_Turnover_Rate_Percent'],
                     mode='lines',
                     line=dict(color='#7AA2FF', width=2),
                     fill='tozeroy',
@@ -4835,51 +4426,20 @@ if st.session_state.view_mode_state == "BUZZ Heatmap":
 # Helper functions for metrics
 # -----------------------------
 
-@st.cache_data
-def load_historical_weight_data():
-    """
-    Load BuzzIndex_historical.csv and return the full DataFrame for weight calculations.
-    Weight column is parsed as float. Only rows with non-zero weights are included.
-    """
-    try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        df = pd.read_csv(csv_path)
-
-        # Normalize ticker names (FB -> META)
-        df['Ticker'] = df['Ticker'].replace({'FB': 'META'})
-
-        # Parse Weight as float and filter out zero/null values
-        df['Weight'] = pd.to_numeric(df['Weight'], errors='coerce')
-        df = df[df['Weight'].notna() & (df['Weight'] > 0)]
-
-        # Parse Rebalance_date (DD/MM/YYYY format)
-        df['Rebalance_date'] = pd.to_datetime(df['Rebalance_date'], format='%d/%m/%Y')
-
-        return df
-    except Exception as e:
-        return pd.DataFrame()
-
-
 def get_first_appearance_date(ticker: str) -> str:
     """
     Get the first date a ticker appeared in the BUZZ Index.
     Returns formatted date string (e.g., "Aug 18, 2016") or "N/A" if not found.
     """
-    df = load_historical_weight_data()
-
-    if df.empty:
+    try:
+        summary = load_ticker_summary(ticker)
+    except Exception:
         return "N/A"
 
-    # Filter for this ticker only
-    ticker_df = df[df['Ticker'] == ticker].copy()
-
-    if ticker_df.empty:
+    if summary is None or summary["first_date"] is None:
         return "N/A"
 
-    # Find the earliest rebalance date
-    first_date = ticker_df['Rebalance_date'].min()
-
-    return first_date.strftime("%b %d, %Y")
+    return summary["first_date"].strftime("%b %d, %Y")
 
 
 def get_historical_weight_range(ticker: str) -> dict:
@@ -4893,35 +4453,23 @@ def get_historical_weight_range(ticker: str) -> dict:
         - max_date: str (date when max occurred)
         - range_str: str (formatted display string, e.g., "0.50% – 3.00%")
     """
-    df = load_historical_weight_data()
-
-    if df.empty:
-        return {'range_str': 'N/A', 'min_weight': None, 'max_weight': None,
-                'min_date': None, 'max_date': None}
-
-    # Filter for this ticker only
-    ticker_df = df[df['Ticker'] == ticker].copy()
-
-    if ticker_df.empty:
-        return {'range_str': 'N/A', 'min_weight': None, 'max_weight': None,
-                'min_date': None, 'max_date': None}
-
-    # Find min and max weights (Weight is stored as decimal, e.g., 0.03 = 3%)
-    min_idx = ticker_df['Weight'].idxmin()
-    max_idx = ticker_df['Weight'].idxmax()
+    empty = {'range_str': 'N/A', 'min_weight': None, 'max_weight': None,
+             'min_date': None, 'max_date': None}
+    try:
+        summary = load_ticker_summary(ticker)
+    except Exception:
+        return empty
 
-    min_weight = ticker_df.loc[min_idx, 'Weight']
-    max_weight = ticker_df.loc[max_idx, 'Weight']
-    min_date = ticker_df.loc[min_idx, 'Rebalance_date']
-    max_date = ticker_df.loc[max_idx, 'Rebalance_date']
+    if summary is None or summary['min_weight'] is None:
+        return empty
 
     # Convert decimal to percentage (0.03 -> 3.00)
-    min_pct = min_weight * 100
-    max_pct = max_weight * 100
+    min_pct = summary['min_weight'] * 100
+    max_pct = summary['max_weight'] * 100
 
     # Format dates
-    min_date_str = min_date.strftime("%b %d, %Y")
-    max_date_str = max_date.strftime("%b %d, %Y")
+    min_date_str = summary['min_weight_date'].strftime("%b %d, %Y")
+    max_date_str = summary['max_weight_date'].strftime("%b %d, %Y")
 
     # Create display string with en-dash
     range_str = f"{min_pct:.2f}% – {max_pct:.2f}%"
@@ -4935,77 +4483,18 @@ def get_historical_weight_range(ticker: str) -> dict:
     }
 
 
-@st.cache_data
-def load_historical_buzz_data():
+def get_max_consecutive_months(ticker: str) -> int:
     """
-    Load and process BuzzIndex_historical.csv for calculating max consecutive months.
-    Returns a dictionary mapping ticker -> max consecutive months held.
+    Get the CURRENT consecutive months held for a ticker from historical data.
+    Counts backwards from the ticker's most recent month until hitting a gap
+    (precomputed for all tickers by the history store's tenure engine).
     """
     try:
-        csv_path = _get_data_dir() / "BuzzIndex_historical.csv"
-        df = pd.read_csv(csv_path)
-
-        # Normalize ticker names for companies that changed names
-        # FB -> META (Facebook rebranded to Meta in 2021)
-        df['Ticker'] = df['Ticker'].replace({'FB': 'META'})
-
-        # Convert Rebalance_date to datetime (format is DD/MM/YYYY)
-        df['Rebalance_date'] = pd.to_datetime(df['Rebalance_date'], format='%d/%m/%Y')
-
-        # Sort by ticker and date
-        df = df.sort_values(['Ticker', 'Rebalance_date'])
-
-        # Calculate max consecutive months for each ticker
-        results = {}
-        for ticker in df['Ticker'].unique():
-            ticker_df = df[df['Ticker'] == ticker]
-            max_months = calculate_max_consecutive_months_for_ticker(ticker_df)
-            results[ticker] = max_months
-
-        return results
+        summary = load_ticker_summary(ticker)
     except Exception as e:
         st.warning(f"Could not load historical BUZZ data: {e}")
-        return {}
-
-def calculate_max_consecutive_months_for_ticker(ticker_df):
-    """
-    Calculate the CURRENT consecutive months a ticker has been held.
-    Counts backwards from the most recent date until hitting a gap.
-    """
-    if len(ticker_df) == 0:
         return 0
-
-    # Get sorted dates for this ticker
-    dates = ticker_df['Rebalance_date'].sort_values().values
-
-    if len(dates) == 1:
-        return 1
-
-    # Start from the most recent date and count backwards
-    current_consecutive = 1
-
-    # Count backwards from the most recent date
-    for i in range(len(dates) - 1, 0, -1):
-        current_date = pd.Timestamp(dates[i])
-        prev_date = pd.Timestamp(dates[i-1])
-        days_diff = (current_date - prev_date).days
-
-        # Consider it consecutive if difference is between 25 and 35 days (approximately 1 month)
-        if 25 <= days_diff <= 35:
-            current_consecutive += 1
-        else:
-            # Hit a gap - stop counting
-            break
-
-    return current_consecutive
-
-def get_max_consecutive_months(ticker: str) -> int:
-    """
-    Get the CURRENT consecutive months held for a ticker from historical data.
-    Counts backwards from the most recent month until hitting a gap.
-    """
-    historical_data = load_historical_buzz_data()
-    return historical_data.get(ticker, 0)
+    return summary["current_streak"] if summary else 0
 
 def compute_consecutive_months(df_all: pd.DataFrame, ticker: str) -> int:
     """
@@ -5145,9 +4634,32 @@ def render_snapshot_page(ticker: str, df: pd.DataFrame, desc_map: dict):
             help="Return to All Holdings"
         )
 
-    # ===== FETCH DATA =====
-    info = get_ticker_info(ticker)
-    price_data = get_ticker_price_data(ticker)
+    # ===== TIMEFRAME CONFIG (needed before fetching to pick chart/hero periods) =====
+    tf_map = timeframes.TIMEFRAMES
+
+    tf_key = f"snap_tf_{ticker}"
+    if tf_key not in st.session_state:
+        st.session_state[tf_key] = "1D"
+
+    # Read from radio widget key first (has latest value after click)
+    selected_tf = st.session_state.get(f"tf_radio_{ticker}", st.session_state[tf_key])
+
+    # ===== FETCH DATA (all independent fetches run concurrently) =====
+
+    key_metrics_future = fetch_pool.submit(get_ticker_key_metrics, ticker)
+    live_data_future = fetch_pool.submit(get_ticker_live_data, ticker)
+    price_future = fetch_pool.submit(get_ticker_price_data, ticker)
+    # The hero shows price_data's daily change on 1D, so only longer timeframes need the period return
+    period_return_future = None
+    if selected_tf != "1D":
+        period_return_future = fetch_pool.submit(timeframes.period_return, ticker, selected_tf)
+    chart_tf = selected_tf
+    chart_future = fetch_pool.submit(timeframes.chart_history, ticker, chart_tf)
+    news_future = fetch_pool.submit(get_ticker_news, ticker)
+
+    # Same merge as get_ticker_info: live data overrides key metrics
+    info = {**fetch_pool.result_or(key_metrics_future, {}), **fetch_pool.result_or(live_data_future, {})}
+    price_data = fetch_pool.result_or(price_future, {"price": None, "pct_change": 0.0, "valid": False})
 
     company_name = info.get("shortName") or info.get("longName") or ""
     current_price = price_data.get("price") if price_data.get("valid") else None
@@ -5157,32 +4669,14 @@ def render_snapshot_page(ticker: str, df: pd.DataFrame, desc_map: dict):
     if current_price and daily_pct_change:
         daily_change_abs = current_price - (current_price / (1 + daily_pct_change / 100))
 
-    # ===== TIMEFRAME CONFIG (needed before hero to calculate period return) =====
-    tf_map = {
-        "1D": ("1d", "5m"), "5D": ("5d", "30m"), "1M": ("1mo", "1h"),
-        "6M": ("6mo", "1d"), "YTD": ("ytd", "1d"), "1Y": ("1y", "1d"), "ALL": ("max", "1d"),
-    }
-
-    tf_key = f"snap_tf_{ticker}"
-    if tf_key not in st.session_state:
-        st.session_state[tf_key] = "1D"
-
-    # Read from radio widget key first (has latest value after click)
-    selected_tf = st.session_state.get(f"tf_radio_{ticker}", st.session_state[tf_key])
-    period, interval = tf_map[selected_tf]
-
     # Calculate period return for hero display (using historical close prices to match Yahoo Finance)
     period_pct = 0
     period_change_abs = 0
-    try:
-        daily_hist = yf.Ticker(ticker).history(period=period, interval="1d")
-        if not daily_hist.empty and "Close" in daily_hist.columns and len(daily_hist) >= 2:
-            start_price = daily_hist["Close"].iloc[0]
-            end_price = daily_hist["Close"].iloc[-1]
-            period_change_abs = end_price - start_price
-            period_pct = (period_change_abs / start_price * 100) if start_price else 0
-    except:
-        pass
+    if period_return_future is not None:
+        try:
+            period_change_abs, period_pct = period_return_future.result()
+        except:
+            pass
 
     # ===== BUILD HERO =====
     # Use daily change for 1D, period change for other timeframes
@@ -5264,20 +4758,20 @@ def render_snapshot_page(ticker: str, df: pd.DataFrame, desc_map: dict):
                 label_visibility="collapsed"
             )
 
-        # Fetch chart data
-        @st.cache_data(ttl=300)
-        def fetch_chart(tkr, period, interval):
-            return yf.Ticker(tkr).history(period=period, interval=interval)
-
-        period, interval = tf_map[selected_tf]
+        # Chart data was fetched up front; a different radio value is derived from the same local series
         try:
-            hist = fetch_chart(ticker, period, interval)
+            hist = chart_future.result() if selected_tf == chart_tf else timeframes.chart_history(ticker, selected_tf)
         except:
             hist = pd.DataFrame()
 
         if not hist.empty and "Close" in hist.columns:
             # Use TradingView Lightweight Charts with drag-to-measure
-            render_tradingview_chart(hist, chart_type=selected_chart_type, chart_id=f"snapshot_{ticker}", height=540)
+            measured = render_tradingview_chart(hist, chart_type=selected_chart_type, chart_id=f"snapshot_{ticker}", height=540)
+            if measured:
+                st.caption(
+                    f"Measured {measured['from'][:16].replace('T', ' ')} → {measured['to'][:16].replace('T', ' ')}: "
+                    f"{measured['pctChange']:+.2f}% (${abs(measured['toPrice'] - measured['fromPrice']):.2f})"
+                )
 
             # Stats strip - changes based on timeframe
             if selected_tf == "1D":
@@ -5403,22 +4897,7 @@ def render_snapshot_page(ticker: str, df: pd.DataFrame, desc_map: dict):
         ''', unsafe_allow_html=True)
 
     # ===== NEWS SECTION (full width, outside columns) =====
-    # Fetch news - try multiple yfinance methods
-    news_data = []
-    try:
-        t = yf.Ticker(ticker)
-        if hasattr(t, 'news'):
-            raw_news = t.news
-            if isinstance(raw_news, list):
-                news_data = raw_news
-            elif isinstance(raw_news, dict) and 'news' in raw_news:
-                news_data = raw_news.get('news', [])
-            elif isinstance(raw_news, dict):
-                news_data = list(raw_news.values()) if raw_news else []
-        if not news_data and hasattr(t, 'get_news'):
-            news_data = t.get_news() or []
-    except Exception:
-        news_data = []
+    news_data = fetch_pool.result_or(news_future, [])
 
     # Build news items HTML
     news_items_html = ""
@@ -5645,16 +5124,8 @@ def render_stock_chart(ticker: str):
     """
     import plotly.graph_objects as go
 
-    # Timeframe configuration (same as BUZZ Performance chart)
-    tf_map = {
-        "1D": dict(period="1d", interval="5m"),
-        "5D": dict(period="5d", interval="30m"),
-        "1M": dict(period="1mo", interval="1h"),
-        "6M": dict(period="6mo", interval="1d"),
-        "1Y": dict(period="1y", interval="1d"),
-        "YTD": dict(period="ytd", interval="1d"),
-        "ALL": dict(period="max", interval="1d"),
-    }
+    # Timeframe options (same timeframes as BUZZ Performance chart)
+    tf_options = ["1D", "5D", "1M", "6M", "1Y", "YTD", "ALL"]
 
     # Session state key unique to this ticker's chart
     tf_key = f"stock_chart_tf_{ticker}"
@@ -5662,26 +5133,17 @@ def render_stock_chart(ticker: str):
         st.session_state[tf_key] = "1D"
 
     tf_choice = st.session_state[tf_key]
-    tf_sel = tf_map[tf_choice]
-
-    # Fetch stock data
-    @st.cache_data(ttl=300)  # Cache for 5 minutes
-    def get_stock_history(tkr: str, period: str, interval: str) -> pd.DataFrame:
-        t = yf.Ticker(tkr)
-        hist = t.history(period=period, interval=interval)
-        return hist
 
-    @st.cache_data(ttl=300)
+    # Stock data, derived from the symbol's cached intraday/daily series
     def get_daily_prices(tkr: str) -> tuple[float | None, float | None]:
         """Get yesterday's close and today's price from daily data to match title area."""
-        t = yf.Ticker(tkr)
-        hist = t.history(period="1mo", interval="1d")
+        hist = timeframes.daily_history(tkr, "1M")
         if len(hist) >= 2:
             return hist["Close"].iloc[-2], hist["Close"].iloc[-1]
         return None, None
 
     try:
-        hist = get_stock_history(ticker, tf_sel["period"], tf_sel["interval"])
+        hist = timeframes.chart_history(ticker, tf_choice)
     except Exception as exc:
         st.error(f"Failed to load stock data: {exc}")
         return
@@ -5712,7 +5174,7 @@ def render_stock_chart(ticker: str):
     fill_color = "rgba(0, 200, 5, 0.1)" if pct_change >= 0 else "rgba(255, 82, 82, 0.1)"
 
     # Timeframe selector
-    st.radio("Timeframe", list(tf_map.keys()), index=list(tf_map.keys()).index(tf_choice), horizontal=True, key=tf_key)
+    st.radio("Timeframe", tf_options, index=tf_options.index(tf_choice), horizontal=True, key=tf_key)
 
     # Display metrics row with custom styling for percentage
     pct_color = "#00C805" if pct_change >= 0 else "#FF5252"
@@ -5738,13 +5200,14 @@ def render_stock_chart(ticker: str):
         </div>
     ''', unsafe_allow_html=True)
 
-    # Create chart
+    # Create chart (long ranges are reduced to the line's point budget)
+    chart_hist = downsample.lttb(hist, downsample.line_budget())
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
-            x=hist.index,
-            y=hist["Close"],
+            x=chart_hist.index,
+            y=chart_hist["Close"],
             mode="lines",
             line=dict(color=line_color, width=2),
             fill="tozeroy",
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Build every derived BUZZ artifact from BuzzIndex_historical.csv in one pass.
+
+The history is parsed once (through the shared history store) and each
+artifact is written as a CSV next to it. A manifest records the content hash
+of the history file each artifact was built from, so unchanged artifacts are
+skipped, make-style. The dashboard loads finished artifacts with
+load_artifact() and only falls back to computing in-process when an artifact
+is missing or stale.
+
+Usage:
+    python buzz_build.py                     # rebuild stale artifacts
+    python buzz_build.py --force             # rebuild everything
+    python buzz_build.py turnover dominance  # only these artifacts
+    python buzz_build.py --list              # show artifact status
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import generate_conviction_ranking
+import generate_monthly_turnover
+from history_matrix import load_history_matrix
+from history_store import HISTORY_FILENAME, load_history, load_ticker_index
+
+MANIFEST_FILENAME = "buzz_build_manifest.json"
+
+
+# -----------------------------
+# Artifact builders
+# -----------------------------
+def _build_turnover(source: Path) -> pd.DataFrame:
+    return generate_monthly_turnover.compute_turnover(source)
+
+
+def _build_max_weight(source: Path) -> pd.DataFrame:
+    df = load_history(source)
+    df = df[~df['Ticker'].isin(generate_conviction_ranking.EXCLUDED_TICKERS)]
+    return generate_conviction_ranking.count_max_weight(df).sort_values('Max Weight Count', ascending=False)
+
+
+def _build_dominance(source: Path) -> pd.DataFrame:
+    matrix = load_history_matrix(source)
+    leaders = pd.DataFrame({"date": matrix.dates, "leader": matrix.leaders()})
+    return leaders.dropna(subset=["leader"])
+
+
+def _build_rank_history(source: Path) -> pd.DataFrame:
+    matrix = load_history_matrix(source)
+    date_idx, ticker_idx = np.nonzero(matrix.rank > 0)
+    ranking_df = pd.DataFrame({
+        "Date": matrix.dates[date_idx],
+        "Ticker": matrix.tickers[ticker_idx],
+        "Rank": matrix.rank[date_idx, ticker_idx],
+        "Score": matrix.score[date_idx, ticker_idx],
+    })
+    return ranking_df.sort_values(["Date", "Rank"])
+
+
+def _build_ticker_summary(source: Path) -> pd.DataFrame:
+    summary = load_ticker_index(source)["summary"]
+    rows = [
+        {k: v for k, v in entry.items() if k not in ("row_start", "row_stop")} | {"ticker": ticker}
+        for ticker, entry in summary.items()
+    ]
+    columns = ["ticker", "first_date", "last_date", "months_held", "current_streak", "longest_streak",
+               "stints", "min_weight", "min_weight_date", "max_weight", "max_weight_date"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+# name -> (output file, builder, version, date columns)
+# Bump an artifact's version when its builder changes so it is rebuilt.
+ARTIFACTS = {
+    "turnover": (generate_monthly_turnover.OUTPUT_FILENAME, _build_turnover, 1, ["Rebalance_date"]),
+    "max_weight": (generate_conviction_ranking.OUTPUT_FILENAME, _build_max_weight, 1, []),
+    "dominance": ("BUZZ_Dominance_Leaders.csv", _build_dominance, 1, ["date"]),
+    "rank_history": ("BUZZ_Rank_History.csv", _build_rank_history, 1, ["Date"]),
+    "ticker_summary": ("BUZZ_Ticker_Summary.csv", _build_ticker_summary, 1,
+                       ["first_date", "last_date", "min_weight_date", "max_weight_date"]),
+}
+
+
+# -----------------------------
+# Manifest / freshness
+# -----------------------------
+_lock = threading.Lock()
+_digests: dict[tuple[str, int, int], str] = {}
+_statuses: dict[tuple[str, int, str], dict[str, bool]] = {}
+_loaded: dict[tuple[str, int], pd.DataFrame] = {}
+_summaries: dict[tuple[str, int], dict[str, dict]] = {}
+
+
+def _source_digest(source: Path) -> str:
+    """sha256 of the history file, memoized per (mtime, size)."""
+    stat = source.stat()
+    key = (str(source), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        digest = _digests.get(key)
+    if digest is None:
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        with _lock:
+            _digests[key] = digest
+    return digest
+
+
+def _input_key(digest: str, name: str) -> str:
+    return f"{digest}:v{ARTIFACTS[name][2]}"
+
+
+def _manifest_mtime(data_dir: Path) -> int:
+    try:
+        return (data_dir / MANIFEST_FILENAME).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _manifest_text(data_dir: Path) -> str:
+    try:
+        return (data_dir / MANIFEST_FILENAME).read_text()
+    except OSError:
+        return ""
+
+
+def _read_manifest(data_dir: Path) -> dict:
+    try:
+        return json.loads(_manifest_text(data_dir))
+    except ValueError:
+        return {"artifacts": {}}
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def artifact_status(data_dir: Path) -> dict[str, bool]:
+    """
+    name -> True if the artifact exists and was built from the current history
+    file. Memoized per (manifest mtime, history digest), so repeated loads do
+    not re-read the manifest.
+    """
+    data_dir = Path(data_dir)
+    source = data_dir / HISTORY_FILENAME
+    if not source.exists():
+        return {name: False for name in ARTIFACTS}
+    digest = _source_digest(source)
+    key = (str(data_dir), _manifest_mtime(data_dir), digest)
+    with _lock:
+        status = _statuses.get(key)
+    if status is None:
+        built = _read_manifest(data_dir).get("artifacts", {})
+        status = {
+            name: (data_dir / filename).exists() and built.get(name, {}).get("inputs") == _input_key(digest, name)
+            for name, (filename, *_rest) in ARTIFACTS.items()
+        }
+        with _lock:
+            _statuses[key] = status
+    return dict(status)
+
+
+def build(data_dir: Path, names: list[str] | None = None, force: bool = False) -> dict[str, str]:
+    """
+    Build stale (or all, with force) artifacts in `data_dir`.
+    Returns name -> "built" | "up to date".
+    """
+    data_dir = Path(data_dir)
+    source = data_dir / HISTORY_FILENAME
+    names = names or list(ARTIFACTS)
+    status = artifact_status(data_dir)
+    digest = _source_digest(source)
+
+    manifest = _read_manifest(data_dir)
+    results = {}
+    for name in names:
+        if status[name] and not force:
+            results[name] = "up to date"
+            continue
+        filename, builder, _version, _dates = ARTIFACTS[name]
+        frame = builder(source)
+        _write_atomic(data_dir / filename, lambda p: frame.to_csv(p, index=False))
+        if name == "max_weight":
+            # Lets generate_conviction_ranking.py --incremental continue from this build
+            generate_conviction_ranking.write_state(data_dir / filename, load_history(source)['Rebalance_date'].max())
+        manifest.setdefault("artifacts", {})[name] = {
+            "file": filename,
+            "inputs": _input_key(digest, name),
+        }
+        results[name] = "built"
+
+    if any(r == "built" for r in results.values()):
+        manifest["source"] = {"file": HISTORY_FILENAME, "sha256": digest}
+        text = json.dumps(manifest, indent=2) + "\n"
+        # Content-only manifest (no timestamps): a rebuild from the same history leaves it untouched
+        if text != _manifest_text(data_dir):
+            _write_atomic(data_dir / MANIFEST_FILENAME, lambda p: p.write_text(text))
+    return results
+
+
+def load_artifact(data_dir: Path, name: str) -> pd.DataFrame | None:
+    """
+    Load a finished artifact, or None if it is missing or was built from a
+    different history file. Loaded frames are memoized per file mtime; the
+    returned frame is a shallow copy and must be treated as read-only.
+    """
+    data_dir = Path(data_dir)
+    try:
+        if not artifact_status(data_dir).get(name):
+            return None
+        filename, _builder, _version, date_cols = ARTIFACTS[name]
+        path = data_dir / filename
+        key = (str(path), path.stat().st_mtime_ns)
+        with _lock:
+            frame = _loaded.get(key)
+        if frame is None:
+            # Only empty cells are missing; tickers such as "NA" must stay strings
+            frame = pd.read_csv(path, parse_dates=date_cols, keep_default_na=False, na_values=[""])
+            with _lock:
+                _loaded[key] = frame
+        return frame.copy(deep=False)
+    except (OSError, ValueError):
+        return None
+
+
+def load_ticker_summaries(data_dir: Path) -> dict[str, dict] | None:
+    """
+    The ticker_summary artifact as {ticker: summary dict} (same keys as the
+    history store's ticker index, minus row offsets), or None if it is not fresh.
+    """
+    frame = load_artifact(data_dir, "ticker_summary")
+    if frame is None:
+        return None
+    path = Path(data_dir) / ARTIFACTS["ticker_summary"][0]
+    key = (str(path), path.stat().st_mtime_ns)
+    with _lock:
+        summaries = _summaries.get(key)
+    if summaries is None:
+        records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        summaries = {record.pop("ticker"): record for record in records}
+        with _lock:
+            _summaries[key] = summaries
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("artifacts", nargs="*", metavar="artifact",
+                        help=f"artifacts to build (default: all). One of: {', '.join(ARTIFACTS)}")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    parser.add_argument("--list", action="store_true", help="show artifact status and exit")
+    parser.add_argument("--data-dir", type=Path, default=Path(__file__).resolve().parent,
+                        help="folder containing BuzzIndex_historical.csv (default: this folder)")
+    args = parser.parse_args()
+    unknown = sorted(set(args.artifacts) - set(ARTIFACTS))
+    if unknown:
+        parser.error(f"unknown artifact(s): {', '.join(unknown)}")
+
+    if args.list:
+        for name, fresh in artifact_status(args.data_dir).items():
+            print(f"{'✓' if fresh else '✗'} {name:<15} {ARTIFACTS[name][0]}")
+        return
+
+    results = build(args.data_dir, names=args.artifacts or None, force=args.force)
+    for name, result in results.items():
+        print(f"✓ {name:<15} {result:<11} {ARTIFACTS[name][0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Per-endpoint circuit breakers and a short-lived negative cache for Yahoo calls.
+
+During a rate-limit episode every tier of a fallback chain (v10 -> v7 -> yfinance
+.info -> history ...) fails slowly. A breaker counts consecutive failures per
+endpoint; after FAILURE_THRESHOLD of them it opens and calls are rejected
+immediately with CircuitOpenError for COOL_OFF_SECONDS. After the cool-off a
+single trial call is let through (half-open): success closes the breaker, and
+failure reopens it for another cool-off.
+
+yfinance swallows request errors and returns an empty result instead of raising,
+so call_for_symbol() counts an empty result as a failure for a symbol that has
+returned data before (an unseen symbol may simply have none).
+
+call() also takes a rate_limiter token for the endpoint once the breaker is
+known not to be open, so rejected calls never spend a token.
+
+The negative cache remembers keys whose whole fallback chain came back empty, so
+the page does not retry them on every rerun for NEGATIVE_TTL seconds.
+"""
+
+import threading
+import time
+
+import rate_limiter
+
+FAILURE_THRESHOLD = 3
+COOL_OFF_SECONDS = 60
+NEGATIVE_TTL = 60
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+
+class EmptyResultError(Exception):
+    """Raised when a symbol that has returned data before comes back empty."""
+
+
+class _Breaker:
+    __slots__ = ("failures", "opened_at", "trial_running", "rejected")
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.rejected = 0
+
+
+_lock = threading.Lock()
+_breakers: dict[str, _Breaker] = {}
+_negative: dict = {}  # key -> expires_at
+_known_symbols: set[str] = set()  # symbols that have returned data
+
+
+def allow(endpoint: str) -> bool:
+    """True if a call to `endpoint` may go ahead (closed, or the half-open trial)."""
+    with _lock:
+        breaker = _breakers.setdefault(endpoint, _Breaker())
+        if breaker.opened_at is None:
+            return True
+        if time.time() - breaker.opened_at >= COOL_OFF_SECONDS and not breaker.trial_running:
+            breaker.trial_running = True
+            return True
+        breaker.rejected += 1
+        return False
+
+
+def record_success(endpoint: str) -> None:
+    with _lock:
+        breaker = _breakers.setdefault(endpoint, _Breaker())
+        breaker.failures = 0
+        breaker.opened_at = None
+        breaker.trial_running = False
+
+
+def record_failure(endpoint: str) -> None:
+    with _lock:
+        breaker = _breakers.setdefault(endpoint, _Breaker())
+        breaker.failures += 1
+        if breaker.trial_running or breaker.failures >= FAILURE_THRESHOLD:
+            breaker.opened_at = time.time()
+        breaker.trial_running = False
+
+
+def call(endpoint: str, fn, *args, **kwargs):
+    """
+    fn(*args, **kwargs) guarded by the `endpoint` breaker and rate limit; any exception
+    from fn counts as a failure (RateLimitedError from the limiter does not).
+    """
+    if is_open(endpoint):
+        with _lock:
+            _breakers[endpoint].rejected += 1
+        raise CircuitOpenError(endpoint)
+    rate_limiter.acquire(endpoint)
+    if not allow(endpoint):
+        raise CircuitOpenError(endpoint)
+    try:
+        result = fn(*args, **kwargs)
+    except Exception:
+        record_failure(endpoint)
+        raise
+    record_success(endpoint)
+    return result
+
+
+def call_for_symbol(endpoint: str, symbol: str, fn, *args, **kwargs):
+    """
+    call() for a per-symbol fetch that may report failure as an empty result (None,
+    or len() == 0). Empty for a symbol that has returned data before raises
+    EmptyResultError inside the breaker, so it counts as a failure; empty for an
+    unseen symbol is returned as is.
+    """
+    def checked():
+        result = fn(*args, **kwargs)
+        with _lock:
+            if result is not None and len(result) > 0:
+                _known_symbols.add(symbol)
+            elif symbol in _known_symbols:
+                raise EmptyResultError(f"{endpoint} returned no data for {symbol}")
+        return result
+    return call(endpoint, checked)
+
+
+def is_open(endpoint: str) -> bool:
+    """True while `endpoint` is rejecting calls (does not consume the half-open trial)."""
+    with _lock:
+        breaker = _breakers.get(endpoint)
+        return breaker is not None and breaker.opened_at is not None \
+            and time.time() - breaker.opened_at < COOL_OFF_SECONDS
+
+
+def remember_empty(key) -> None:
+    """Negative-cache `key` for NEGATIVE_TTL seconds."""
+    with _lock:
+        _negative[key] = time.time() + NEGATIVE_TTL
+
+
+def recently_empty(key) -> bool:
+    """True if `key` came back empty within the last NEGATIVE_TTL seconds."""
+    with _lock:
+        expires = _negative.get(key)
+        if expires is not None and time.time() >= expires:
+            del _negative[key]
+            expires = None
+    return expires is not None
+
+
+def stats() -> dict[str, dict]:
+    """{endpoint: {"state", "failures", "rejected"}} plus the negative-cache size."""
+    with _lock:
+        now = time.time()
+        result = {}
+        for endpoint, breaker in _breakers.items():
+            if breaker.opened_at is None:
+                state = "closed"
+            elif now - breaker.opened_at < COOL_OFF_SECONDS:
+                state = "open"
+            else:
+                state = "half-open"
+            result[endpoint] = {"state": state, "failures": breaker.failures, "rejected": breaker.rejected}
+        result["negative_cache"] = {"size": sum(1 for exp in _negative.values() if exp > now)}
+        return result
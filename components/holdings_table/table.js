@@ -0,0 +1,148 @@
+// All Holdings table custom component.
+//
+// One iframe holds the whole table: search and sorting run client-side, and
+// only the rows inside the scroll viewport (plus OVERSCAN) are in the DOM, so
+// neither the number of holdings nor typing in the search box costs a
+// Streamlit rerun. A ticker click is reported back as the component value.
+
+// Streamlit component protocol (hand-rolled, so the component needs no build step)
+const Streamlit = {
+    send(type, data) {
+        window.parent.postMessage({ isStreamlitMessage: true, type, ...data }, '*');
+    },
+    setFrameHeight(height) {
+        this.send('streamlit:setFrameHeight', { height });
+    },
+    setComponentValue(value) {
+        this.send('streamlit:setComponentValue', { value, dataType: 'json' });
+    },
+};
+
+const ROW_HEIGHT = 41;  // keep in sync with .row in table.css
+const OVERSCAN = 8;
+
+const search = document.getElementById('search');
+const header = document.getElementById('header');
+const viewport = document.getElementById('viewport');
+const spacer = document.getElementById('spacer');
+const rowsEl = document.getElementById('rows');
+const footer = document.getElementById('footer');
+
+let holdings = [];       // [{ticker, company, weight, value}] in the order Python sent
+let view = [];           // filtered + sorted holdings
+let sort = null;         // {key, dir} or null for the original (weight) order
+let visited = '';
+let lastRowsKey = null;
+let lastScrollTo = null;
+let clicks = 0;
+
+const escapeHtml = (s) => String(s).replace(/[&<>"']/g, ch => (
+    { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[ch]
+));
+const fmtWeight = (w) => `${w.toFixed(2)}%`;
+const fmtValue = (v) => `$${Math.round(v).toLocaleString('en-US')}`;
+
+function applyView() {
+    const query = search.value.trim().toLowerCase();
+    view = query
+        ? holdings.filter(h => h.ticker.toLowerCase().includes(query) || h.company.toLowerCase().includes(query))
+        : holdings.slice();
+    if (sort) {
+        const { key, dir } = sort;
+        view.sort((a, b) => (typeof a[key] === 'string' ? a[key].localeCompare(b[key]) : a[key] - b[key]) * dir);
+    }
+    for (const cell of header.querySelectorAll('.sortable')) {
+        cell.classList.toggle('sorted-asc', !!sort && sort.key === cell.dataset.sort && sort.dir === 1);
+        cell.classList.toggle('sorted-desc', !!sort && sort.key === cell.dataset.sort && sort.dir === -1);
+    }
+    spacer.style.height = `${view.length * ROW_HEIGHT}px`;
+    const total = view.reduce((sum, h) => sum + h.value, 0);
+    footer.textContent = `Showing ${view.length} holdings · Total: ${fmtValue(total)}`;
+    draw();
+}
+
+// Render only the rows that intersect the viewport
+function draw() {
+    const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(view.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+    rowsEl.style.transform = `translateY(${first * ROW_HEIGHT}px)`;
+    rowsEl.innerHTML = view.slice(first, last).map(h => `
+        <div class="row">
+            <div class="cell ticker"><button class="ticker-btn" data-ticker="${escapeHtml(h.ticker)}" title="View ${escapeHtml(h.ticker)} snapshot">${escapeHtml(h.ticker)}</button></div>
+            <div class="cell company">${escapeHtml(h.company)}${h.ticker === visited ? '<span class="just-visited">just visited</span>' : ''}</div>
+            <div class="cell weight num">${fmtWeight(h.weight)}</div>
+            <div class="cell value num">${fmtValue(h.value)}</div>
+        </div>`).join('');
+}
+
+function scrollToTicker(ticker) {
+    const index = view.findIndex(h => h.ticker === ticker);
+    if (index >= 0) {
+        viewport.scrollTop = Math.max(0, (index + 0.5) * ROW_HEIGHT - viewport.clientHeight / 2);
+        draw();
+    }
+}
+
+function render(args) {
+    viewport.style.height = `${args.height}px`;
+
+    // Rebuild the rows only when Python sent different holdings
+    const rowsKey = JSON.stringify(args.rows);
+    if (rowsKey !== lastRowsKey) {
+        lastRowsKey = rowsKey;
+        const { ticker, company, weight, value } = args.rows;
+        holdings = ticker.map((t, i) => ({ ticker: t, company: company[i], weight: weight[i], value: value[i] }));
+    }
+    visited = args.visited;
+    applyView();
+
+    // Bring the holding the user came back from into view (once per request)
+    if (args.scroll_to && args.scroll_to !== lastScrollTo) {
+        scrollToTicker(args.scroll_to);
+    }
+    lastScrollTo = args.scroll_to;
+
+    Streamlit.setFrameHeight(document.body.scrollHeight);
+}
+
+search.addEventListener('input', () => {
+    viewport.scrollTop = 0;
+    applyView();
+});
+
+header.addEventListener('click', (e) => {
+    const cell = e.target.closest('.sortable');
+    if (!cell) return;
+    const key = cell.dataset.sort;
+    // Numbers sort descending first, text ascending; a third click restores the weight order
+    const firstDir = key === 'ticker' || key === 'company' ? 1 : -1;
+    if (!sort || sort.key !== key) sort = { key, dir: firstDir };
+    else if (sort.dir === firstDir) sort = { key, dir: -firstDir };
+    else sort = null;
+    applyView();
+});
+
+let drawPending = false;
+viewport.addEventListener('scroll', () => {
+    if (drawPending) return;
+    drawPending = true;
+    requestAnimationFrame(() => {
+        drawPending = false;
+        draw();
+    });
+});
+
+rowsEl.addEventListener('click', (e) => {
+    const button = e.target.closest('.ticker-btn');
+    if (button) {
+        clicks += 1;
+        Streamlit.setComponentValue({ ticker: button.dataset.ticker, clickId: `${Date.now()}-${clicks}` });
+    }
+});
+
+window.addEventListener('message', (event) => {
+    if (event.data && event.data.type === 'streamlit:render') {
+        render(event.data.args);
+    }
+});
+Streamlit.send('streamlit:componentReady', { apiVersion: 1 });
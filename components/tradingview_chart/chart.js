@@ -0,0 +1,461 @@
+// TradingView Lightweight Charts custom component.
+//
+// The page (and the vendored library) loads once per chart; every Streamlit
+// rerun only posts a "streamlit:render" message with the new args, and the
+// existing chart is updated in place. Series payloads are either full
+// (base === null) or deltas holding the changed last bar and any new bars,
+// applied on top of revision `base`. A delta that doesn't match the revision
+// held here makes the component ask Python for a full resend.
+
+// Streamlit component protocol (hand-rolled, so the component needs no build step)
+const Streamlit = {
+    send(type, data) {
+        window.parent.postMessage({ isStreamlitMessage: true, type, ...data }, '*');
+    },
+    setFrameHeight(height) {
+        this.send('streamlit:setFrameHeight', { height });
+    },
+    setComponentValue(value) {
+        this.send('streamlit:setComponentValue', { value, dataType: 'json' });
+    },
+};
+
+// Payloads arrive column-wise as base64 float64 arrays; rebuild bar objects
+const decodeColumn = (b64) => new Float64Array(Uint8Array.from(atob(b64), ch => ch.charCodeAt(0)).buffer);
+const fromColumns = (payload) => {
+    if (!payload) return null;
+    const columns = {};
+    for (const key in payload.columns) columns[key] = decodeColumn(payload.columns[key]);
+    if (!columns.time) return [];
+    return Array.from(columns.time, (t, i) => {
+        const point = { time: payload.daily ? new Date(t * 1000).toISOString().slice(0, 10) : t };
+        for (const key in columns) {
+            if (key !== 'time') point[key] = columns[key][i];
+        }
+        return point;
+    });
+};
+
+// Chart times as ISO strings: dates for daily bars, UTC timestamps for intraday ones
+const timeToIso = (t) => {
+    if (typeof t === 'number') return new Date(t * 1000).toISOString();
+    if (typeof t === 'string') return t;
+    return `${t.year}-${String(t.month).padStart(2, '0')}-${String(t.day).padStart(2, '0')}`;
+};
+
+const container = document.getElementById('chart-container');
+const ohlcTooltip = document.getElementById('ohlc-tooltip');
+const measureTooltip = document.getElementById('measure-tooltip');
+const measureLine = document.getElementById('measure-line');
+
+let chart = null;
+let avgLine = null;
+let isCandlestick = null;
+let compareName = '';
+let compareColor = '#a78bfa';
+
+// Each series with the bars it holds and the payload revision they correspond to
+const main = { series: null, points: [], revision: null };
+const compare = { series: null, points: [], revision: null };
+
+// Reported back to Python: resend requests and the last measured range
+let generation = null;  // revision of the last full main payload
+let needFull = false;
+let measure = null;
+
+const reportValue = () => Streamlit.setComponentValue({ needFull, generation, measure });
+
+function createChart(height) {
+    // Create chart with dark theme
+    return LightweightCharts.createChart(container, {
+        width: container.clientWidth,
+        height: height,
+        layout: {
+            background: { type: 'solid', color: 'transparent' },
+            textColor: '#9fb2cc',
+            fontSize: 11,
+        },
+        grid: {
+            vertLines: { color: 'rgba(255, 255, 255, 0.03)' },
+            horzLines: { color: 'rgba(255, 255, 255, 0.03)' },
+        },
+        crosshair: {
+            mode: LightweightCharts.CrosshairMode.Magnet,
+            vertLine: {
+                color: 'rgba(122, 162, 255, 0.5)',
+                width: 1,
+                style: LightweightCharts.LineStyle.Dashed,
+                labelBackgroundColor: '#7AA2FF',
+            },
+            horzLine: {
+                color: 'rgba(122, 162, 255, 0.5)',
+                width: 1,
+                style: LightweightCharts.LineStyle.Dashed,
+                labelBackgroundColor: '#7AA2FF',
+            },
+        },
+        timeScale: {
+            borderColor: 'rgba(255, 255, 255, 0.1)',
+            rightOffset: -1,
+            minBarSpacing: 0.5,
+            fixLeftEdge: true,
+            fixRightEdge: true,
+            lockVisibleTimeRangeOnResize: true,
+            visible: true,
+            timeVisible: true,
+            secondsVisible: false,
+        },
+        rightPriceScale: {
+            borderColor: 'rgba(255, 255, 255, 0.1)',
+            scaleMargins: {
+                top: 0.1,
+                bottom: 0.1,
+            },
+        },
+        handleScroll: false,
+        handleScale: false,
+    });
+}
+
+function addMainSeries(candlestick) {
+    if (candlestick) {
+        return chart.addCandlestickSeries({
+            upColor: '#22c55e',
+            downColor: '#ef4444',
+            borderVisible: false,
+            wickUpColor: '#22c55e',
+            wickDownColor: '#ef4444',
+            lastValueVisible: false,
+            priceLineVisible: false,
+        });
+    }
+    return chart.addAreaSeries({
+        lineColor: '#60a5fa',
+        lineWidth: 2,
+        topColor: 'rgba(96, 165, 250, 0.3)',
+        bottomColor: 'rgba(96, 165, 250, 0.02)',
+        crosshairMarkerVisible: true,
+        crosshairMarkerRadius: 4,
+        crosshairMarkerBorderColor: '#60a5fa',
+        crosshairMarkerBackgroundColor: '#fff',
+        lastValueVisible: false,
+        priceLineVisible: false,
+    });
+}
+
+// Force data to fill entire chart width with no empty space
+// Use logical range (bar indices) for precise control
+function fillWidth() {
+    if (main.points.length > 0) {
+        chart.timeScale().setVisibleLogicalRange({
+            from: 0,
+            to: main.points.length - 1
+        });
+    }
+}
+
+// Apply a full or delta payload to `target`; false if the delta isn't based on what it holds
+function applyPayload(payload, target) {
+    const points = fromColumns(payload);
+    if (payload.base === null) {
+        target.series.setData(points);
+        target.points = points;
+    } else if (payload.base === target.revision) {
+        for (const point of points) {
+            target.series.update(point);
+            const last = target.points.length - 1;
+            if (last >= 0 && target.points[last].time === point.time) target.points[last] = point;
+            else target.points.push(point);
+        }
+    } else {
+        return false;
+    }
+    target.revision = payload.revision;
+    return true;
+}
+
+// Shown instead of the chart when the vendored bundle did not load (there is no CDN fallback)
+function renderMissingLibrary(height) {
+    container.style.height = `${height}px`;
+    container.innerHTML = '<div class="library-error">Chart library missing: run <code>python tv_chart.py --vendor</code></div>';
+    Streamlit.setFrameHeight(height);
+}
+
+function render(args) {
+    if (!window.LightweightCharts) {
+        renderMissingLibrary(args.height);
+        return;
+    }
+    container.style.height = `${args.height}px`;
+    container.classList.toggle('no-tooltip', !args.show_tooltip);
+    if (!chart) {
+        chart = createChart(args.height);
+        subscribeEvents();
+    } else {
+        chart.applyOptions({ height: args.height });
+    }
+
+    // Main series (recreated only when switching between candles and line)
+    if (isCandlestick !== args.candlestick) {
+        if (main.series) chart.removeSeries(main.series);
+        main.series = addMainSeries(args.candlestick);
+        main.points = [];
+        main.revision = null;
+        isCandlestick = args.candlestick;
+        avgLine = null;
+    }
+    let complete = applyPayload(args.data, main);
+    if (args.data.base === null) {
+        generation = args.data.revision;
+        measure = null;
+    }
+
+    // Comparison series if provided (area chart with fill)
+    compareName = args.compare_name;
+    compareColor = args.compare_color;
+    if (!args.compare) {
+        if (compare.series) chart.removeSeries(compare.series);
+        compare.series = null;
+        compare.points = [];
+        compare.revision = null;
+    } else {
+        if (!compare.series) {
+            compare.series = chart.addAreaSeries({
+                lineWidth: 2,
+                topColor: 'rgba(167, 139, 250, 0.3)',
+                bottomColor: 'rgba(167, 139, 250, 0.02)',
+                crosshairMarkerVisible: true,
+                crosshairMarkerRadius: 4,
+                crosshairMarkerBackgroundColor: '#fff',
+                lastValueVisible: false,
+                priceLineVisible: false,
+            });
+        }
+        compare.series.applyOptions({ lineColor: compareColor, crosshairMarkerBorderColor: compareColor });
+        complete = applyPayload(args.compare, compare) && complete;
+    }
+
+    // Period average line (only when not comparing)
+    if (avgLine) {
+        main.series.removePriceLine(avgLine);
+        avgLine = null;
+    }
+    if (args.period_avg !== null && !args.compare) {
+        avgLine = main.series.createPriceLine({
+            price: args.period_avg,
+            color: '#f59e0b',
+            lineWidth: 1,
+            lineStyle: LightweightCharts.LineStyle.Dashed,
+            axisLabelVisible: true,
+            title: 'Avg',
+        });
+    }
+
+    fillWidth();
+    Streamlit.setFrameHeight(args.height);
+
+    // Ask for a full resend when a delta didn't fit, and withdraw the request once it arrived
+    if (needFull !== !complete) {
+        needFull = !complete;
+        reportValue();
+    }
+}
+
+function subscribeEvents() {
+    // Tooltip on crosshair move
+    chart.subscribeCrosshairMove((param) => {
+        if (!param.time || !param.point) {
+            ohlcTooltip.style.display = 'none';
+            return;
+        }
+
+        const dataPoint = param.seriesData.get(main.series);
+        if (!dataPoint) {
+            ohlcTooltip.style.display = 'none';
+            return;
+        }
+
+        // Find matching data with pctChange
+        const matchingData = main.points.find(d => d.time === param.time);
+        const pctChange = matchingData ? matchingData.pctChange : 0;
+        const pctClass = pctChange >= 0 ? 'pct-positive' : 'pct-negative';
+        const pctSign = pctChange >= 0 ? '+' : '';
+
+        // Check for comparison data
+        let comparePoint = null;
+        if (compare.series) {
+            comparePoint = param.seriesData.get(compare.series);
+        }
+
+        if (isCandlestick) {
+            ohlcTooltip.innerHTML = `
+                <div class="row"><span class="label">O</span><span class="value">${dataPoint.open.toFixed(2)}</span></div>
+                <div class="row"><span class="label">H</span><span class="value">${dataPoint.high.toFixed(2)}</span></div>
+                <div class="row"><span class="label">L</span><span class="value">${dataPoint.low.toFixed(2)}</span></div>
+                <div class="row"><span class="label">C</span><span class="value">${dataPoint.close.toFixed(2)}</span></div>
+                <div class="row"><span class="label">Chg</span><span class="value ${pctClass}">${pctSign}${pctChange.toFixed(2)}%</span></div>
+            `;
+        } else if (comparePoint) {
+            // Comparison mode - show both values with individual % changes
+            // Values are indexed to 100, so % change = value - 100
+            const mainPct = dataPoint.value - 100;
+            const mainPctClass = mainPct >= 0 ? 'pct-positive' : 'pct-negative';
+            const mainPctSign = mainPct >= 0 ? '+' : '';
+
+            const compPct = comparePoint.value - 100;
+            const compPctClass = compPct >= 0 ? 'pct-positive' : 'pct-negative';
+            const compPctSign = compPct >= 0 ? '+' : '';
+
+            ohlcTooltip.innerHTML = `
+                <div class="header"><span class="col-name"></span><span class="col-value">Price</span><span class="col-chg">Chg</span></div>
+                <div class="row"><span class="col-name label" style="color:#60a5fa">BUZZ</span><span class="col-value value">${dataPoint.value.toFixed(1)}</span><span class="col-chg value ${mainPctClass}">${mainPctSign}${mainPct.toFixed(2)}%</span></div>
+                <div class="row"><span class="col-name label" style="color:${compareColor}">${compareName}</span><span class="col-value value">${comparePoint.value.toFixed(1)}</span><span class="col-chg value ${compPctClass}">${compPctSign}${compPct.toFixed(2)}%</span></div>
+            `;
+        } else {
+            ohlcTooltip.innerHTML = `
+                <div class="row"><span class="label">Price</span><span class="value">${dataPoint.value.toFixed(2)}</span></div>
+                <div class="row"><span class="label">Chg</span><span class="value ${pctClass}">${pctSign}${pctChange.toFixed(2)}%</span></div>
+            `;
+        }
+        ohlcTooltip.style.display = 'block';
+    });
+
+    // Drag-to-measure functionality
+    let isDragging = false;
+    let dragStart = null;
+    let dragStartPrice = null;
+    let dragStartTime = null;
+    let dragRange = null;
+
+    container.addEventListener('mousedown', (e) => {
+        const rect = container.getBoundingClientRect();
+        const x = e.clientX - rect.left;
+        const y = e.clientY - rect.top;
+
+        isDragging = true;
+        dragStart = { x, y, clientX: e.clientX, clientY: e.clientY };
+
+        // Get price and time at start point
+        dragStartPrice = main.series.coordinateToPrice(y);
+        dragStartTime = chart.timeScale().coordinateToTime(x);
+
+        measureLine.style.display = 'block';
+        measureLine.style.left = '0';
+        measureLine.style.top = '0';
+        measureLine.style.width = '100%';
+        measureLine.style.height = '100%';
+    });
+
+    container.addEventListener('mousemove', (e) => {
+        if (!isDragging || !dragStart) return;
+
+        const rect = container.getBoundingClientRect();
+        const x = e.clientX - rect.left;
+        const y = e.clientY - rect.top;
+
+        // Get current price
+        const currentPrice = main.series.coordinateToPrice(y);
+        const currentTime = chart.timeScale().coordinateToTime(x);
+
+        if (dragStartPrice !== null && currentPrice !== null) {
+            const priceDiff = currentPrice - dragStartPrice;
+            const pctChange = (priceDiff / dragStartPrice) * 100;
+            const pctSign = pctChange >= 0 ? '+' : '';
+
+            // Calculate time duration
+            let duration = '';
+            if (dragStartTime && currentTime) {
+                let startTs, endTs;
+                if (typeof dragStartTime === 'string') {
+                    startTs = new Date(dragStartTime).getTime() / 1000;
+                    endTs = new Date(currentTime).getTime() / 1000;
+                } else {
+                    startTs = dragStartTime;
+                    endTs = currentTime;
+                }
+                const diffSecs = Math.abs(endTs - startTs);
+                const days = Math.floor(diffSecs / 86400);
+                const hours = Math.floor((diffSecs % 86400) / 3600);
+                const mins = Math.floor((diffSecs % 3600) / 60);
+
+                if (days > 0) duration = `${days}d ${hours}h`;
+                else if (hours > 0) duration = `${hours}h ${mins}m`;
+                else duration = `${mins}m`;
+            }
+
+            // Draw line
+            const svg = measureLine.querySelector('svg');
+            const color = pctChange >= 0 ? '#22c55e' : '#ef4444';
+            svg.innerHTML = `
+                <line x1="${dragStart.x}" y1="${dragStart.y}" x2="${x}" y2="${y}"
+                      stroke="${color}" stroke-width="2" stroke-dasharray="5,3"/>
+                <circle cx="${dragStart.x}" cy="${dragStart.y}" r="4" fill="${color}"/>
+                <circle cx="${x}" cy="${y}" r="4" fill="${color}"/>
+            `;
+
+            // Position tooltip
+            measureTooltip.innerHTML = `
+                <div class="big">${pctSign}${pctChange.toFixed(2)}%</div>
+                <div>$${Math.abs(priceDiff).toFixed(2)}</div>
+                ${duration ? `<div class="duration">${duration}</div>` : ''}
+            `;
+            measureTooltip.style.display = 'block';
+            // Position tooltip to the left of the line/point
+            const tooltipWidth = measureTooltip.offsetWidth || 100;
+            measureTooltip.style.left = (x - tooltipWidth - 15) + 'px';
+            measureTooltip.style.top = (y - 30) + 'px';
+            measureTooltip.style.background = pctChange >= 0 ? 'rgba(34, 197, 94, 0.95)' : 'rgba(239, 68, 68, 0.95)';
+
+            if (dragStartTime && currentTime) {
+                dragRange = {
+                    from: timeToIso(dragStartTime),
+                    to: timeToIso(currentTime),
+                    fromPrice: dragStartPrice,
+                    toPrice: currentPrice,
+                    pctChange: pctChange,
+                };
+            }
+        }
+    });
+
+    const endDrag = () => {
+        isDragging = false;
+        dragStart = null;
+        dragStartPrice = null;
+        dragStartTime = null;
+        dragRange = null;
+        measureTooltip.style.display = 'none';
+        measureLine.style.display = 'none';
+        measureLine.querySelector('svg').innerHTML = '';
+    };
+
+    // Report a completed measurement back to Python
+    container.addEventListener('mouseup', () => {
+        if (dragRange) {
+            measure = dragRange;
+            reportValue();
+        }
+        endDrag();
+    });
+    container.addEventListener('mouseleave', endDrag);
+
+    // Responsive resize with debounce
+    let resizeTimeout;
+    const resizeObserver = new ResizeObserver(entries => {
+        clearTimeout(resizeTimeout);
+        resizeTimeout = setTimeout(() => {
+            for (let entry of entries) {
+                chart.applyOptions({ width: entry.contentRect.width });
+                fillWidth();
+            }
+        }, 100);
+    });
+    resizeObserver.observe(container);
+}
+
+window.addEventListener('message', (event) => {
+    if (event.data && event.data.type === 'streamlit:render') {
+        render(event.data.args);
+    }
+});
+Streamlit.send('streamlit:componentReady', { apiVersion: 1 });
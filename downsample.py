@@ -0,0 +1,95 @@
+"""
+Point budgets for long-range charts.
+
+A chart cannot show more points than it has pixels, so shipping every daily bar
+of an ALL view only inflates the HTML payload and the browser's render time.
+Series longer than the budget for the chart width are reduced before they are
+serialized:
+
+- lines keep the points picked by Largest-Triangle-Three-Buckets (LTTB), which
+  preserves the visual peaks and troughs of the full series
+- candles are merged into consecutive OHLC buckets (first open, max high, min
+  low, last close, summed volume), so every extreme is still drawn
+
+Series within budget are returned unchanged.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Width the charts are laid out for (wall displays run full-width at 1600px+)
+CHART_WIDTH_PX = 1600
+
+# Pixels per point: a line needs about one, a candle needs room for its body and a gap
+LINE_PX_PER_POINT = 1
+CANDLE_PX_PER_POINT = 4
+
+
+def line_budget(width_px: int = CHART_WIDTH_PX) -> int:
+    return max(3, width_px // LINE_PX_PER_POINT)
+
+
+def candle_budget(width_px: int = CHART_WIDTH_PX) -> int:
+    return max(1, width_px // CANDLE_PX_PER_POINT)
+
+
+def lttb_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Positions of the `threshold` points LTTB keeps from `y` (x is the position).
+    The first and last points are always kept.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    # Interior points split into threshold - 2 buckets; bucket i spans edges[i]:edges[i + 1]
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    # Each bucket is scored against the average of the bucket after it (the last point for the final one)
+    sizes = np.diff(edges, append=n)
+    avg_x = np.add.reduceat(x, edges) / sizes
+    avg_y = np.add.reduceat(y, edges) / sizes
+    keep = np.empty(threshold, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Pick the point forming the largest triangle with the previous pick and that average
+        areas = np.abs((x[a] - avg_x[i + 1]) * (y[start:end] - y[a])
+                       - (x[a] - x[start:end]) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    return keep
+
+
+def lttb(df: pd.DataFrame, threshold: int, column: str = "Close") -> pd.DataFrame:
+    """Rows of `df` picked by LTTB on `column` (NaN rows dropped); unchanged if within budget."""
+    if len(df) <= threshold:
+        return df
+    df = df.dropna(subset=[column])
+    return df.iloc[lttb_indices(df[column].to_numpy(dtype=float), threshold)]
+
+
+def ohlc_buckets(df: pd.DataFrame, buckets: int) -> pd.DataFrame:
+    """
+    `df` merged into `buckets` consecutive OHLC bars, each stamped with its first
+    bar's time. Open/High/Low/Close/Volume aggregate as candles do; any other
+    column keeps its last value. Unchanged if within budget.
+    """
+    if len(df) <= buckets:
+        return df
+    bucket = np.arange(len(df)) * buckets // len(df)
+    agg = {col: "last" for col in df.columns}
+    agg.update({col: how for col, how in
+                {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}.items()
+                if col in df.columns})
+    merged = df.groupby(bucket).agg(agg)
+    merged.index = df.index[np.flatnonzero(np.diff(bucket, prepend=-1))]
+    return merged
+
+
+def for_chart(df: pd.DataFrame, candles: bool, width_px: int = CHART_WIDTH_PX) -> pd.DataFrame:
+    """`df` reduced to the point budget of a `width_px` wide line or candlestick chart."""
+    if candles:
+        return ohlc_buckets(df, candle_budget(width_px))
+    return lttb(df, line_budget(width_px))
@@ -0,0 +1,51 @@
+"""
+Shared thread pool for fanning out independent network fetches.
+
+Pages submit every fetch they need up front and collect the results where they
+render, so page latency tracks the slowest call instead of the sum of all of
+them. The pool lives in an imported module so it survives Streamlit reruns.
+
+Submitted functions run without a Streamlit script context: they may call
+st.cache_data functions (the cache works; only the spinner is skipped) but must
+not write UI elements. They inherit the submitter's context variables, so the
+rate_limiter priority class carries over; background submissions always run as
+rate_limiter.BACKGROUND so they queue behind interactive fetches.
+"""
+
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import rate_limiter
+
+# yfinance and the pooled Yahoo session are I/O bound; keep below yahoo_client.POOL_MAXSIZE
+MAX_WORKERS = 8
+
+# Background refreshes (stale-while-revalidate) get their own small pool so they
+# never take workers away from interactive page fetches
+BACKGROUND_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="buzz-fetch")
+_background = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="buzz-refresh")
+
+
+def submit(fn, *args, **kwargs) -> Future:
+    """Run fn(*args, **kwargs) on the shared pool, in the caller's context."""
+    return _executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def _run_background(fn, *args, **kwargs):
+    with rate_limiter.priority(rate_limiter.BACKGROUND):
+        return fn(*args, **kwargs)
+
+
+def submit_background(fn, *args, **kwargs) -> Future:
+    """Run fn(*args, **kwargs) on the background refresh pool at background priority."""
+    return _background.submit(contextvars.copy_context().run, _run_background, fn, *args, **kwargs)
+
+
+def result_or(future: Future, default=None, timeout: float | None = None):
+    """future.result(), or `default` if the fetch raised or timed out."""
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        return default
@@ -2,64 +2,104 @@
 """
 Generate conviction ranking based on Max Weight Count from BuzzIndex_historical.csv
 Max Weight Count = Number of times a ticker had the maximum weight in the index
+
+Usage:
+    python generate_conviction_ranking.py                # recount every rebalance date
+    python generate_conviction_ranking.py --incremental  # fold in only new rebalance dates
 """
 
+import argparse
+import json
+
 import pandas as pd
 from pathlib import Path
 
-# Read the historical data
-csv_path = Path(__file__).parent / "BuzzIndex_historical.csv"
-df = pd.read_csv(csv_path)
-
-# Normalize ticker names for companies that changed names
-# FB -> META (Facebook rebranded to Meta in 2021)
-df['Ticker'] = df['Ticker'].replace({'FB': 'META'})
+from history_store import HISTORY_FILENAME, load_history
 
 # Remove delisted/private companies
 # TWTR was taken private
-df = df[df['Ticker'] != 'TWTR']
+EXCLUDED_TICKERS = ("TWTR",)
+
+OUTPUT_FILENAME = "BUZZ_Highest_Sentiment_Metric.csv"
+
+
+def _state_path(output_path: Path) -> Path:
+    """Small JSON file recording the last rebalance date folded into the output."""
+    return output_path.with_suffix(".state.json")
+
+
+def write_state(output_path: Path, through: pd.Timestamp) -> None:
+    """Record `through` as the last rebalance date folded into `output_path`."""
+    _state_path(output_path).write_text(json.dumps({"through": through.strftime("%Y-%m-%d")}))
+
+
+def count_max_weight(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count, per ticker, the rebalance dates on which it held the maximum weight.
+    All tickers tied at a date's max weight are counted.
+    """
+    date_max = df.groupby('Rebalance_date')['Weight'].transform('max')
+    hits = df.loc[df['Weight'] == date_max, 'Ticker'].astype(str)
+    counts = hits.groupby(hits, sort=False).size()
+    return pd.DataFrame({'Ticker': counts.index, 'Max Weight Count': counts.to_numpy()})
+
+
+def update_max_weight_counts(csv_path: Path, output_path: Path, incremental: bool = False) -> tuple[pd.DataFrame, int]:
+    """
+    Write max weight counts to `output_path`. In incremental mode only rebalance
+    dates after the last one recorded in the state file are counted and added
+    to the existing totals (falls back to a full recount if there is no state).
+    Returns (results, number of rebalance dates processed).
+    """
+    # Read the normalized historical data (FB -> META, parsed dates)
+    df = load_history(csv_path)
+    df = df[~df['Ticker'].isin(EXCLUDED_TICKERS)]
 
-# Convert Rebalance_date to datetime
-df['Rebalance_date'] = pd.to_datetime(df['Rebalance_date'], format='%d/%m/%Y')
+    state_path = _state_path(output_path)
+    existing = None
+    if incremental and output_path.exists() and state_path.exists():
+        through = pd.Timestamp(json.loads(state_path.read_text())["through"])
+        existing = pd.read_csv(output_path)
+        df = df[df['Rebalance_date'] > through]
 
-# Group by rebalance date and find max weight for each date
-max_weight_counts = {}
+    new_counts = count_max_weight(df)
+    if existing is not None:
+        results_df = (
+            pd.concat([existing, new_counts], ignore_index=True)
+            .groupby('Ticker', sort=False, as_index=False)['Max Weight Count'].sum()
+        )
+    else:
+        results_df = new_counts
 
-for date in df['Rebalance_date'].unique():
-    # Get all tickers for this date
-    date_df = df[df['Rebalance_date'] == date]
+    # Sort by Max Weight Count in descending order
+    results_df = results_df.sort_values('Max Weight Count', ascending=False)
 
-    # Find the maximum weight for this date
-    max_weight = date_df['Weight'].max()
+    n_dates = df['Rebalance_date'].nunique()
+    if existing is None or n_dates:
+        results_df.to_csv(output_path, index=False)
+        if not df.empty:
+            write_state(output_path, df['Rebalance_date'].max())
+    return results_df, n_dates
 
-    # Find all tickers that achieved this maximum weight
-    max_weight_tickers = date_df[date_df['Weight'] == max_weight]['Ticker'].values
 
-    # Increment count for each ticker that hit max weight
-    for ticker in max_weight_tickers:
-        if ticker not in max_weight_counts:
-            max_weight_counts[ticker] = 0
-        max_weight_counts[ticker] += 1
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"only fold rebalance dates newer than the last run into {OUTPUT_FILENAME}")
+    args = parser.parse_args()
 
-# Create results dataframe
-results = []
-for ticker, count in max_weight_counts.items():
-    results.append({
-        'Ticker': ticker,
-        'Max Weight Count': count
-    })
+    base_dir = Path(__file__).parent
+    csv_path = base_dir / HISTORY_FILENAME
+    output_path = base_dir / OUTPUT_FILENAME
 
-results_df = pd.DataFrame(results)
+    results_df, n_dates = update_max_weight_counts(csv_path, output_path, incremental=args.incremental)
 
-# Sort by Max Weight Count in descending order
-results_df = results_df.sort_values('Max Weight Count', ascending=False)
+    print(f"✓ {'Updated' if args.incremental else 'Created'} {output_path.name}")
+    print(f"✓ Analyzed {n_dates} rebalance dates")
+    print(f"✓ Found {len(results_df)} unique tickers")
+    print(f"\nTop 10 Tickers by Max Weight Count:")
+    print(results_df.head(10).to_string(index=False))
 
-# Save to CSV
-output_path = Path(__file__).parent / "BUZZ_Highest_Sentiment_Metric.csv"
-results_df.to_csv(output_path, index=False)
 
-print(f"✓ Created {output_path.name}")
-print(f"✓ Analyzed {len(df['Rebalance_date'].unique())} rebalance dates")
-print(f"✓ Found {len(results_df)} unique tickers")
-print(f"\nTop 10 Tickers by Max Weight Count:")
-print(results_df.head(10).to_string(index=False))
+if __name__ == "__main__":
+    main()
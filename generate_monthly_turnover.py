@@ -4,80 +4,89 @@ Generate Monthly Portfolio Turnover Rate time series from BuzzIndex_historical.c
 
 Portfolio Turnover Rate = (Sum of Absolute Weight Changes) / 2
 This measures the percentage of the portfolio that changes each month.
+
+Usage:
+    python generate_monthly_turnover.py                # rebuild the whole series
+    python generate_monthly_turnover.py --incremental  # only append new rebalance dates
 """
 
+import argparse
+
 import pandas as pd
 from pathlib import Path
 
-# Read the historical data
-csv_path = Path(__file__).parent / "BuzzIndex_historical.csv"
-df = pd.read_csv(csv_path)
-
-# Normalize ticker names for companies that changed names
-df['Ticker'] = df['Ticker'].replace({'FB': 'META'})
+from history_matrix import load_history_matrix
+from history_store import HISTORY_FILENAME
 
 # Remove delisted/private companies
-df = df[df['Ticker'] != 'TWTR']
+EXCLUDED_TICKERS = ("TWTR",)
 
-# Convert Rebalance_date to datetime
-df['Rebalance_date'] = pd.to_datetime(df['Rebalance_date'], format='%d/%m/%Y')
+OUTPUT_FILENAME = "BUZZ_Monthly_Turnover_Time_Series.csv"
 
-# Sort by date
-df = df.sort_values('Rebalance_date')
 
-# Get unique rebalance dates
-dates = sorted(df['Rebalance_date'].unique())
+def compute_turnover(csv_path: Path, after: pd.Timestamp | None = None) -> pd.DataFrame:
+    """
+    Turnover rate (%) for every consecutive pair of rebalance dates, computed
+    on the pivoted weight matrix. With `after`, only rows for rebalance dates
+    newer than `after` are computed.
+    """
+    matrix = load_history_matrix(csv_path)
 
-# Calculate turnover rate for each consecutive pair of dates
-turnover_data = []
+    # Turnover rate is half of the total absolute change
+    # (because each trade involves both a buy and a sell)
+    turnover = matrix.turnover(after=after, exclude=EXCLUDED_TICKERS)
 
-for i in range(1, len(dates)):
-    prev_date = dates[i-1]
-    curr_date = dates[i]
+    return pd.DataFrame({
+        'Rebalance_date': turnover.index,
+        'Monthly_Turnover_Rate_Percent': (turnover.to_numpy() * 100).round(2),
+    })
 
-    # Get portfolios for both dates
-    prev_portfolio = df[df['Rebalance_date'] == prev_date][['Ticker', 'Weight']].set_index('Ticker')
-    curr_portfolio = df[df['Rebalance_date'] == curr_date][['Ticker', 'Weight']].set_index('Ticker')
 
-    # Combine both portfolios to see all tickers
-    all_tickers = set(prev_portfolio.index) | set(curr_portfolio.index)
+def update_turnover(csv_path: Path, output_path: Path, incremental: bool = False) -> tuple[pd.DataFrame, int]:
+    """
+    Write the turnover series to `output_path`. In incremental mode the
+    existing file is kept and only rebalance dates after its last row are
+    appended (the history is assumed to be append-only).
+    Returns (full series, number of newly computed rows).
+    """
+    existing = None
+    if incremental and output_path.exists():
+        existing = pd.read_csv(output_path, parse_dates=['Rebalance_date'])
+        if existing.empty:
+            existing = None
 
-    # Calculate absolute weight changes
-    total_absolute_change = 0
+    last_date = existing['Rebalance_date'].max() if existing is not None else None
+    new_rows = compute_turnover(csv_path, after=last_date)
 
-    for ticker in all_tickers:
-        prev_weight = prev_portfolio.loc[ticker, 'Weight'] if ticker in prev_portfolio.index else 0
-        curr_weight = curr_portfolio.loc[ticker, 'Weight'] if ticker in curr_portfolio.index else 0
+    turnover_df = pd.concat([existing, new_rows], ignore_index=True) if existing is not None else new_rows
+    if existing is None or not new_rows.empty:
+        turnover_df.to_csv(output_path, index=False)
+    return turnover_df, len(new_rows)
 
-        absolute_change = abs(curr_weight - prev_weight)
-        total_absolute_change += absolute_change
 
-    # Turnover rate is half of the total absolute change
-    # (because each trade involves both a buy and a sell)
-    turnover_rate = total_absolute_change / 2
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"only append rebalance dates newer than the last row of {OUTPUT_FILENAME}")
+    args = parser.parse_args()
 
-    # Convert to percentage
-    turnover_rate_pct = turnover_rate * 100
+    base_dir = Path(__file__).parent
+    csv_path = base_dir / HISTORY_FILENAME
+    output_path = base_dir / OUTPUT_FILENAME
 
-    turnover_data.append({
-        'Rebalance_date': curr_date,
-        'Monthly_Turnover_Rate_Percent': round(turnover_rate_pct, 2)
-    })
+    turnover_df, n_new = update_turnover(csv_path, output_path, incremental=args.incremental)
 
-# Create DataFrame
-turnover_df = pd.DataFrame(turnover_data)
+    # Calculate average turnover rate
+    avg_turnover = turnover_df['Monthly_Turnover_Rate_Percent'].mean()
 
-# Calculate average turnover rate
-avg_turnover = turnover_df['Monthly_Turnover_Rate_Percent'].mean()
+    print(f"✓ {'Updated' if args.incremental else 'Created'} {output_path.name} ({n_new} new rows)")
+    print(f"✓ Analyzed {len(turnover_df)} monthly transitions")
+    print(f"✓ Average Monthly Turnover Rate: {avg_turnover:.2f}%")
+    print(f"✓ Min Turnover: {turnover_df['Monthly_Turnover_Rate_Percent'].min():.2f}%")
+    print(f"✓ Max Turnover: {turnover_df['Monthly_Turnover_Rate_Percent'].max():.2f}%")
+    print(f"\nFirst 5 months:")
+    print(turnover_df.head().to_string(index=False))
 
-# Save to CSV
-output_path = Path(__file__).parent / "BUZZ_Monthly_Turnover_Time_Series.csv"
-turnover_df.to_csv(output_path, index=False)
 
-print(f"✓ Created {output_path.name}")
-print(f"✓ Analyzed {len(turnover_df)} monthly transitions")
-print(f"✓ Average Monthly Turnover Rate: {avg_turnover:.2f}%")
-print(f"✓ Min Turnover: {turnover_df['Monthly_Turnover_Rate_Percent'].min():.2f}%")
-print(f"✓ Max Turnover: {turnover_df['Monthly_Turnover_Rate_Percent'].max():.2f}%")
-print(f"\nFirst 5 months:")
-print(turnover_df.head().to_string(index=False))
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Dense rebalance-date x ticker view of the BUZZ index history.
+
+HistoryMatrix holds aligned `dates` and `tickers` axes plus weight, score and
+rank planes as contiguous NumPy arrays, so analytics (turnover, dominance,
+rank history, weight ranges) become array arithmetic instead of repeated
+pandas filtering. Built from the shared history store and memoized per
+history-file modification time.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import history_store
+
+
+@dataclass(frozen=True)
+class HistoryMatrix:
+    """
+    Aligned date x ticker planes (row i = dates[i], column j = tickers[j]).
+
+    - weight: float64, 0.0 where the ticker is not in the index
+    - score:  float64, NaN where the ticker is not in the index
+    - rank:   int32, 1 = highest score on that date (ties keep file order), 0 where absent
+    """
+    dates: np.ndarray
+    tickers: np.ndarray
+    weight: np.ndarray
+    score: np.ndarray
+    rank: np.ndarray
+    _ticker_pos: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @property
+    def present(self) -> np.ndarray:
+        """Boolean membership plane (ticker held on that rebalance date)."""
+        return self.rank > 0
+
+    def date_position(self, date, side: str = "right") -> int:
+        """
+        Row of the latest rebalance date <= `date` (side="right"), or -1 if
+        `date` is before the first rebalance.
+        """
+        return int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(date)), side=side)) - 1
+
+    def ticker_position(self, ticker: str) -> int | None:
+        """Column of `ticker`, or None if it never appeared."""
+        return self._ticker_pos.get(ticker)
+
+    def at(self, date) -> pd.DataFrame:
+        """Holdings as of `date` (latest rebalance <= date): Ticker, Weight, Score, Rank sorted by Rank."""
+        row = self.date_position(date)
+        if row < 0:
+            return pd.DataFrame(columns=["Ticker", "Weight", "Score", "Rank"])
+        held = np.flatnonzero(self.rank[row] > 0)
+        out = pd.DataFrame({
+            "Ticker": self.tickers[held],
+            "Weight": self.weight[row, held],
+            "Score": self.score[row, held],
+            "Rank": self.rank[row, held],
+        })
+        return out.sort_values("Rank").reset_index(drop=True)
+
+    def for_ticker(self, ticker: str) -> pd.DataFrame:
+        """Weight, Score, Rank for one ticker on every rebalance date it was held (date index)."""
+        col = self.ticker_position(ticker)
+        if col is None:
+            return pd.DataFrame(columns=["Weight", "Score", "Rank"], index=pd.DatetimeIndex([], name="Rebalance_date"))
+        held = self.rank[:, col] > 0
+        return pd.DataFrame(
+            {"Weight": self.weight[held, col], "Score": self.score[held, col], "Rank": self.rank[held, col]},
+            index=pd.DatetimeIndex(self.dates[held], name="Rebalance_date"),
+        )
+
+    def turnover(self, after=None, exclude: tuple[str, ...] = ()) -> pd.Series:
+        """
+        Portfolio turnover between consecutive rebalances, 0.5 * sum(|W_t - W_{t-1}|),
+        as a fraction indexed by the later rebalance date.
+
+        - after: only compute rows for rebalance dates strictly after this date
+        - exclude: tickers to leave out (e.g. delisted names)
+        """
+        keep = ~np.isin(self.tickers, list(exclude)) if exclude else slice(None)
+        start = 1 if after is None else max(1, self.date_position(after) + 1)
+        weights = self.weight[start - 1:, keep]
+        values = 0.5 * np.abs(np.diff(weights, axis=0)).sum(axis=1)
+        return pd.Series(values, index=pd.DatetimeIndex(self.dates[start:], name="Rebalance_date"))
+
+    def leaders(self) -> np.ndarray:
+        """Ticker ranked #1 on each rebalance date (aligned with `dates`)."""
+        has_leader = (self.rank == 1).any(axis=1)
+        return np.where(has_leader, self.tickers[np.argmax(self.rank == 1, axis=1)], None)
+
+
+def build_history_matrix(df: pd.DataFrame) -> HistoryMatrix:
+    """Pivot the normalized long history into a HistoryMatrix."""
+    df = df.dropna(subset=["Rebalance_date"])
+    date_codes, dates = pd.factorize(df["Rebalance_date"], sort=True)
+    ticker_codes, tickers = pd.factorize(df["Ticker"].astype(str), sort=True)
+    shape = (len(dates), len(tickers))
+
+    weight = np.zeros(shape, dtype=np.float64)
+    np.add.at(weight, (date_codes, ticker_codes), df["Weight"].fillna(0.0).to_numpy(dtype=np.float64))
+
+    score = np.full(shape, np.nan, dtype=np.float64)
+    np.fmax.at(score, (date_codes, ticker_codes), df["Score"].to_numpy(dtype=np.float64))
+
+    # Rank within each date by Score (same tie-break as groupby().rank(method="first"))
+    rank = np.zeros(shape, dtype=np.int32)
+    scored = df["Score"].notna().to_numpy()
+    row_rank = (
+        df.loc[scored].groupby("Rebalance_date")["Score"].rank(ascending=False, method="first").to_numpy()
+    )
+    rank[date_codes[scored], ticker_codes[scored]] = row_rank.astype(np.int32)
+
+    tickers = np.asarray(tickers, dtype=object)
+    return HistoryMatrix(
+        dates=np.asarray(dates, dtype="datetime64[ns]"),
+        tickers=tickers,
+        weight=np.ascontiguousarray(weight),
+        score=np.ascontiguousarray(score),
+        rank=np.ascontiguousarray(rank),
+        _ticker_pos={t: i for i, t in enumerate(tickers)},
+    )
+
+
+@dataclass(frozen=True)
+class DominanceIndex:
+    """
+    Cumulative "months at #1" per ticker (row i = counts through dates[i]).
+
+    Tickers are ordered by their first date at #1, so ties rank the earlier
+    leader first, matching value_counts() on the leaders series.
+    """
+    dates: np.ndarray
+    tickers: np.ndarray
+    counts: np.ndarray
+
+    def counts_through(self, date) -> np.ndarray:
+        """Leader counts over rebalance dates <= `date` (all zeros before the first date)."""
+        pos = int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(date), "ns"), side="right")) - 1
+        if pos < 0:
+            return np.zeros(len(self.tickers), dtype=self.counts.dtype)
+        return self.counts[pos]
+
+    def top(self, date, top_n: int = 15) -> pd.DataFrame:
+        """Top N tickers by months at #1 through `date`. Columns: ticker, months_at_top, rank"""
+        row = self.counts_through(date)
+        n = min(top_n, int(np.count_nonzero(row)))
+        if n <= 0:
+            return pd.DataFrame({"ticker": [], "months_at_top": [], "rank": []})
+
+        # Partial sort: keep every ticker tied with the Nth count, then order the few candidates
+        kth = np.partition(row, len(row) - n)[len(row) - n]
+        candidates = np.flatnonzero(row >= kth)
+        order = candidates[np.argsort(-row[candidates], kind="stable")][:n]
+        return pd.DataFrame({
+            "ticker": self.tickers[order],
+            "months_at_top": row[order].astype(int),
+            "rank": np.arange(1, n + 1),
+        })
+
+
+def build_dominance_index(leaders_df: pd.DataFrame) -> DominanceIndex:
+    """Build a DominanceIndex from a (date, leader) frame such as load_dominance_history()."""
+    leaders_df = leaders_df.dropna(subset=["date", "leader"]).sort_values("date", kind="stable")
+    codes, tickers = pd.factorize(leaders_df["leader"].astype(str))
+
+    hits = np.zeros((len(leaders_df), len(tickers)), dtype=np.int32)
+    hits[np.arange(len(leaders_df)), codes] = 1
+    return DominanceIndex(
+        dates=leaders_df["date"].to_numpy(dtype="datetime64[ns]"),
+        tickers=np.asarray(tickers, dtype=object),
+        counts=np.cumsum(hits, axis=0, dtype=np.int32),
+    )
+
+
+def load_history_matrix(path: str | Path) -> HistoryMatrix:
+    """HistoryMatrix for the history file at `path`, rebuilt when the file changes."""
+    return history_store.load_derived(path, "history_matrix", build_history_matrix)
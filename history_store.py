@@ -0,0 +1,352 @@
+"""
+Shared store for the BUZZ index history (BuzzIndex_historical.csv).
+
+The CSV is parsed once per file modification time into a typed, normalized
+frame. Every consumer (the dashboard loaders and the generator scripts) gets
+a view of that same frame instead of re-reading and re-normalizing the file.
+
+Normalized frame:
+    - Selection_date / Rebalance_date: datetime64 (parsed from DD/MM/YYYY)
+    - Ticker: categorical, with renamed companies merged (FB -> META)
+    - Weight / Score: float64
+    - Rows sorted by Rebalance_date (stable), index reset
+
+The normalized frame is also written to a binary sidecar next to the CSV
+(BuzzIndex_historical.npz). A fresh process loads the sidecar instead of
+tokenizing the CSV; the sidecar records the CSV's mtime and size and is
+rebuilt automatically whenever the CSV changes.
+
+Structures derived from the frame (e.g. the per-ticker index) are memoized
+under the same modification time.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+HISTORY_FILENAME = "BuzzIndex_historical.csv"
+
+# Normalize ticker names for companies that changed names
+# FB -> META (Facebook rebranded to Meta in 2021)
+TICKER_RENAMES = {"FB": "META"}
+
+DATE_FORMAT = "%d/%m/%Y"
+
+# Bump when the sidecar layout or the normalization changes
+SIDECAR_VERSION = 1
+
+_lock = threading.Lock()
+_frames: dict[str, tuple[float, pd.DataFrame]] = {}
+_derived: dict[tuple[str, str], tuple[float, object]] = {}
+
+
+def _file_mtime(path: Path) -> float:
+    """Get file modification time for cache invalidation"""
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def normalize_history(raw: pd.DataFrame) -> pd.DataFrame:
+    """Apply the shared normalization to a raw BuzzIndex_historical frame."""
+    df = raw.copy()
+
+    df["Ticker"] = df["Ticker"].astype(str).replace(TICKER_RENAMES).astype("category")
+
+    for col in ("Selection_date", "Rebalance_date"):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=DATE_FORMAT, errors="coerce")
+    df = df.dropna(subset=["Rebalance_date"])
+
+    for col in ("Weight", "Score"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+    return df.sort_values("Rebalance_date", kind="stable").reset_index(drop=True)
+
+
+def sidecar_path(path: str | Path) -> Path:
+    """Binary cache file that sits next to the history CSV."""
+    return Path(path).with_suffix(".npz")
+
+
+def _source_key(path: Path) -> dict:
+    """Identity of the source CSV that a sidecar was built from."""
+    stat = path.stat()
+    return {"version": SIDECAR_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _write_sidecar(df: pd.DataFrame, path: Path, source: dict) -> None:
+    """Write the normalized frame as plain NumPy arrays (atomic replace, best effort)."""
+    arrays = {}
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            kind = "category"
+            arrays[f"c{i}_codes"] = series.cat.codes.to_numpy()
+            arrays[f"c{i}_categories"] = series.cat.categories.astype(str).to_numpy(dtype=str)
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            kind = "datetime"
+            arrays[f"c{i}"] = series.to_numpy()
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            kind = "numeric"
+            arrays[f"c{i}"] = series.to_numpy()
+        else:
+            kind = "string"
+            arrays[f"c{i}"] = series.astype(str).to_numpy(dtype=str)
+        columns.append({"name": col, "kind": kind, "dtype": str(series.dtype)})
+
+    meta = dict(source, columns=columns)
+    arrays["meta"] = np.array(json.dumps(meta))
+
+    target = sidecar_path(path)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, target)
+    except OSError:
+        # Read-only deployments just keep parsing the CSV
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _read_sidecar(path: Path, source: dict) -> pd.DataFrame | None:
+    """Load the sidecar if it was built from this exact CSV, else None."""
+    target = sidecar_path(path)
+    if not target.exists():
+        return None
+    try:
+        with np.load(target, allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            if any(meta.get(k) != v for k, v in source.items()):
+                return None
+            data = {}
+            for i, col in enumerate(meta["columns"]):
+                if col["kind"] == "category":
+                    data[col["name"]] = pd.Categorical.from_codes(
+                        npz[f"c{i}_codes"], categories=npz[f"c{i}_categories"].astype(object)
+                    )
+                elif col["kind"] == "string":
+                    data[col["name"]] = pd.Series(npz[f"c{i}"].astype(object)).astype(col["dtype"])
+                else:
+                    data[col["name"]] = npz[f"c{i}"]
+        return pd.DataFrame(data)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _read_history(path: Path) -> pd.DataFrame:
+    """Load the normalized history from the sidecar, or parse the CSV and refresh the sidecar."""
+    source = _source_key(path)
+    df = _read_sidecar(path, source)
+    if df is None:
+        df = normalize_history(pd.read_csv(path))
+        _write_sidecar(df, path, source)
+    return df
+
+
+def load_history(path: str | Path) -> pd.DataFrame:
+    """
+    Return the normalized history for `path`, parsing the file at most once
+    per modification time.
+
+    The returned frame is a shallow copy of the shared frame: adding or
+    reassigning columns stays local to the caller, but the values must be
+    treated as read-only.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    path = Path(path).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"History file not found: {path}")
+
+    mtime = _file_mtime(path)
+    key = str(path)
+    with _lock:
+        cached = _frames.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, _read_history(path))
+            _frames[key] = cached
+    return cached[1].copy(deep=False)
+
+
+def history_mtime(path: str | Path) -> float:
+    """Modification time of the history file, for use as a cache key."""
+    return _file_mtime(Path(path))
+
+
+def load_derived(path: str | Path, name: str, builder):
+    """Memoize builder(history) for `path` until the history file changes."""
+    df = load_history(path)
+    path = Path(path).resolve()
+    mtime = _file_mtime(path)
+    key = (str(path), name)
+    with _lock:
+        cached = _derived.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    value = builder(df)
+    with _lock:
+        _derived[key] = (mtime, value)
+    return value
+
+
+# -----------------------------
+# Tenure engine
+# -----------------------------
+# Two appearances are consecutive if they are roughly one month apart
+CONSECUTIVE_MIN_DAYS = 25
+CONSECUTIVE_MAX_DAYS = 35
+
+
+def compute_tenure(tickers: pd.Series, dates: pd.Series) -> pd.DataFrame:
+    """
+    Compute tenure for every ticker in one vectorized pass.
+
+    `tickers` / `dates` must be sorted by (ticker, date). Consecutive
+    appearances of a ticker 25-35 days apart extend a run; anything else
+    starts a new stint. Runs are found by diffing the sorted date array and
+    run-length encoding the resulting breaks.
+
+    Returns a DataFrame indexed by ticker with:
+      - current_streak: months in the run ending at the ticker's latest appearance
+      - longest_streak: longest run ever
+      - stints: number of separate runs
+      - months_held: total appearances
+    """
+    columns = ["current_streak", "longest_streak", "stints", "months_held"]
+    n = len(dates)
+    if n == 0:
+        return pd.DataFrame(columns=columns, dtype="int64")
+
+    codes, uniques = pd.factorize(tickers, sort=False)
+    day = dates.to_numpy().astype("datetime64[D]").astype(np.int64)
+
+    gap = np.diff(day)
+    same_ticker = codes[1:] == codes[:-1]
+    linked = same_ticker & (gap >= CONSECUTIVE_MIN_DAYS) & (gap <= CONSECUTIVE_MAX_DAYS)
+
+    # Run id per row: a new run starts wherever the previous row is not linked
+    run_id = np.cumsum(np.r_[True, ~linked]) - 1
+    run_len = np.bincount(run_id)
+    run_ticker = codes[np.r_[0, np.flatnonzero(~linked) + 1]]
+
+    n_tickers = len(uniques)
+    longest = np.zeros(n_tickers, dtype=np.int64)
+    np.maximum.at(longest, run_ticker, run_len)
+    stints = np.bincount(run_ticker, minlength=n_tickers)
+    months = np.bincount(codes, minlength=n_tickers)
+
+    # Rows are grouped by ticker, so each ticker's last run is its current one
+    last_run = np.zeros(n_tickers, dtype=np.int64)
+    last_run[codes] = run_id
+    current = run_len[last_run]
+
+    return pd.DataFrame(
+        {"current_streak": current, "longest_streak": longest, "stints": stints, "months_held": months},
+        index=pd.Index([str(t) for t in uniques], name="Ticker"),
+    )
+
+
+# -----------------------------
+# Per-ticker index
+# -----------------------------
+def build_ticker_index(df: pd.DataFrame) -> dict:
+    """
+    Build a per-ticker offset index and summary over the normalized history.
+
+    Returns a dict with:
+      - frame: the history sorted by (Ticker, Rebalance_date); each ticker's
+        rows are the contiguous slice frame.iloc[row_start:row_stop]
+      - summary: ticker -> dict with row_start, row_stop, first_date,
+        last_date, months_held, current_streak, longest_streak, stints,
+        min_weight, min_weight_date, max_weight, max_weight_date.
+        Appearance dates, tenure (see compute_tenure) and the weight range
+        only count rows with a positive weight (i.e. the ticker was held);
+        the earliest date wins when a min/max weight repeats.
+    """
+    frame = df.sort_values(["Ticker", "Rebalance_date"], kind="stable").reset_index(drop=True)
+    summary: dict[str, dict] = {}
+    if frame.empty:
+        return {"frame": frame, "summary": summary}
+
+    codes = frame["Ticker"].cat.codes.to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    stops = np.r_[starts[1:], len(codes)]
+
+    held = frame[frame["Weight"].notna() & (frame["Weight"] > 0)]
+    grouped = held.groupby("Ticker", observed=True)
+    stats = pd.DataFrame({
+        "first_date": grouped["Rebalance_date"].min(),
+        "last_date": grouped["Rebalance_date"].max(),
+        "months_held": grouped.size(),
+        "min_idx": grouped["Weight"].idxmin(),
+        "max_idx": grouped["Weight"].idxmax(),
+    })
+    tenure = compute_tenure(held["Ticker"].astype(str), held["Rebalance_date"])
+    weights = frame["Weight"].to_numpy()
+    dates = frame["Rebalance_date"].to_numpy()
+
+    categories = frame["Ticker"].cat.categories
+    for start, stop in zip(starts, stops):
+        ticker = str(categories[codes[start]])
+        entry = {
+            "row_start": int(start),
+            "row_stop": int(stop),
+            "first_date": None,
+            "last_date": None,
+            "months_held": 0,
+            "current_streak": 0,
+            "longest_streak": 0,
+            "stints": 0,
+            "min_weight": None,
+            "min_weight_date": None,
+            "max_weight": None,
+            "max_weight_date": None,
+        }
+        if ticker in stats.index:
+            row = stats.loc[ticker]
+            runs = tenure.loc[ticker]
+            min_idx, max_idx = int(row["min_idx"]), int(row["max_idx"])
+            entry.update({
+                "first_date": row["first_date"],
+                "last_date": row["last_date"],
+                "months_held": int(row["months_held"]),
+                "current_streak": int(runs["current_streak"]),
+                "longest_streak": int(runs["longest_streak"]),
+                "stints": int(runs["stints"]),
+                "min_weight": float(weights[min_idx]),
+                "min_weight_date": pd.Timestamp(dates[min_idx]),
+                "max_weight": float(weights[max_idx]),
+                "max_weight_date": pd.Timestamp(dates[max_idx]),
+            })
+        summary[ticker] = entry
+
+    return {"frame": frame, "summary": summary}
+
+
+def load_ticker_index(path: str | Path) -> dict:
+    """Per-ticker index for `path` (see build_ticker_index), rebuilt when the file changes."""
+    return load_derived(path, "ticker_index", build_ticker_index)
+
+
+def get_ticker_summary(path: str | Path, ticker: str) -> dict | None:
+    """Summary dict for one ticker, or None if it never appeared in the index."""
+    return load_ticker_index(path)["summary"].get(ticker)
+
+
+def get_ticker_rows(path: str | Path, ticker: str) -> pd.DataFrame:
+    """All history rows for one ticker, sorted by Rebalance_date (empty if unknown)."""
+    index = load_ticker_index(path)
+    entry = index["summary"].get(ticker)
+    if entry is None:
+        return index["frame"].iloc[0:0]
+    return index["frame"].iloc[entry["row_start"]:entry["row_stop"]]
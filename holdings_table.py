@@ -0,0 +1,44 @@
+"""
+The All Holdings table as one static Streamlit custom component.
+
+Rendering a row of st.columns, buttons and markdown per holding costs several
+hundred elements that Streamlit diffs on every rerun, and every keystroke in a
+st.text_input search box is a rerun. The component in components/holdings_table/
+instead receives the holdings once as columnar args and does search, sorting
+and virtualized scrolling (only the visible rows are in the DOM) in the
+browser, so the page's rerun cost no longer grows with the number of holdings.
+A ticker click comes back as the component value, which render() turns into
+the clicked ticker exactly once.
+"""
+
+import functools
+from pathlib import Path
+
+COMPONENT_DIR = Path(__file__).resolve().parent / "components" / "holdings_table"
+
+
+@functools.cache
+def _component():
+    import streamlit.components.v1 as components
+    return components.declare_component("holdings_table", path=str(COMPONENT_DIR))
+
+
+def render(tickers: list[str], companies: list[str], weights: list[float], market_values: list[float], *,
+           visited: str = "", scroll_to: str = "", height: int = 600, key: str = "holdings_table") -> str | None:
+    """
+    Draw the table (rows in the given order; weights in percent). `visited` gets
+    the "just visited" label and `scroll_to` is scrolled into view. Returns the
+    ticker clicked since the last call, or None.
+    """
+    import streamlit as st
+
+    value = _component()(
+        rows={"ticker": tickers, "company": companies, "weight": weights, "value": market_values},
+        visited=visited, scroll_to=scroll_to, height=height, key=key, default=None,
+    )
+    # The value persists across reruns; only a new clickId is a new click
+    handled_key = f"_{key}_handled_click"
+    if value and value.get("clickId") != st.session_state.get(handled_key):
+        st.session_state[handled_key] = value["clickId"]
+        return value["ticker"]
+    return None
@@ -0,0 +1,196 @@
+"""
+Persistent on-disk OHLCV store with incremental top-up.
+
+Daily bars are kept per symbol in a SQLite database next to the app, so long
+timeframes (6M, YTD, 1Y, ALL) are sliced from disk instead of re-downloading
+`period="max"` every few minutes. When a series goes stale (price_cache's
+market-hours-aware expiry) only the bars after the last stored one are fetched (plus a few days of
+overlap). If the overlapping completed closes no longer match, Yahoo has
+re-adjusted the series for a split or dividend, and the whole series is
+refetched; the last stored bar may be a partial session and is just overwritten.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import yfinance as yf
+
+import circuit_breaker
+import price_cache
+
+DB_PATH = Path(__file__).resolve().parent / ".cache" / "ohlcv.sqlite"
+
+# Days of already-stored bars refetched on top-up (catches a partial last bar
+# and lets us detect split/dividend re-adjustments)
+OVERLAP_DAYS = 5
+
+# Relative close difference on overlapping bars that means the series was re-adjusted
+ADJUSTMENT_TOLERANCE = 1e-6
+
+COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bars (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    open REAL, high REAL, low REAL, close REAL, volume REAL,
+    PRIMARY KEY (symbol, interval, ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS series (
+    symbol TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    tz TEXT,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (symbol, interval)
+);
+"""
+
+_lock = threading.Lock()
+_symbol_locks: dict[tuple[str, str], threading.Lock] = {}
+_initialized = False
+
+
+def _connect() -> sqlite3.Connection:
+    global _initialized
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    if not _initialized:
+        with _lock:
+            if not _initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                _initialized = True
+    return conn
+
+
+def _symbol_lock(symbol: str, interval: str) -> threading.Lock:
+    with _lock:
+        return _symbol_locks.setdefault((symbol, interval), threading.Lock())
+
+
+def _read(conn: sqlite3.Connection, symbol: str, interval: str) -> tuple[pd.DataFrame, str | None, float]:
+    """Stored bars as a yfinance-shaped frame, plus the series timezone and last check time."""
+    row = conn.execute(
+        "SELECT tz, checked_at FROM series WHERE symbol = ? AND interval = ?", (symbol, interval)
+    ).fetchone()
+    tz, checked_at = row if row else (None, 0.0)
+    bars = pd.read_sql_query(
+        "SELECT ts, open, high, low, close, volume FROM bars WHERE symbol = ? AND interval = ? ORDER BY ts",
+        conn, params=(symbol, interval),
+    )
+    index = pd.to_datetime(bars["ts"], unit="s", utc=True)
+    if tz:
+        index = index.dt.tz_convert(tz)
+    df = pd.DataFrame(bars[["open", "high", "low", "close", "volume"]].to_numpy(), columns=COLUMNS,
+                      index=pd.DatetimeIndex(index, name="Date"))
+    return df, tz, checked_at
+
+
+def _write(conn: sqlite3.Connection, symbol: str, interval: str, df: pd.DataFrame, replace: bool) -> None:
+    """Upsert bars (or replace the whole series) and mark the series as checked now."""
+    ts = df.index.tz_convert("UTC") if df.index.tz is not None else df.index.tz_localize("UTC")
+    rows = zip(
+        [symbol] * len(df), [interval] * len(df), ts.as_unit("s").asi8.tolist(),
+        *(df[c].astype(float).tolist() for c in COLUMNS),
+    )
+    tz = str(df.index.tz) if df.index.tz is not None else None
+    with conn:
+        if replace:
+            conn.execute("DELETE FROM bars WHERE symbol = ? AND interval = ?", (symbol, interval))
+        conn.executemany("INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("INSERT OR REPLACE INTO series VALUES (?, ?, ?, ?)", (symbol, interval, tz, time.time()))
+
+
+def _touch(conn: sqlite3.Connection, symbol: str, interval: str) -> None:
+    with conn:
+        conn.execute("UPDATE series SET checked_at = ? WHERE symbol = ? AND interval = ?",
+                     (time.time(), symbol, interval))
+
+
+def _download(symbol: str, **kwargs) -> pd.DataFrame:
+    hist = circuit_breaker.call_for_symbol("yahoo:v8", symbol, yf.Ticker(symbol).history, interval="1d", **kwargs)
+    if hist.empty or "Close" not in hist.columns:
+        return pd.DataFrame(columns=COLUMNS)
+    return hist[COLUMNS].dropna(subset=["Close"])
+
+
+def get_daily(symbol: str) -> pd.DataFrame:
+    """
+    Full daily history for `symbol`. Served from price_cache (stale-while-
+    revalidate) once loaded; loads come from the store, topped up from Yahoo
+    when the stored series is stale. Falls back to whatever is stored if Yahoo
+    is unavailable. Treat as read-only.
+    """
+    def load():
+        daily = _load_daily(symbol)
+        if daily.empty:
+            raise ValueError(f"No daily bars for {symbol}")
+        return daily
+
+    try:
+        return price_cache.get_or_refresh("daily", symbol, load)
+    except Exception:
+        return pd.DataFrame(columns=COLUMNS)
+
+
+def _load_daily(symbol: str) -> pd.DataFrame:
+    with _symbol_lock(symbol, "1d"):
+        conn = _connect()
+        try:
+            stored, _tz, checked_at = _read(conn, symbol, "1d")
+            if not stored.empty and time.time() < price_cache.expires_at("daily", checked_at):
+                return stored
+
+            try:
+                if stored.empty:
+                    fresh = _download(symbol, period="max")
+                    if fresh.empty:
+                        return stored
+                    _write(conn, symbol, "1d", fresh, replace=True)
+                    return fresh
+
+                start = (stored.index[-1] - pd.Timedelta(days=OVERLAP_DAYS)).strftime("%Y-%m-%d")
+                fresh = _download(symbol, start=start)
+                if fresh.empty:
+                    _touch(conn, symbol, "1d")
+                    return stored
+
+                # The last stored bar may be a partial session: compare only the completed
+                # bars before it, and let the upsert below overwrite it
+                overlap = stored["Close"].iloc[:-1].reindex(fresh.index).dropna()
+                drift = (fresh["Close"].reindex(overlap.index) - overlap).abs() / overlap.abs()
+                if (drift > ADJUSTMENT_TOLERANCE).any():
+                    # Split/dividend re-adjusted the whole series: replace it
+                    fresh = _download(symbol, period="max")
+                    if fresh.empty:
+                        return stored
+                    _write(conn, symbol, "1d", fresh, replace=True)
+                    return fresh
+
+                _write(conn, symbol, "1d", fresh, replace=False)
+            except Exception:
+                return stored
+            return _read(conn, symbol, "1d")[0]
+        finally:
+            conn.close()
+
+
+def slice_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Bars within a Yahoo-style `period` ("6mo", "ytd", "1y", "max") ending now."""
+    if df.empty or period == "max":
+        return df
+    now = pd.Timestamp.now(tz=df.index.tz).normalize()
+    if period == "ytd":
+        start = now.replace(month=1, day=1)
+    elif period.endswith("mo"):
+        start = now - pd.DateOffset(months=int(period[:-2]))
+    elif period.endswith("y"):
+        start = now - pd.DateOffset(years=int(period[:-1]))
+    else:
+        raise ValueError(f"Unsupported period: {period}")
+    return df[df.index >= start]
+
@@ -0,0 +1,141 @@
+"""
+Shared in-memory cache for price history, with market-hours-aware expiry.
+
+While the US market is open (plus a short grace period after the close, so the
+final bars settle) entries expire after their kind's OPEN_TTL. Outside market
+hours prices cannot change, so entries fetched then stay valid until the next
+session opens (capped at MAX_CLOSED_TTL). Exchange holidays are treated as
+normal weekdays, which only costs an extra refresh.
+
+get_or_refresh() adds a stale-while-revalidate mode: an expired value is
+returned immediately and refreshed on a background worker, so only the very
+first load of a key blocks on the network.
+
+Per-kind hit/miss/stale-served counters are available from stats().
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import fetch_pool
+import single_flight
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = (9, 30)
+MARKET_CLOSE = (16, 0)
+CLOSE_GRACE = timedelta(minutes=15)
+
+# Seconds an entry stays fresh while the market is open, per kind
+OPEN_TTL = {"intraday": 300, "daily": 300, "daily_changes": 300, "price_data": 300}
+DEFAULT_OPEN_TTL = 300
+MAX_CLOSED_TTL = 12 * 3600
+
+# After a failed background refresh the stale value is served this long before retrying
+REFRESH_RETRY_SECONDS = 30
+
+_lock = threading.Lock()
+_entries: dict[tuple, tuple[float, object]] = {}  # key -> (expires_at, value)
+_stats: dict[str, dict[str, int]] = {}
+_refreshing: set[tuple] = set()
+
+
+def _session_bounds(day: datetime) -> tuple[datetime, datetime]:
+    open_at = day.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1], second=0, microsecond=0)
+    close_at = day.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1], second=0, microsecond=0)
+    return open_at, close_at + CLOSE_GRACE
+
+
+def market_is_open(now: float | None = None) -> bool:
+    """True during the regular session (plus CLOSE_GRACE) on a weekday."""
+    current = datetime.fromtimestamp(time.time() if now is None else now, MARKET_TZ)
+    if current.weekday() >= 5:
+        return False
+    open_at, close_at = _session_bounds(current)
+    return open_at <= current < close_at
+
+
+def next_open(now: float | None = None) -> float:
+    """Timestamp of the next regular session open after `now`."""
+    current = datetime.fromtimestamp(time.time() if now is None else now, MARKET_TZ)
+    day = current
+    while True:
+        open_at, _close_at = _session_bounds(day)
+        if day.weekday() < 5 and open_at > current:
+            return open_at.timestamp()
+        day = (day + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def expires_at(kind: str, fetched_at: float) -> float:
+    """When an entry of `kind` fetched at `fetched_at` goes stale."""
+    if market_is_open(fetched_at):
+        return fetched_at + OPEN_TTL.get(kind, DEFAULT_OPEN_TTL)
+    return min(next_open(fetched_at), fetched_at + MAX_CLOSED_TTL)
+
+
+def _count(kind: str, field: str) -> None:
+    counters = _stats.setdefault(kind, {"hits": 0, "misses": 0, "stale": 0, "refresh_errors": 0})
+    counters[field] += 1
+
+
+def put(kind: str, key, value) -> None:
+    now = time.time()
+    with _lock:
+        _entries[(kind, key)] = (expires_at(kind, now), value)
+
+
+def _refresh(kind: str, key, fetch) -> None:
+    try:
+        value = fetch()
+    except Exception:
+        # Keep serving the stale value; try again after a short pause
+        with _lock:
+            _count(kind, "refresh_errors")
+            entry = _entries.get((kind, key))
+            if entry is not None:
+                _entries[(kind, key)] = (time.time() + REFRESH_RETRY_SECONDS, entry[1])
+    else:
+        put(kind, key, value)
+    finally:
+        with _lock:
+            _refreshing.discard((kind, key))
+
+
+def get_or_refresh(kind: str, key, fetch):
+    """
+    Stale-while-revalidate: a fresh value is returned as is; an expired one is
+    returned immediately while fetch() refreshes it on a background worker (one
+    refresh per key at a time). Only a key with no value yet blocks, and
+    concurrent first loads share one fetch.
+    """
+    now = time.time()
+    with _lock:
+        entry = _entries.get((kind, key))
+        if entry is not None and now < entry[0]:
+            _count(kind, "hits")
+            return entry[1]
+        if entry is not None:
+            _count(kind, "stale")
+            schedule = (kind, key) not in _refreshing
+            if schedule:
+                _refreshing.add((kind, key))
+        else:
+            _count(kind, "misses")
+
+    if entry is not None:
+        if schedule:
+            fetch_pool.submit_background(_refresh, kind, key, fetch)
+        return entry[1]
+
+    def fetch_and_store():
+        result = fetch()
+        put(kind, key, result)
+        return result
+    return single_flight.do(("price_cache", kind, key), fetch_and_store)
+
+
+def stats() -> dict[str, dict[str, int]]:
+    """{kind: {"hits", "misses", "stale", "refresh_errors"}} since process start."""
+    with _lock:
+        return {kind: dict(counters) for kind, counters in _stats.items()}
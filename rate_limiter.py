@@ -0,0 +1,169 @@
+"""
+Process-wide token-bucket rate limiter for outbound Yahoo calls.
+
+Every call takes one token from the GLOBAL_BUDGET bucket and one from its
+endpoint's bucket (ENDPOINT_BUDGETS, same names as circuit_breaker). A bucket
+refills at `rate` tokens per second up to `burst`. Callers without a token wait
+in a queue ordered by priority class, then arrival: interactive page fetches
+are always granted before background warmers, and a caller still waiting after
+MAX_WAIT[priority] seconds is rejected with RateLimitedError instead of piling
+onto a throttled host.
+
+The priority class comes from a context variable: code runs as "interactive"
+unless it is inside `with priority("background"):`. fetch_pool runs every
+background submission that way.
+
+One token covers one call from our side; a yfinance call may issue a few HTTP
+requests internally, which the budgets leave room for.
+"""
+
+import contextlib
+import contextvars
+import itertools
+import threading
+import time
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+_RANK = {INTERACTIVE: 0, BACKGROUND: 1}
+
+# (tokens per second, burst)
+GLOBAL_BUDGET = (5.0, 10)
+ENDPOINT_BUDGETS = {
+    "yahoo:v7": (2.0, 4),
+    "yahoo:v10": (2.0, 5),
+    "yahoo:v8": (3.0, 6),
+    "yahoo:news": (1.0, 3),
+}
+DEFAULT_BUDGET = (1.0, 2)
+
+# Seconds a caller may queue for a token before it is rejected
+MAX_WAIT = {INTERACTIVE: 5.0, BACKGROUND: 30.0}
+
+
+class RateLimitedError(Exception):
+    """Raised when no token became available within MAX_WAIT."""
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available (after refill)."""
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("rate_limiter_priority", default=INTERACTIVE)
+
+_cond = threading.Condition()
+_global = _Bucket(*GLOBAL_BUDGET)
+_buckets: dict[str, _Bucket] = {}
+_waiters: dict[tuple[int, int], str] = {}  # (rank, seq) -> endpoint
+_seq = itertools.count()
+_stats: dict[str, dict[str, dict]] = {}
+
+
+@contextlib.contextmanager
+def priority(name: str):
+    """Run the block's outbound calls in priority class `name` (INTERACTIVE or BACKGROUND)."""
+    if name not in _RANK:
+        raise ValueError(f"Unknown priority class: {name}")
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+def _bucket(endpoint: str) -> _Bucket:
+    bucket = _buckets.get(endpoint)
+    if bucket is None:
+        bucket = _buckets[endpoint] = _Bucket(*ENDPOINT_BUDGETS.get(endpoint, DEFAULT_BUDGET))
+    return bucket
+
+
+def _count(endpoint: str, prio: str, field: str, amount: float = 1) -> None:
+    counters = _stats.setdefault(endpoint, {}).setdefault(
+        prio, {"acquired": 0, "queued": 0, "rejected": 0, "wait_seconds": 0.0})
+    counters[field] += amount
+
+
+def _grantable(ticket: tuple[int, int]) -> bool:
+    """
+    True if `ticket` is served by the tokens available now. Waiters are served in
+    (rank, seq) order; one whose endpoint is dry is skipped, but once the global
+    bucket runs dry nobody further down the queue may take a token.
+    """
+    global_tokens = _global.tokens
+    endpoint_tokens: dict[str, float] = {}
+    for waiter in sorted(_waiters):
+        if global_tokens < 1:
+            return False
+        endpoint = _waiters[waiter]
+        available = endpoint_tokens.get(endpoint, _bucket(endpoint).tokens)
+        if available < 1:
+            continue
+        if waiter == ticket:
+            return True
+        global_tokens -= 1
+        endpoint_tokens[endpoint] = available - 1
+    return False
+
+
+def acquire(endpoint: str) -> None:
+    """Take a token for `endpoint`, queueing by priority; raises RateLimitedError after MAX_WAIT."""
+    prio = _priority.get()
+    start = time.monotonic()
+    deadline = start + MAX_WAIT[prio]
+    with _cond:
+        ticket = (_RANK[prio], next(_seq))
+        _waiters[ticket] = endpoint
+        bucket = _bucket(endpoint)
+        queued = False
+        try:
+            while True:
+                now = time.monotonic()
+                _global.refill(now)
+                for each in _buckets.values():
+                    each.refill(now)
+                if _grantable(ticket):
+                    _global.tokens -= 1
+                    bucket.tokens -= 1
+                    _count(endpoint, prio, "acquired")
+                    if queued:
+                        _count(endpoint, prio, "wait_seconds", now - start)
+                    return
+                if not queued:
+                    queued = True
+                    _count(endpoint, prio, "queued")
+                remaining = deadline - now
+                if remaining <= 0:
+                    _count(endpoint, prio, "rejected")
+                    raise RateLimitedError(f"{endpoint}: no token within {MAX_WAIT[prio]:g}s ({prio})")
+                _cond.wait(min(remaining, max(_global.wait_time(), bucket.wait_time(), 0.01)))
+        finally:
+            del _waiters[ticket]
+            _cond.notify_all()
+
+
+def stats() -> dict[str, dict[str, dict]]:
+    """{endpoint: {priority: {"acquired", "queued", "rejected", "wait_seconds"}}} plus "waiting" now."""
+    with _cond:
+        result = {endpoint: {prio: dict(counters) for prio, counters in by_prio.items()}
+                  for endpoint, by_prio in _stats.items()}
+        result["waiting"] = {prio: sum(1 for rank, _ in _waiters if rank == _RANK[prio]) for prio in _RANK}
+        return result
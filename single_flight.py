@@ -0,0 +1,76 @@
+"""
+Single-flight request coalescing shared by every Streamlit session.
+
+Streamlit serves all sessions from threads of one process, and st.cache_data
+does not coordinate misses: when an entry expires, every session that reruns
+in that window calls Yahoo for the same data. do(key, fn) lets the first caller
+run fn() while concurrent callers with the same key wait for, and share, its
+result (or its exception). Nothing is cached; once the call finishes the next
+caller starts a new flight.
+"""
+
+import functools
+import threading
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+_lock = threading.Lock()
+_flights: dict = {}
+_stats = {"calls": 0, "coalesced": 0}
+
+
+def do(key, fn):
+    """Run fn() once per concurrent `key`; callers arriving while it runs get the same outcome."""
+    with _lock:
+        _stats["calls"] += 1
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+        else:
+            flight.waiters += 1
+            _stats["coalesced"] += 1
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = fn()
+    except BaseException as exc:
+        flight.error = exc
+        raise
+    finally:
+        with _lock:
+            _flights.pop(key, None)
+        flight.done.set()
+    return flight.result
+
+
+def coalesced(func):
+    """
+    Decorator: concurrent calls with equal (hashable) arguments share one execution.
+    Place it under @st.cache_data so cache misses across sessions are coalesced.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+        return do(key, lambda: func(*args, **kwargs))
+    return wrapper
+
+
+def stats() -> dict[str, int]:
+    """{"calls": n, "coalesced": n, "in_flight": n} since process start."""
+    with _lock:
+        return {**_stats, "in_flight": len(_flights)}
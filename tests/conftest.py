@@ -0,0 +1,16 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+HISTORY_CSV = REPO_ROOT / "BuzzIndex_historical.csv"
+
+
+@pytest.fixture(scope="session")
+def history():
+    """The normalized index history shipped with the repo."""
+    import history_store
+    return history_store.load_history(HISTORY_CSV)
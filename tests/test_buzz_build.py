@@ -0,0 +1,66 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+import buzz_build
+from conftest import HISTORY_CSV
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    shutil.copyfile(HISTORY_CSV, tmp_path / buzz_build.HISTORY_FILENAME)
+    return tmp_path
+
+
+def test_build_then_up_to_date(data_dir):
+    assert not any(buzz_build.artifact_status(data_dir).values())
+    assert set(buzz_build.build(data_dir).values()) == {"built"}
+    assert all(buzz_build.artifact_status(data_dir).values())
+    assert set(buzz_build.build(data_dir).values()) == {"up to date"}
+    assert buzz_build.build(data_dir, ["dominance"], force=True) == {"dominance": "built"}
+
+
+def test_forced_rebuild_leaves_the_manifest_untouched(data_dir):
+    buzz_build.build(data_dir)
+    manifest = data_dir / buzz_build.MANIFEST_FILENAME
+    text, mtime = manifest.read_text(), manifest.stat().st_mtime_ns
+    buzz_build.build(data_dir, force=True)
+    assert manifest.read_text() == text
+    assert manifest.stat().st_mtime_ns == mtime
+
+
+def test_changed_history_makes_artifacts_stale(data_dir):
+    buzz_build.build(data_dir)
+    with open(data_dir / buzz_build.HISTORY_FILENAME, "a") as f:
+        f.write("01/01/2030,31/01/2030,ZZZZ US Equity,ZZZZ,0.01,1.0\n")
+    assert not any(buzz_build.artifact_status(data_dir).values())
+    assert buzz_build.load_artifact(data_dir, "dominance") is None
+
+
+def test_loaded_artifacts_match_their_builders(data_dir):
+    buzz_build.build(data_dir)
+    source = data_dir / buzz_build.HISTORY_FILENAME
+    for name in ("dominance", "rank_history", "turnover"):
+        _filename, builder, _version, _dates = buzz_build.ARTIFACTS[name]
+        expected = builder(source).reset_index(drop=True)
+        loaded = buzz_build.load_artifact(data_dir, name)
+        pd.testing.assert_frame_equal(loaded, expected, check_dtype=False, check_categorical=False,
+                                      check_index_type=False)
+
+
+def test_ticker_summaries_round_trip(data_dir):
+    buzz_build.build(data_dir, ["ticker_summary"])
+    summaries = buzz_build.load_ticker_summaries(data_dir)
+    index = buzz_build.load_ticker_index(data_dir / buzz_build.HISTORY_FILENAME)["summary"]
+    assert summaries.keys() == index.keys()
+    for ticker, summary in summaries.items():
+        expected = index[ticker]
+        assert summary["months_held"] == expected["months_held"]
+        assert summary["current_streak"] == expected["current_streak"]
+        assert summary["last_date"] == expected["last_date"]
+
+
+def test_missing_history_reports_everything_stale(tmp_path):
+    assert not any(buzz_build.artifact_status(tmp_path).values())
+    assert buzz_build.load_artifact(tmp_path, "turnover") is None
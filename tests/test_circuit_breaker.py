@@ -0,0 +1,89 @@
+import pytest
+
+import circuit_breaker
+import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(circuit_breaker, "_negative", {})
+    monkeypatch.setattr(circuit_breaker, "_known_symbols", set())
+    # Tokens are not what these tests are about
+    monkeypatch.setattr(rate_limiter, "DEFAULT_BUDGET", (1000.0, 1000))
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(rate_limiter, "_global", rate_limiter._Bucket(1000.0, 1000))
+
+
+def _fail():
+    raise ConnectionError("boom")
+
+
+def _trip(endpoint: str) -> None:
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+        with pytest.raises(ConnectionError):
+            circuit_breaker.call(endpoint, _fail)
+
+
+def _cool_off(endpoint: str) -> None:
+    circuit_breaker._breakers[endpoint].opened_at -= circuit_breaker.COOL_OFF_SECONDS
+
+
+def test_opens_after_threshold_and_rejects_without_calling():
+    calls = []
+    _trip("test:a")
+    assert circuit_breaker.is_open("test:a")
+    with pytest.raises(circuit_breaker.CircuitOpenError):
+        circuit_breaker.call("test:a", lambda: calls.append(1))
+    assert calls == []
+    assert circuit_breaker.stats()["test:a"] == {"state": "open", "failures": 3, "rejected": 1}
+    # Other endpoints are unaffected
+    assert circuit_breaker.call("test:b", lambda: "ok") == "ok"
+
+
+def test_success_resets_the_failure_count():
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD - 1):
+        with pytest.raises(ConnectionError):
+            circuit_breaker.call("test:a", _fail)
+    circuit_breaker.call("test:a", lambda: None)
+    with pytest.raises(ConnectionError):
+        circuit_breaker.call("test:a", _fail)
+    assert not circuit_breaker.is_open("test:a")
+
+
+def test_half_open_lets_one_trial_through():
+    _trip("test:a")
+    _cool_off("test:a")
+    assert circuit_breaker.stats()["test:a"]["state"] == "half-open"
+    assert circuit_breaker.allow("test:a")
+    assert not circuit_breaker.allow("test:a")  # the trial is already running
+    circuit_breaker.record_success("test:a")
+    assert circuit_breaker.stats()["test:a"]["state"] == "closed"
+
+
+def test_failed_trial_reopens():
+    _trip("test:a")
+    _cool_off("test:a")
+    with pytest.raises(ConnectionError):
+        circuit_breaker.call("test:a", _fail)
+    assert circuit_breaker.is_open("test:a")
+
+
+def test_call_for_symbol_counts_empty_only_for_known_symbols():
+    assert circuit_breaker.call_for_symbol("test:a", "NEW", lambda: []) == []
+    assert circuit_breaker.stats()["test:a"]["failures"] == 0
+
+    circuit_breaker.call_for_symbol("test:a", "AAPL", lambda: [1])
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+        with pytest.raises(circuit_breaker.EmptyResultError):
+            circuit_breaker.call_for_symbol("test:a", "AAPL", lambda: None)
+    assert circuit_breaker.is_open("test:a")
+
+
+def test_negative_cache_expires(monkeypatch):
+    circuit_breaker.remember_empty(("info", "XYZ"))
+    assert circuit_breaker.recently_empty(("info", "XYZ"))
+    assert not circuit_breaker.recently_empty(("info", "ABC"))
+    assert circuit_breaker.stats()["negative_cache"] == {"size": 1}
+    circuit_breaker._negative[("info", "XYZ")] -= circuit_breaker.NEGATIVE_TTL
+    assert not circuit_breaker.recently_empty(("info", "XYZ"))
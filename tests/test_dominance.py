@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import history_matrix
+
+
+def _old_leaders(hist_df: pd.DataFrame) -> pd.DataFrame:
+    """Leader per rebalance date the way the app picked it before the matrix existed."""
+    scored = hist_df.dropna(subset=["Score"])
+    leaders = scored.loc[scored.groupby("Rebalance_date")["Score"].idxmax()]
+    return pd.DataFrame({"date": leaders["Rebalance_date"].to_numpy(),
+                         "leader": leaders["Ticker"].astype(str).to_numpy()})
+
+
+def _old_top(leaders: pd.DataFrame, selected_date, top_n: int) -> pd.DataFrame:
+    """The value_counts() dominance ranking build_dominance_index replaced."""
+    counts = leaders.loc[leaders["date"] <= selected_date, "leader"].value_counts().head(top_n)
+    return pd.DataFrame({
+        "ticker": counts.index.to_numpy(dtype=object),
+        "months_at_top": counts.to_numpy(dtype=int),
+        "rank": np.arange(1, len(counts) + 1),
+    })
+
+
+@pytest.fixture(scope="module")
+def matrix(history):
+    return history_matrix.build_history_matrix(history)
+
+
+@pytest.fixture(scope="module")
+def leaders(matrix):
+    return pd.DataFrame({"date": matrix.dates, "leader": matrix.leaders()}).dropna(subset=["leader"])
+
+
+def test_matrix_leaders_match_groupby_idxmax(history, leaders):
+    old = _old_leaders(history)
+    assert leaders["date"].tolist() == old["date"].tolist()
+    assert leaders["leader"].tolist() == old["leader"].tolist()
+
+
+@pytest.mark.parametrize("top_n", [1, 3, 15])
+def test_top_matches_value_counts_on_every_date(leaders, top_n):
+    index = history_matrix.build_dominance_index(leaders)
+    for date in leaders["date"]:
+        got = index.top(date, top_n)
+        expected = _old_top(leaders, date, top_n)
+        assert got["ticker"].tolist() == expected["ticker"].tolist(), date
+        assert got["months_at_top"].tolist() == expected["months_at_top"].tolist(), date
+        assert got["rank"].tolist() == expected["rank"].tolist(), date
+
+
+def test_top_between_rebalance_dates_uses_last_date_before():
+    leaders = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-31", "2024-02-29", "2024-03-31", "2024-04-30"]),
+        "leader": ["B", "A", "A", "B"],
+    })
+    index = history_matrix.build_dominance_index(leaders)
+    top = index.top(pd.Timestamp("2024-04-15"), 15)
+    assert top["ticker"].tolist() == ["A", "B"]
+    assert top["months_at_top"].tolist() == [2, 1]
+    # Tied counts rank the earlier leader first
+    top = index.top(pd.Timestamp("2024-04-30"), 15)
+    assert top["ticker"].tolist() == ["B", "A"]
+    assert top["months_at_top"].tolist() == [2, 2]
+
+
+def test_top_before_first_leader_is_empty():
+    leaders = pd.DataFrame({"date": pd.to_datetime(["2024-01-31"]), "leader": ["A"]})
+    index = history_matrix.build_dominance_index(leaders)
+    assert index.top(pd.Timestamp("2023-12-31")).empty
+    assert index.counts_through(pd.Timestamp("2023-12-31")).tolist() == [0]
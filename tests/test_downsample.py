@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import downsample
+
+
+def _bars(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    open_ = close + rng.standard_normal(n)
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) + rng.random(n),
+        "Low": np.minimum(open_, close) - rng.random(n),
+        "Close": close,
+        "Volume": rng.integers(1, 1000, n).astype(float),
+    }, index=pd.date_range("2015-01-01", periods=n, freq="D"))
+
+
+@pytest.mark.parametrize("n, threshold", [(10, 3), (1000, 100), (5000, 1600), (1601, 1600)])
+def test_lttb_keeps_endpoints_and_meets_budget(n, threshold):
+    y = np.random.default_rng(n).standard_normal(n)
+    keep = downsample.lttb_indices(y, threshold)
+    assert len(keep) == threshold
+    assert keep[0] == 0 and keep[-1] == n - 1
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_keeps_spikes():
+    y = np.zeros(1000)
+    y[123], y[777] = 50.0, -50.0
+    keep = downsample.lttb_indices(y, 50)
+    assert 123 in keep and 777 in keep
+
+
+def test_lttb_under_budget_is_unchanged():
+    df = _bars(100)
+    assert downsample.lttb(df, 100) is df
+    assert downsample.lttb_indices(np.arange(5.0), 2).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_lttb_frame_rows_and_nan_rows():
+    df = _bars(500)
+    df.iloc[[0, 10, 20], df.columns.get_loc("Close")] = np.nan
+    out = downsample.lttb(df, 50)
+    assert len(out) == 50
+    assert out["Close"].notna().all()
+    assert out.index[0] == df.index[1] and out.index[-1] == df.index[-1]
+
+
+@pytest.mark.parametrize("n, buckets", [(1000, 400), (401, 400), (10, 3)])
+def test_ohlc_buckets_aggregate_like_candles(n, buckets):
+    df = _bars(n)
+    out = downsample.ohlc_buckets(df, buckets)
+    assert len(out) == buckets
+    assert out.index[0] == df.index[0]
+    assert out["Close"].iloc[-1] == df["Close"].iloc[-1]
+    assert out["Open"].iloc[0] == df["Open"].iloc[0]
+    assert out["High"].max() == df["High"].max()
+    assert out["Low"].min() == df["Low"].min()
+    assert out["Volume"].sum() == pytest.approx(df["Volume"].sum())
+
+    # Each bucket covers the rows from its stamp up to the next one
+    bounds = list(df.index.get_indexer(out.index)) + [n]
+    for i, (lo, hi) in enumerate(zip(bounds, bounds[1:])):
+        rows = df.iloc[lo:hi]
+        assert out["Open"].iloc[i] == rows["Open"].iloc[0]
+        assert out["High"].iloc[i] == rows["High"].max()
+        assert out["Low"].iloc[i] == rows["Low"].min()
+        assert out["Close"].iloc[i] == rows["Close"].iloc[-1]
+
+
+def test_ohlc_buckets_other_columns_keep_last_value():
+    df = _bars(10).assign(Benchmark=np.arange(10.0))
+    out = downsample.ohlc_buckets(df, 2)
+    assert out["Benchmark"].tolist() == [4.0, 9.0]
+
+
+def test_ohlc_buckets_under_budget_is_unchanged():
+    df = _bars(50)
+    assert downsample.ohlc_buckets(df, 50) is df
+
+
+def test_for_chart_budgets():
+    df = _bars(5000)
+    assert len(downsample.for_chart(df, candles=True)) == downsample.candle_budget()
+    assert len(downsample.for_chart(df, candles=False)) == downsample.line_budget()
+    assert len(downsample.for_chart(df, candles=True, width_px=800)) == 200
+    assert downsample.line_budget(1) == 3
+    assert downsample.candle_budget(1) == 1
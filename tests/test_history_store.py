@@ -0,0 +1,72 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import history_store
+from conftest import HISTORY_CSV
+
+RAW = pd.DataFrame({
+    "Selection_date": ["15/01/2024", "15/01/2024", "14/02/2024", "14/02/2024"],
+    "Rebalance_date": ["29/02/2024", "31/01/2024", "29/02/2024", "not a date"],
+    "Ticker": ["FB", "AAPL", "META", "AAPL"],
+    "Weight": ["0.5", "0.25", "x", "0.1"],
+    "Score": [3.0, 1.0, 2.0, 0.5],
+})
+
+
+def test_normalize_history():
+    df = history_store.normalize_history(RAW)
+    assert df["Rebalance_date"].tolist() == pd.to_datetime(["2024-01-31", "2024-02-29", "2024-02-29"]).tolist()
+    assert df["Ticker"].tolist() == ["AAPL", "META", "META"]  # FB merged into META, file order kept on ties
+    assert isinstance(df["Ticker"].dtype, pd.CategoricalDtype)
+    assert df["Weight"].isna().tolist() == [False, False, True]
+    assert df.index.tolist() == [0, 1, 2]
+
+
+@pytest.fixture
+def history_copy(tmp_path):
+    path = tmp_path / history_store.HISTORY_FILENAME
+    shutil.copyfile(HISTORY_CSV, path)
+    return path
+
+
+def test_sidecar_round_trips_the_parsed_csv(history_copy):
+    parsed = history_store._read_history(history_copy)
+    assert history_store.sidecar_path(history_copy).exists()
+    loaded = history_store._read_sidecar(history_copy, history_store._source_key(history_copy))
+    pd.testing.assert_frame_equal(loaded, parsed)
+    pd.testing.assert_frame_equal(parsed, history_store.normalize_history(pd.read_csv(history_copy)))
+
+
+def test_sidecar_is_ignored_once_the_csv_changes(history_copy):
+    history_store._read_history(history_copy)
+    stat = history_copy.stat()
+    os.utime(history_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert history_store._read_sidecar(history_copy, history_store._source_key(history_copy)) is None
+
+
+def test_load_history_is_shared_but_copy_local(history_copy):
+    first = history_store.load_history(history_copy)
+    first["Extra"] = 1
+    second = history_store.load_history(history_copy)
+    assert "Extra" not in second.columns
+    with pytest.raises(FileNotFoundError):
+        history_store.load_history(history_copy.with_name("missing.csv"))
+
+
+def test_ticker_index_slices_and_summary(history):
+    index = history_store.build_ticker_index(history)
+    frame = index["frame"]
+    for ticker, entry in index["summary"].items():
+        rows = frame.iloc[entry["row_start"]:entry["row_stop"]]
+        assert (rows["Ticker"].astype(str) == ticker).all()
+        assert rows["Rebalance_date"].is_monotonic_increasing
+        held = rows[rows["Weight"] > 0]
+        assert entry["months_held"] == len(held)
+        if len(held):
+            assert entry["first_date"] == held["Rebalance_date"].min()
+            assert entry["max_weight"] == held["Weight"].max()
+            assert entry["max_weight_date"] == held.loc[held["Weight"].idxmax(), "Rebalance_date"]
+    assert sum(e["row_stop"] - e["row_start"] for e in index["summary"].values()) == len(history)
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+
+import price_cache
+
+
+def _ts(text: str) -> float:
+    return datetime.fromisoformat(text).replace(tzinfo=price_cache.MARKET_TZ).timestamp()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(price_cache, "_entries", {})
+    monkeypatch.setattr(price_cache, "_stats", {})
+    monkeypatch.setattr(price_cache, "_refreshing", set())
+
+
+@pytest.fixture
+def inline_refresh(monkeypatch):
+    """Run background refreshes synchronously, recording each submission."""
+    submitted = []
+    def submit_background(fn, *args):
+        submitted.append(args[:2])
+        fn(*args)
+    monkeypatch.setattr(price_cache.fetch_pool, "submit_background", submit_background)
+    return submitted
+
+
+def _expire(kind: str, key) -> None:
+    price_cache._entries[(kind, key)] = (0.0, price_cache._entries[(kind, key)][1])
+
+
+@pytest.mark.parametrize("when, is_open", [
+    ("2024-06-12 09:29", False),  # Wednesday, before the open
+    ("2024-06-12 09:30", True),
+    ("2024-06-12 16:14", True),   # inside the close grace
+    ("2024-06-12 16:15", False),
+    ("2024-06-15 12:00", False),  # Saturday
+])
+def test_market_is_open(when, is_open):
+    assert price_cache.market_is_open(_ts(when)) is is_open
+
+
+def test_closed_market_entries_last_until_the_next_open():
+    friday_evening = _ts("2024-06-14 18:00")
+    assert price_cache.next_open(friday_evening) == _ts("2024-06-17 09:30")
+    # Capped at MAX_CLOSED_TTL over a weekend
+    assert price_cache.expires_at("daily", friday_evening) == friday_evening + price_cache.MAX_CLOSED_TTL
+    early = _ts("2024-06-12 06:00")
+    assert price_cache.expires_at("daily", early) == _ts("2024-06-12 09:30")
+    midday = _ts("2024-06-12 12:00")
+    assert price_cache.expires_at("intraday", midday) == midday + price_cache.OPEN_TTL["intraday"]
+
+
+def test_miss_then_hit(inline_refresh):
+    calls = []
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert price_cache.get_or_refresh("daily", "AAPL", fetch) == 1
+    assert price_cache.get_or_refresh("daily", "AAPL", fetch) == 1
+    assert calls == [1]
+    assert inline_refresh == []
+    assert price_cache.stats() == {"daily": {"hits": 1, "misses": 1, "stale": 0, "refresh_errors": 0}}
+
+
+def test_expired_value_is_served_while_refreshing(inline_refresh):
+    values = iter(["old", "new"])
+    price_cache.get_or_refresh("intraday", "AAPL", lambda: next(values))
+    _expire("intraday", "AAPL")
+
+    assert price_cache.get_or_refresh("intraday", "AAPL", lambda: next(values)) == "old"
+    assert inline_refresh == [("intraday", "AAPL")]
+    assert price_cache.get_or_refresh("intraday", "AAPL", lambda: "unused") == "new"
+    assert price_cache.stats()["intraday"] == {"hits": 1, "misses": 1, "stale": 1, "refresh_errors": 0}
+
+
+def test_failed_refresh_keeps_the_stale_value(inline_refresh):
+    price_cache.get_or_refresh("daily", "AAPL", lambda: "old")
+    _expire("daily", "AAPL")
+
+    def fail():
+        raise ConnectionError("boom")
+    assert price_cache.get_or_refresh("daily", "AAPL", fail) == "old"
+    # Served as fresh until the retry pause is over
+    assert price_cache.get_or_refresh("daily", "AAPL", fail) == "old"
+    assert len(inline_refresh) == 1
+    assert price_cache.stats()["daily"]["refresh_errors"] == 1
+    assert not price_cache._refreshing
+
+
+def test_one_refresh_per_key_at_a_time(monkeypatch):
+    submitted = []
+    monkeypatch.setattr(price_cache.fetch_pool, "submit_background", lambda fn, *args: submitted.append(args))
+    price_cache.put("daily", "AAPL", "old")
+    _expire("daily", "AAPL")
+    for _ in range(3):
+        assert price_cache.get_or_refresh("daily", "AAPL", lambda: "new") == "old"
+    assert len(submitted) == 1
+    assert price_cache.stats()["daily"]["stale"] == 3
@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+import rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_global", rate_limiter._Bucket(1000.0, 1000))
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(rate_limiter, "_waiters", {})
+    monkeypatch.setattr(rate_limiter, "_stats", {})
+    monkeypatch.setattr(rate_limiter, "ENDPOINT_BUDGETS", {"test:slow": (0.001, 2)})
+
+
+def test_burst_then_rejection(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "MAX_WAIT", {**rate_limiter.MAX_WAIT, rate_limiter.INTERACTIVE: 0.05})
+    rate_limiter.acquire("test:slow")
+    rate_limiter.acquire("test:slow")
+    with pytest.raises(rate_limiter.RateLimitedError):
+        rate_limiter.acquire("test:slow")
+    counters = rate_limiter.stats()["test:slow"][rate_limiter.INTERACTIVE]
+    assert (counters["acquired"], counters["queued"], counters["rejected"]) == (2, 1, 1)
+
+
+def test_endpoints_have_separate_buckets():
+    for _ in range(2):
+        rate_limiter.acquire("test:slow")
+    # A dry endpoint does not hold up another one
+    rate_limiter.acquire("test:other")
+    assert rate_limiter.stats()["test:other"][rate_limiter.INTERACTIVE]["acquired"] == 1
+
+
+def test_priority_context():
+    assert rate_limiter.current_priority() == rate_limiter.INTERACTIVE
+    with rate_limiter.priority(rate_limiter.BACKGROUND):
+        assert rate_limiter.current_priority() == rate_limiter.BACKGROUND
+    assert rate_limiter.current_priority() == rate_limiter.INTERACTIVE
+    with pytest.raises(ValueError):
+        with rate_limiter.priority("urgent"):
+            pass
+
+
+def test_interactive_waiters_are_served_before_background(monkeypatch):
+    # One token every 500ms, none in hand
+    monkeypatch.setattr(rate_limiter, "_global", rate_limiter._Bucket(2.0, 1))
+    rate_limiter.acquire("test:a")
+    granted = []
+
+    def take(prio, label):
+        with rate_limiter.priority(prio):
+            rate_limiter.acquire("test:a")
+        granted.append(label)
+
+    background = threading.Thread(target=take, args=(rate_limiter.BACKGROUND, "background"))
+    background.start()
+    while rate_limiter.stats()["waiting"][rate_limiter.BACKGROUND] == 0:
+        time.sleep(0.001)
+    interactive = threading.Thread(target=take, args=(rate_limiter.INTERACTIVE, "interactive"))
+    interactive.start()
+    background.join(5)
+    interactive.join(5)
+    assert granted == ["interactive", "background"]
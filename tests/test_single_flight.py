@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+import single_flight
+
+
+def _run_concurrently(count: int, target) -> tuple[list, list]:
+    results = [None] * count
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as exc:
+            results[i] = exc
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def _wait_for_waiters(key, count: int) -> None:
+    for _ in range(1000):
+        with single_flight._lock:
+            flight = single_flight._flights.get(key)
+            if flight is not None and flight.waiters == count:
+                return
+        threading.Event().wait(0.005)
+    raise AssertionError("callers never joined the flight")
+
+
+def test_concurrent_callers_share_one_call():
+    release = threading.Event()
+    calls = []
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    threads, results = _run_concurrently(5, lambda: single_flight.do("k", fetch))
+    _wait_for_waiters("k", 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+    assert results == ["value"] * 5
+    assert single_flight.stats()["in_flight"] == 0
+
+
+def test_waiters_get_the_leaders_exception():
+    release = threading.Event()
+    def fetch():
+        release.wait(5)
+        raise ValueError("no data")
+
+    threads, results = _run_concurrently(3, lambda: single_flight.do("err", fetch))
+    _wait_for_waiters("err", 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_sequential_calls_are_not_cached():
+    calls = []
+    for _ in range(3):
+        single_flight.do("seq", lambda: calls.append(1))
+    assert len(calls) == 3
+
+
+def test_coalesced_keys_on_arguments():
+    calls = []
+
+    @single_flight.coalesced
+    def fetch(symbol, period="1d"):
+        calls.append((symbol, period))
+        return symbol.lower()
+
+    assert fetch("AAPL", period="5d") == "aapl"
+    assert calls == [("AAPL", "5d")]
+    with pytest.raises(TypeError):
+        fetch(["unhashable"])
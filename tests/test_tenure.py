@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import history_store
+
+
+def _old_current_streak(dates) -> int:
+    """The per-ticker loop compute_tenure replaced (count back until a gap)."""
+    dates = sorted(dates)
+    streak = 1
+    for i in range(len(dates) - 1, 0, -1):
+        if 25 <= (pd.Timestamp(dates[i]) - pd.Timestamp(dates[i - 1])).days <= 35:
+            streak += 1
+        else:
+            break
+    return streak
+
+
+def _runs(dates) -> list[int]:
+    dates = sorted(dates)
+    runs = [1]
+    for prev, cur in zip(dates, dates[1:]):
+        if 25 <= (pd.Timestamp(cur) - pd.Timestamp(prev)).days <= 35:
+            runs[-1] += 1
+        else:
+            runs.append(1)
+    return runs
+
+
+def _tenure(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.sort_values(["Ticker", "Rebalance_date"])
+    return history_store.compute_tenure(df["Ticker"], df["Rebalance_date"])
+
+
+def _assert_matches_loops(df: pd.DataFrame, tenure: pd.DataFrame) -> None:
+    for ticker, rows in df.groupby("Ticker"):
+        dates = rows["Rebalance_date"].tolist()
+        runs = _runs(dates)
+        got = tenure.loc[str(ticker)]
+        assert got["current_streak"] == _old_current_streak(dates), ticker
+        assert got["longest_streak"] == max(runs), ticker
+        assert got["stints"] == len(runs), ticker
+        assert got["months_held"] == len(dates), ticker
+
+
+def test_matches_old_loop_on_shipped_history(history):
+    df = history[["Ticker", "Rebalance_date"]].dropna()
+    _assert_matches_loops(df, _tenure(df))
+
+
+def test_matches_old_loop_on_irregular_calendar():
+    rng = np.random.default_rng(7)
+    rows = []
+    for t in range(40):
+        day = pd.Timestamp("2020-01-01") + pd.Timedelta(days=int(rng.integers(0, 60)))
+        for _ in range(int(rng.integers(1, 25))):
+            rows.append((f"T{t}", day))
+            # Mostly monthly steps, with gaps and boundary steps mixed in
+            day += pd.Timedelta(days=int(rng.choice([24, 25, 30, 31, 35, 36, 61, 90])))
+    df = pd.DataFrame(rows, columns=["Ticker", "Rebalance_date"])
+    _assert_matches_loops(df, _tenure(df))
+
+
+@pytest.mark.parametrize("gap, linked", [(24, False), (25, True), (35, True), (36, False)])
+def test_consecutive_window_bounds(gap, linked):
+    first = pd.Timestamp("2024-01-01")
+    dates = pd.Series([first, first + pd.Timedelta(days=gap)])
+    tenure = history_store.compute_tenure(pd.Series(["A", "A"]), dates)
+    assert tenure.loc["A", "current_streak"] == (2 if linked else 1)
+    assert tenure.loc["A", "stints"] == (1 if linked else 2)
+
+
+def test_single_appearance_and_empty():
+    tenure = history_store.compute_tenure(pd.Series(["A"]), pd.Series(pd.to_datetime(["2024-01-01"])))
+    assert tenure.loc["A"].tolist() == [1, 1, 1, 1]
+    empty = history_store.compute_tenure(pd.Series([], dtype=object), pd.Series([], dtype="datetime64[ns]"))
+    assert empty.empty
+    assert list(empty.columns) == ["current_streak", "longest_streak", "stints", "months_held"]
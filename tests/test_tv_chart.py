@@ -0,0 +1,110 @@
+import base64
+
+import numpy as np
+
+import tv_chart
+
+
+def _series(n: int, start: float = 100.0) -> dict[str, np.ndarray]:
+    return {
+        "time": 1_700_000_000 + 60 * np.arange(n, dtype=float),
+        "value": start + np.arange(n, dtype=float),
+    }
+
+
+def _decode(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype="<f8")
+
+
+def _extend(columns: dict[str, np.ndarray], extra: int) -> dict[str, np.ndarray]:
+    n = len(columns["time"])
+    longer = _series(n + extra)
+    return {name: np.concatenate([values, longer[name][n:]]) for name, values in columns.items()}
+
+
+def test_encode_round_trips_from_start():
+    columns = _series(5)
+    columns["value"][2] = np.nan
+    encoded = tv_chart._encode(columns, 3)
+    assert _decode(encoded["time"]).tolist() == columns["time"][3:].tolist()
+    assert _decode(encoded["value"]).tolist() == columns["value"][3:].tolist()
+    assert np.isnan(_decode(tv_chart._encode(columns)["value"])[2])
+
+
+def test_delta_start():
+    old = _series(10)
+    sent = {"columns": old, "daily": False}
+    assert tv_chart._delta_start(sent, _series(10), False) == 10
+    assert tv_chart._delta_start(sent, _extend(old, 3), False) == 10
+
+    last_changed = _extend(old, 2)
+    last_changed["value"][9] += 0.5
+    assert tv_chart._delta_start(sent, last_changed, False) == 9
+
+    history_changed = _extend(old, 1)
+    history_changed["value"][3] += 0.5
+    assert tv_chart._delta_start(sent, history_changed, False) is None
+
+    assert tv_chart._delta_start(sent, _series(10), True) is None
+    assert tv_chart._delta_start(sent, _series(9), False) is None
+    assert tv_chart._delta_start(sent, {"time": old["time"]}, False) is None
+    assert tv_chart._delta_start({"columns": _series(0), "daily": False}, _series(3), False) is None
+
+
+def test_delta_start_treats_nan_as_unchanged():
+    old = _series(5)
+    old["value"][1] = np.nan
+    new = {name: values.copy() for name, values in old.items()}
+    assert tv_chart._delta_start({"columns": old, "daily": False}, new, False) == 5
+
+
+def test_payload_revisions_and_bases():
+    sent = {}
+    first = tv_chart._payload(sent, "data", _series(10), False)
+    assert first["base"] is None
+    assert len(_decode(first["columns"]["time"])) == 10
+
+    # New bars: only they are sent, on top of the previous revision
+    grown = _extend(_series(10), 2)
+    delta = tv_chart._payload(sent, "data", grown, False)
+    assert delta["base"] == first["revision"]
+    assert delta["revision"] > first["revision"]
+    assert _decode(delta["columns"]["time"]).tolist() == grown["time"][10:].tolist()
+
+    # Only the last bar moved: it is resent alone
+    moved = {name: values.copy() for name, values in grown.items()}
+    moved["value"][-1] += 1.0
+    tick = tv_chart._payload(sent, "data", moved, False)
+    assert tick["base"] == delta["revision"]
+    assert _decode(tick["columns"]["value"]).tolist() == [moved["value"][-1]]
+
+    # Nothing changed: same revision, nothing to draw
+    same = tv_chart._payload(sent, "data", moved, False)
+    assert same["revision"] == same["base"] == tick["revision"]
+    assert all(value == "" for value in same["columns"].values())
+
+    # Rewritten history or a daily/intraday switch: full resend
+    rewritten = {name: values.copy() for name, values in moved.items()}
+    rewritten["value"][0] -= 1.0
+    full = tv_chart._payload(sent, "data", rewritten, False)
+    assert full["base"] is None and full["revision"] > tick["revision"]
+    switched = tv_chart._payload(sent, "data", rewritten, True)
+    assert switched["base"] is None and switched["daily"] is True
+
+
+def test_payload_generation_tracks_last_full_send():
+    sent = {}
+    first = tv_chart._payload(sent, "data", _series(5), False)
+    tv_chart._payload(sent, "data", _extend(_series(5), 1), False)
+    assert sent["data"]["generation"] == first["revision"]
+    full = tv_chart._payload(sent, "data", _series(3), False)
+    assert sent["data"]["generation"] == full["revision"]
+
+
+def test_payload_none_forgets_the_series():
+    sent = {}
+    tv_chart._payload(sent, "compare", _series(5), False)
+    assert tv_chart._payload(sent, "compare", None, False) is None
+    assert "compare" not in sent
+    again = tv_chart._payload(sent, "compare", _series(5), False)
+    assert again["base"] is None
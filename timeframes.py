@@ -0,0 +1,108 @@
+"""
+Chart timeframes derived from two series per symbol.
+
+Every view maps 1D/5D/1M/6M/YTD/1Y/ALL to a (period, interval) pair. Instead of
+one Yahoo request per pair, each symbol keeps:
+
+- one intraday series (INTRADAY_PERIOD of INTRADAY_INTERVAL bars, kept in
+  price_cache), resampled to 30m/1h for 5D/1M
+- one daily series (the persistent ohlcv_store), sliced for 6M/YTD/1Y/ALL and
+  for the hero period returns
+
+Switching the timeframe radio therefore only slices and resamples local data.
+"""
+
+import pandas as pd
+import yfinance as yf
+
+import circuit_breaker
+import ohlcv_store
+import price_cache
+
+# label -> (Yahoo period, bar interval), shared by every chart view
+TIMEFRAMES = {
+    "1D": ("1d", "5m"), "5D": ("5d", "30m"), "1M": ("1mo", "1h"),
+    "6M": ("6mo", "1d"), "YTD": ("ytd", "1d"), "1Y": ("1y", "1d"), "ALL": ("max", "1d"),
+}
+
+# One intraday download covers 1D, 5D and 1M (Yahoo serves 5m bars for up to 60 days)
+INTRADAY_PERIOD = "1mo"
+INTRADAY_INTERVAL = "5m"
+
+# Intraday bins start on the half hour like Yahoo's own 30m/1h bars (09:30, 10:30, ...)
+_RESAMPLE_RULES = {"5m": None, "30m": ("30min", "0min"), "1h": ("60min", "30min")}
+_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+
+def _fetch_intraday(symbol: str) -> pd.DataFrame:
+    hist = circuit_breaker.call_for_symbol("yahoo:v8", symbol, yf.Ticker(symbol).history,
+                                           period=INTRADAY_PERIOD, interval=INTRADAY_INTERVAL)
+    if hist.empty or "Close" not in hist.columns:
+        # Raise so price_cache keeps serving the previous series rather than an empty chart
+        raise ValueError(f"No intraday bars for {symbol}")
+    return hist[list(_AGG)].dropna(subset=["Close"])
+
+
+def get_intraday(symbol: str) -> pd.DataFrame:
+    """
+    INTRADAY_INTERVAL bars over INTRADAY_PERIOD from price_cache; once loaded, an
+    expired series is served while it is refreshed in the background.
+    """
+    try:
+        return price_cache.get_or_refresh("intraday", symbol, lambda: _fetch_intraday(symbol))
+    except Exception:
+        return pd.DataFrame(columns=list(_AGG))
+
+
+def _resample(bars: pd.DataFrame, interval: str) -> pd.DataFrame:
+    rule = _RESAMPLE_RULES[interval]
+    if rule is None or bars.empty:
+        return bars
+    freq, offset = rule
+    return bars.resample(freq, offset=offset).agg(_AGG).dropna(subset=["Close"])
+
+
+def _last_sessions(bars: pd.DataFrame, n: int) -> pd.DataFrame:
+    """Bars from the last `n` trading dates present in `bars`."""
+    if bars.empty:
+        return bars
+    dates = bars.index.normalize()
+    keep = dates.unique()[-n:]
+    return bars[dates.isin(keep)]
+
+
+def _slice_intraday(bars: pd.DataFrame, period: str) -> pd.DataFrame:
+    if period == "1d":
+        return _last_sessions(bars, 1)
+    if period == "5d":
+        return _last_sessions(bars, 5)
+    return ohlcv_store.slice_period(bars, period)
+
+
+def chart_history(symbol: str, timeframe: str) -> pd.DataFrame:
+    """Bars for a TIMEFRAMES label, equivalent to history(period, interval) for that label."""
+    period, interval = TIMEFRAMES[timeframe]
+    if interval == "1d":
+        return ohlcv_store.slice_period(ohlcv_store.get_daily(symbol), period).copy()
+    bars = _slice_intraday(get_intraday(symbol), period)
+    return _resample(bars, interval).copy()
+
+
+def daily_history(symbol: str, timeframe: str) -> pd.DataFrame:
+    """Daily bars covering a TIMEFRAMES label's period (history(period, "1d") equivalent)."""
+    period, _interval = TIMEFRAMES[timeframe]
+    daily = ohlcv_store.get_daily(symbol)
+    if period == "1d":
+        return daily.iloc[-1:].copy()
+    if period == "5d":
+        return daily.iloc[-5:].copy()
+    return ohlcv_store.slice_period(daily, period).copy()
+
+
+def period_return(symbol: str, timeframe: str) -> tuple[float, float]:
+    """(absolute change, % change) between the first and last daily close of the timeframe."""
+    closes = daily_history(symbol, timeframe)["Close"]
+    if len(closes) < 2 or not closes.iloc[0]:
+        return 0.0, 0.0
+    change = float(closes.iloc[-1] - closes.iloc[0])
+    return change, change / float(closes.iloc[0]) * 100
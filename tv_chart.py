@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+TradingView Lightweight Charts as a static Streamlit custom component.
+
+The component lives in components/tradingview_chart/: index.html, chart.js and
+the vendored Lightweight Charts bundle are served by Streamlit as static files,
+so the browser fetches them once and caches them, and no chart depends on a CDN.
+
+The iframe is keyed, so it and its chart survive reruns, timeframe switches and
+benchmark swaps. render() remembers per key which bars the iframe already
+holds and, when the new series only extends them (a live refresh adding
+intraday bars), sends just the changed last bar and the new ones; otherwise it
+sends the full series. Each payload carries a revision and the revision it
+applies to, so an iframe that missed an update (or was reloaded) asks for a
+full resend instead of drawing a gap. The component's value reports that, plus
+the last drag-to-measure range, back to Python.
+
+The bundle is pinned to LIGHTWEIGHT_CHARTS_VERSION and committed next to its
+LICENSE. To re-vendor it (e.g. after bumping the version) on a machine with
+network access, then commit both files:
+
+Usage:
+    python tv_chart.py --vendor   # download the bundle and its LICENSE
+    python tv_chart.py            # show whether the bundle is vendored
+"""
+
+import argparse
+import base64
+import functools
+import itertools
+from pathlib import Path
+
+import numpy as np
+
+LIGHTWEIGHT_CHARTS_VERSION = "4.1.3"
+COMPONENT_DIR = Path(__file__).resolve().parent / "components" / "tradingview_chart"
+BUNDLE_FILENAME = "lightweight-charts.standalone.production.js"
+
+_UNPKG = f"https://unpkg.com/lightweight-charts@{LIGHTWEIGHT_CHARTS_VERSION}"
+VENDOR_FILES = {
+    BUNDLE_FILENAME: f"{_UNPKG}/dist/{BUNDLE_FILENAME}",
+    "LICENSE": f"{_UNPKG}/LICENSE",
+}
+
+
+@functools.cache
+def _component():
+    # Imported here so the vendoring CLI runs without Streamlit
+    import streamlit.components.v1 as components
+    return components.declare_component("tradingview_chart", path=str(COMPONENT_DIR))
+
+
+_revisions = itertools.count(1)
+
+
+def _encode(columns: dict[str, np.ndarray], start: int = 0) -> dict[str, str]:
+    """
+    Rows start: of each column as base64 little-endian float64 (decoded by the
+    component's fromColumns()), so thousands of bars serialize without
+    formatting a float per value.
+    """
+    return {
+        name: base64.b64encode(np.ascontiguousarray(values[start:], dtype="<f8").tobytes()).decode("ascii")
+        for name, values in columns.items()
+    }
+
+
+def _delta_start(sent: dict, columns: dict[str, np.ndarray], daily: bool) -> int | None:
+    """
+    First row of `columns` the iframe does not already hold, or None if they do
+    not extend what was sent (everything must be resent). Only the last sent bar
+    may have changed; len(sent) means nothing changed at all.
+    """
+    old = sent["columns"]
+    if sent["daily"] != daily or old.keys() != columns.keys():
+        return None
+    n = len(old["time"])
+    if n == 0 or len(columns["time"]) < n or columns["time"][n - 1] != old["time"][n - 1]:
+        return None
+    for name, values in columns.items():
+        if not np.array_equal(values[:n - 1], old[name][:n - 1], equal_nan=True):
+            return None
+    last_same = all(np.array_equal(values[n - 1:n], old[name][n - 1:], equal_nan=True)
+                    for name, values in columns.items())
+    return n if last_same else n - 1
+
+
+def _payload(sent_by_name: dict, name: str, columns: dict[str, np.ndarray] | None, daily: bool) -> dict | None:
+    """Full or delta payload for series `name`, recording what the iframe will hold afterwards."""
+    if columns is None:
+        sent_by_name.pop(name, None)
+        return None
+    sent = sent_by_name.get(name)
+    start = _delta_start(sent, columns, daily) if sent else None
+    if start is None:
+        base, start, revision = None, 0, next(_revisions)
+    else:
+        base = sent["revision"]
+        revision = base if start == len(columns["time"]) else next(_revisions)
+    sent_by_name[name] = {
+        "revision": revision, "columns": columns, "daily": daily,
+        # Revision of the last full send: a measured range is only valid for that series
+        "generation": revision if base is None else sent["generation"],
+    }
+    return {"revision": revision, "base": base, "daily": daily, "columns": _encode(columns, start)}
+
+
+def render(columns: dict[str, np.ndarray], daily: bool, *, key: str, candlestick: bool,
+           compare_columns: dict[str, np.ndarray] | None = None, compare_daily: bool = False,
+           period_avg: float | None = None, compare_name: str = "", compare_color: str = "#a78bfa",
+           show_tooltip: bool = True, height: int = 540) -> dict | None:
+    """
+    Draw or update the chart keyed `key`. `columns` (and `compare_columns`) map
+    field names to equal-length arrays including "time" in Unix seconds; `daily`
+    times are wall-clock midnights shown as dates.
+
+    Returns the last drag-to-measure range on this series as
+    {"from", "to", "fromPrice", "toPrice", "pctChange"}, or None.
+    """
+    import streamlit as st
+
+    sent_by_key = st.session_state.setdefault("_tv_chart_sent", {})
+    sent_by_name = sent_by_key.setdefault(key, {})
+    value = st.session_state.get(key)
+    if value and value.get("needFull"):
+        sent_by_name.clear()
+
+    value = _component()(
+        data=_payload(sent_by_name, "data", columns, daily),
+        compare=_payload(sent_by_name, "compare", compare_columns, compare_daily),
+        candlestick=candlestick, period_avg=period_avg, compare_name=compare_name,
+        compare_color=compare_color, show_tooltip=show_tooltip, height=height,
+        key=key, default=None,
+    )
+    if value and value.get("measure") and value.get("generation") == sent_by_name["data"]["generation"]:
+        return value["measure"]
+    return None
+
+
+def is_vendored() -> bool:
+    return all((COMPONENT_DIR / name).exists() for name in VENDOR_FILES)
+
+
+def vendor() -> list[Path]:
+    """Download the pinned bundle and its license into COMPONENT_DIR."""
+    import requests
+
+    written = []
+    for name, url in VENDOR_FILES.items():
+        resp = requests.get(url, timeout=30)
+        resp.raise_for_status()
+        path = COMPONENT_DIR / name
+        path.write_bytes(resp.content)
+        written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vendor", action="store_true",
+                        help=f"download lightweight-charts {LIGHTWEIGHT_CHARTS_VERSION} into {COMPONENT_DIR.name}/")
+    args = parser.parse_args()
+
+    if args.vendor:
+        for path in vendor():
+            print(f"wrote {path.relative_to(COMPONENT_DIR.parent.parent)} ({path.stat().st_size:,} bytes)")
+        return
+    state = "vendored" if is_vendored() else "missing (run with --vendor)"
+    print(f"lightweight-charts {LIGHTWEIGHT_CHARTS_VERSION}: {state}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Process-wide pooled HTTP client for the Yahoo Finance JSON endpoints.
+
+Every Yahoo call goes through one requests.Session, so TCP+TLS connections are
+reused across reruns, tickers and the v10 -> v7 fallback pair instead of being
+set up per request. The pool is bounded per host, responses are requested
+gzip/deflate-compressed, and each host gets its own (connect, read) timeout.
+
+yfinance keeps its own session (it requires curl_cffi), so only the direct
+query1/query2 requests are pooled here.
+
+The module also keeps batched v7 quotes (refresh_quotes / prefetch_quotes /
+get_batched_quote), served stale-while-revalidate, and the P/S ratio they lack
+(get_price_to_sales), fetched lazily in the background.
+State lives here rather than in app.py because Streamlit re-executes the app
+script on every rerun, while imported modules persist for the process.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import circuit_breaker
+import fetch_pool
+import rate_limiter
+import single_flight
+
+# Connection pools kept (one per host) and max open connections per host
+POOL_HOSTS = 4
+POOL_MAXSIZE = 8
+
+# (connect, read) seconds per host; DEFAULT_TIMEOUT for anything else
+HOST_TIMEOUTS = {
+    "query1.finance.yahoo.com": (3.05, 10),
+    "query2.finance.yahoo.com": (3.05, 10),
+}
+DEFAULT_TIMEOUT = (3.05, 10)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Batched v7 quotes: one request per QUOTE_BATCH_SIZE symbols
+QUOTE_URL = "https://query2.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE = 40
+QUOTE_BATCH_TTL = 600  # seconds, same as the app's live-data cache
+QUOTE_MAX_STALE = 3600  # expired quotes are still served this long while a refresh runs
+
+# P/S is not in v7 quotes: it is fetched per symbol from v10 on a background worker
+SUMMARY_URL = "https://query1.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+PRICE_TO_SALES_TTL = 21600  # seconds, same as the app's key-metrics cache
+
+_lock = threading.Lock()
+_session: requests.Session | None = None
+_quotes: dict[str, tuple[float, dict | None]] = {}  # symbol -> (fetched_at, v7 quote or None)
+_quote_refresh_running = False
+_price_to_sales: dict[str, tuple[float, float | None]] = {}  # symbol -> (fetched_at, P/S or None)
+_price_to_sales_pending: set[str] = set()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # No transport-level retries: callers already fall back between endpoints
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE, pool_block=True, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """The shared session (created on first use)."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def timeout_for(url: str) -> tuple[float, float]:
+    """(connect, read) timeout for the host in `url`."""
+    return HOST_TIMEOUTS.get(urlsplit(url).hostname or "", DEFAULT_TIMEOUT)
+
+
+def endpoint_for(url: str) -> str:
+    """Breaker name for a Yahoo URL: the API version, e.g. "yahoo:v7" or "yahoo:v10"."""
+    parts = urlsplit(url)
+    version = parts.path.strip("/").split("/", 1)[0]
+    return f"yahoo:{version}" if version else f"yahoo:{parts.hostname}"
+
+
+def get(url: str, params: dict | None = None, headers: dict | None = None,
+        timeout: tuple[float, float] | float | None = None) -> requests.Response:
+    """
+    GET through the pooled session. `headers` are merged over the session defaults.
+    Guarded by the endpoint's circuit breaker: raises CircuitOpenError while it is
+    open; timeouts, connection errors, 429 and 5xx responses count as failures.
+    Waits for a rate_limiter token first (RateLimitedError if none comes in time).
+    """
+    endpoint = endpoint_for(url)
+    if circuit_breaker.is_open(endpoint):
+        raise circuit_breaker.CircuitOpenError(endpoint)
+    rate_limiter.acquire(endpoint)
+    if not circuit_breaker.allow(endpoint):
+        raise circuit_breaker.CircuitOpenError(endpoint)
+    try:
+        resp = get_session().get(url, params=params, headers=headers, timeout=timeout or timeout_for(url))
+    except requests.RequestException:
+        circuit_breaker.record_failure(endpoint)
+        raise
+    if resp.status_code == 429 or resp.status_code >= 500:
+        circuit_breaker.record_failure(endpoint)
+    else:
+        circuit_breaker.record_success(endpoint)
+    return resp
+
+
+def _fetch_quote_chunk(symbols: list[str]) -> dict[str, dict]:
+    """One v7 quote request for several symbols. Returns {symbol: quote}."""
+    resp = get(QUOTE_URL, params={"symbols": ",".join(symbols)},
+               headers={"Referer": "https://finance.yahoo.com/"})
+    if resp.status_code != 200:
+        return {}
+    quotes = resp.json().get("quoteResponse", {}).get("result", [])
+    return {q["symbol"]: q for q in quotes if q.get("symbol")}
+
+
+def prefetch_quotes(symbols) -> int:
+    """
+    Fetch v7 quotes for every symbol whose batched quote is missing or older than
+    QUOTE_BATCH_TTL, in chunks of QUOTE_BATCH_SIZE. Cheap when everything is fresh.
+    Returns the number of symbols requested.
+    """
+    now = time.time()
+    with _lock:
+        stale = [s for s in dict.fromkeys(symbols) if s not in _quotes or now - _quotes[s][0] > QUOTE_BATCH_TTL]
+
+    for start in range(0, len(stale), QUOTE_BATCH_SIZE):
+        chunk = stale[start:start + QUOTE_BATCH_SIZE]
+        try:
+            # Sessions rerunning together compute the same stale chunks; fetch each once
+            quotes = single_flight.do(("quotes", tuple(chunk)), lambda: _fetch_quote_chunk(chunk))
+        except Exception:
+            continue  # Leave the chunk stale; per-ticker fallbacks still work
+        with _lock:
+            # Symbols Yahoo did not return are remembered as None so they are not re-requested every rerun
+            for symbol in chunk:
+                _quotes[symbol] = (now, quotes.get(symbol))
+    return len(stale)
+
+
+def _background_prefetch(symbols) -> None:
+    global _quote_refresh_running
+    try:
+        prefetch_quotes(symbols)
+    finally:
+        with _lock:
+            _quote_refresh_running = False
+
+
+def refresh_quotes(symbols) -> None:
+    """
+    Keep batched quotes current without blocking a rerun: symbols never fetched
+    are loaded synchronously; expired ones are refreshed on a background worker
+    (one refresh at a time) while get_batched_quote keeps serving them.
+    """
+    global _quote_refresh_running
+    now = time.time()
+    with _lock:
+        missing = [s for s in symbols if s not in _quotes]
+        expired = any(now - _quotes[s][0] > QUOTE_BATCH_TTL for s in symbols if s in _quotes)
+        schedule = expired and not _quote_refresh_running
+        if schedule:
+            _quote_refresh_running = True
+    if missing:
+        prefetch_quotes(missing)
+    if schedule:
+        fetch_pool.submit_background(_background_prefetch, list(symbols))
+
+
+def get_batched_quote(symbol: str) -> dict | None:
+    """
+    v7 quote for `symbol` from the batched store, or None. Expired quotes are
+    still returned for up to QUOTE_MAX_STALE seconds (refresh_quotes is
+    revalidating them).
+    """
+    with _lock:
+        entry = _quotes.get(symbol)
+    if entry is None or time.time() - entry[0] > QUOTE_MAX_STALE:
+        return None
+    return entry[1]
+
+
+def _fetch_price_to_sales(symbol: str) -> None:
+    try:
+        resp = get(SUMMARY_URL.format(symbol=symbol), params={"modules": "summaryDetail"},
+                   headers={"Referer": f"https://finance.yahoo.com/quote/{symbol}"})
+        if resp.status_code == 200:
+            result = resp.json().get("quoteSummary", {}).get("result") or []
+            summary = result[0].get("summaryDetail", {}) if result else {}
+            value = summary.get("priceToSalesTrailing12Months", {}).get("raw")
+            with _lock:
+                _price_to_sales[symbol] = (time.time(), value)
+    except Exception:
+        pass  # Not stored, so the next lookup retries
+    finally:
+        with _lock:
+            _price_to_sales_pending.discard(symbol)
+
+
+def get_price_to_sales(symbol: str) -> float | None:
+    """
+    Trailing P/S for `symbol` if it has been fetched, else None. Never blocks: a
+    missing or expired value is fetched from v10 on a background worker (one
+    fetch per symbol at a time) and is returned by a later call.
+    """
+    now = time.time()
+    with _lock:
+        entry = _price_to_sales.get(symbol)
+        schedule = (entry is None or now - entry[0] > PRICE_TO_SALES_TTL) and symbol not in _price_to_sales_pending
+        if schedule:
+            _price_to_sales_pending.add(symbol)
+    if schedule:
+        fetch_pool.submit_background(_fetch_price_to_sales, symbol)
+    return entry[1] if entry is not None else None